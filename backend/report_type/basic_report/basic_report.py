@@ -44,6 +44,9 @@ class BasicReport:
         )
 
     async def run(self):
-        await self.gpt_researcher.conduct_research()
-        report = await self.gpt_researcher.write_report()
+        try:
+            await self.gpt_researcher.conduct_research()
+            report = await self.gpt_researcher.write_report()
+        finally:
+            self.gpt_researcher.close()
         return report
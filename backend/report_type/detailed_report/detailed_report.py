@@ -3,6 +3,26 @@ from typing import List, Dict, Set, Optional, Any
 from fastapi import WebSocket
 
 from gpt_researcher import GPTResearcher
+from gpt_researcher.actions import reconcile_sections, stream_output
+from gpt_researcher.context import ResearchContext
+
+
+class HeldReportOutput:
+    """Passes output through to the websocket, except report text which is held back
+
+    Used for subtopics written concurrently, so their streamed reports don't interleave.
+    """
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+
+    async def send_json(self, data: Dict[str, Any]) -> None:
+        if data.get("type") == "report":
+            return
+        await self.websocket.send_json(data)
+
+    def __getattr__(self, name):
+        return getattr(self.websocket, name)
 
 
 class DetailedReport:
@@ -48,23 +68,27 @@ class DetailedReport:
             complement_source_urls=self.complement_source_urls
         )
         self.existing_headers: List[Dict] = []
-        self.global_context: List[str] = []
+        self.global_context = ResearchContext()
         self.global_written_sections: List[str] = []
         self.global_urls: Set[str] = set(
             self.source_urls) if self.source_urls else set()
 
     async def run(self) -> str:
-        await self._initial_research()
-        subtopics = await self._get_all_subtopics()
-        report_introduction = await self.gpt_researcher.write_introduction()
-        _, report_body = await self._generate_subtopic_reports(subtopics)
-        self.gpt_researcher.visited_urls.update(self.global_urls)
-        report = await self._construct_detailed_report(report_introduction, report_body)
+        try:
+            await self._initial_research()
+            subtopics = await self._get_all_subtopics()
+            report_introduction = await self.gpt_researcher.write_introduction()
+            _, report_body = await self._generate_subtopic_reports(subtopics)
+            self.gpt_researcher.visited_urls.update(self.global_urls)
+            report = await self._construct_detailed_report(report_introduction, report_body)
+        finally:
+            # The subtopic researchers share the main researcher's runtime
+            self.gpt_researcher.close()
         return report
 
     async def _initial_research(self) -> None:
         await self.gpt_researcher.conduct_research()
-        self.global_context = self.gpt_researcher.context
+        self.global_context = self.gpt_researcher.get_research_records()
         self.global_urls = self.gpt_researcher.visited_urls
 
     async def _get_all_subtopics(self) -> List[Dict]:
@@ -80,6 +104,10 @@ class DetailedReport:
         return all_subtopics
 
     async def _generate_subtopic_reports(self, subtopics: List[Dict]) -> tuple:
+        concurrency = self.gpt_researcher.cfg.subtopic_concurrency
+        if concurrency > 1 and len(subtopics) > 1:
+            return await self._generate_subtopic_reports_concurrently(subtopics, concurrency)
+
         subtopic_reports = []
         subtopics_report_body = ""
 
@@ -91,26 +119,57 @@ class DetailedReport:
 
         return subtopic_reports, subtopics_report_body
 
-    async def _get_subtopic_report(self, subtopic: Dict) -> Dict[str, str]:
+    async def _generate_subtopic_reports_concurrently(self, subtopics: List[Dict], concurrency: int) -> tuple:
+        """
+        Research and write subtopics concurrently.
+
+        Each subtopic is written with the headers and sections of the subtopics finished before
+        it, then sections repeated across subtopics are removed and the reports are streamed in
+        subtopic order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        websocket = HeldReportOutput(self.websocket) if self.websocket else None
+
+        async def run(subtopic: Dict) -> Dict[str, str]:
+            async with semaphore:
+                return await self._get_subtopic_report(subtopic, websocket=websocket)
+
+        results = [result for result in await asyncio.gather(*(run(subtopic) for subtopic in subtopics)) if result["report"]]
+        reports = reconcile_sections([result["report"] for result in results])
+
+        subtopic_reports = []
+        subtopics_report_body = ""
+        for result, report in zip(results, reports):
+            subtopic_reports.append({**result, "report": report})
+            subtopics_report_body += f"\n\n\n{report}"
+            if self.websocket:
+                await stream_output("report", "subtopic_report", f"\n\n\n{report}", self.websocket, False)
+
+        return subtopic_reports, subtopics_report_body
+
+    async def _get_subtopic_report(self, subtopic: Dict, websocket: Any = None) -> Dict[str, str]:
         current_subtopic_task = subtopic.get("task")
         subtopic_assistant = GPTResearcher(
             query=current_subtopic_task,
             query_domains=self.query_domains,
             report_type="subtopic_report",
             report_source=self.report_source,
-            websocket=self.websocket,
+            websocket=websocket or self.websocket,
             headers=self.headers,
             parent_query=self.query,
             subtopics=self.subtopics,
-            visited_urls=self.global_urls,
+            # A copy, the researcher clears it when it starts and concurrent subtopics would wipe
+            # each other's urls. Merged back below.
+            visited_urls=set(self.global_urls),
             agent=self.gpt_researcher.agent,
             role=self.gpt_researcher.role,
             tone=self.tone,
             complement_source_urls=self.complement_source_urls,
-            source_urls=self.source_urls
+            source_urls=self.source_urls,
+            runtime=self.gpt_researcher.runtime,
         )
 
-        subtopic_assistant.context = list(set(self.global_context))
         await subtopic_assistant.conduct_research()
 
         draft_section_titles = await subtopic_assistant.get_draft_section_titles(current_subtopic_task)
@@ -129,7 +188,9 @@ class DetailedReport:
         subtopic_report = await subtopic_assistant.write_report(self.existing_headers, relevant_contents)
 
         self.global_written_sections.extend(self.gpt_researcher.extract_sections(subtopic_report))
-        self.global_context = list(set(subtopic_assistant.context))
+        # Merge rather than replace, subtopics written concurrently each add their own context.
+        # The records are shared, not copied.
+        self.global_context.extend(subtopic_assistant.get_research_records())
         self.global_urls.update(subtopic_assistant.visited_urls)
 
         self.existing_headers.append({
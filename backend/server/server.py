@@ -20,6 +20,7 @@ from backend.server.server_utils import (
 from backend.server.websocket_manager import run_agent
 from backend.utils import write_md_to_word, write_md_to_pdf
 from gpt_researcher.utils.logging_config import setup_research_logging
+from gpt_researcher.utils.loop_monitor import LoopLagMonitor
 from gpt_researcher.utils.enum import Tone
 
 import logging
@@ -102,7 +103,22 @@ def startup_event():
     os.makedirs("outputs", exist_ok=True)
     app.mount("/outputs", StaticFiles(directory="outputs"), name="outputs")
     # os.makedirs(DOC_PATH, exist_ok=True)  # Commented out to avoid creating the folder if not needed
-    
+
+
+@app.on_event("startup")
+async def start_loop_lag_monitor():
+    # A blocked event loop stalls every websocket session, report stalls with their stack
+    threshold_ms = int(os.getenv("LOOP_LAG_THRESHOLD_MS", 0))
+    if threshold_ms > 0:
+        app.state.loop_lag_monitor = LoopLagMonitor(threshold=threshold_ms / 1000)
+        app.state.loop_lag_monitor.start()
+
+
+@app.on_event("shutdown")
+async def stop_loop_lag_monitor():
+    if monitor := getattr(app.state, "loop_lag_monitor", None):
+        await monitor.stop()
+
 
 # Routes
 
@@ -26,45 +26,48 @@ class CustomLogsHandler:
         sanitized_filename = sanitize_filename(f"task_{int(time.time())}_{task}")
         self.log_file = os.path.join("outputs", f"{sanitized_filename}.json")
         self.timestamp = datetime.now().isoformat()
+        self.log_data = {
+            "timestamp": self.timestamp,
+            "events": [],
+            "content": {
+                "query": "",
+                "sources": [],
+                "context": [],
+                "report": "",
+                "costs": 0.0
+            }
+        }
+        self._log_lock = asyncio.Lock()
         # Initialize log file with metadata
         os.makedirs("outputs", exist_ok=True)
+        self._write_log_file()
+
+    def _write_log_file(self) -> None:
         with open(self.log_file, 'w') as f:
-            json.dump({
-                "timestamp": self.timestamp,
-                "events": [],
-                "content": {
-                    "query": "",
-                    "sources": [],
-                    "context": [],
-                    "report": "",
-                    "costs": 0.0
-                }
-            }, f, indent=2)
+            json.dump(self.log_data, f, indent=2)
 
     async def send_json(self, data: Dict[str, Any]) -> None:
         """Store log data and send to websocket"""
         # Send to websocket for real-time display
         if self.websocket:
             await self.websocket.send_json(data)
-            
-        # Read current log file
-        with open(self.log_file, 'r') as f:
-            log_data = json.load(f)
-            
-        # Update appropriate section based on data type
-        if data.get('type') == 'logs':
-            log_data['events'].append({
-                "timestamp": datetime.now().isoformat(),
-                "type": "event",
-                "data": data
-            })
-        else:
-            # Update content section for other types of data
-            log_data['content'].update(data)
-            
-        # Save updated log file
-        with open(self.log_file, 'w') as f:
-            json.dump(log_data, f, indent=2)
+
+        # The log is kept in memory and the file rewritten in a worker thread, so logging
+        # never blocks the event loop. The lock keeps the log unchanged while it is written.
+        async with self._log_lock:
+            # Update appropriate section based on data type
+            if data.get('type') == 'logs':
+                self.log_data['events'].append({
+                    "timestamp": datetime.now().isoformat(),
+                    "type": "event",
+                    "data": data
+                })
+            else:
+                # Update content section for other types of data
+                self.log_data['content'].update(data)
+
+            # Save updated log file
+            await asyncio.to_thread(self._write_log_file)
         logger.debug(f"Log entry written to: {self.log_file}")
 
 
@@ -11,6 +11,7 @@ from gpt_researcher.utils.enum import ReportType, Tone
 from multi_agents.main import run_research_task
 from gpt_researcher.actions import stream_output  # Import stream_output
 from backend.server.server_utils import CustomLogsHandler
+from gpt_researcher.utils.output_channel import OutputChannel
 
 
 class WebSocketManager:
@@ -93,9 +94,24 @@ class WebSocketManager:
 
 async def run_agent(task, report_type, report_source, source_urls, document_urls, tone: Tone, websocket, stream_output=stream_output, headers=None, query_domains=[], config_path="", return_researcher=False):
     """Run the agent."""    
-    # Create logs handler for this research task
-    logs_handler = CustomLogsHandler(websocket, task)
+    # Create logs handler for this research task. Every message is logged, and the websocket is
+    # written through a channel that coalesces report chunks so a slow client doesn't hold up the research.
+    channel = OutputChannel(websocket) if websocket is not None else None
+    logs_handler = CustomLogsHandler(channel, task)
+    try:
+        report = await _run_agent(
+            task, report_type, report_source, source_urls, document_urls, tone, logs_handler,
+            stream_output=stream_output, headers=headers, query_domains=query_domains,
+            config_path=config_path, return_researcher=return_researcher,
+        )
+    finally:
+        if channel is not None:
+            await channel.close()
+    return report
+
 
+async def _run_agent(task, report_type, report_source, source_urls, document_urls, tone: Tone, logs_handler, stream_output=stream_output, headers=None, query_domains=[], config_path="", return_researcher=False):
+    """Run the agent, writing its output to the given logs handler."""
     # Initialize researcher based on report type
     if report_type == "multi_agents":
         report = await run_research_task(
@@ -1,3 +1,4 @@
 from .agent import GPTResearcher
+from .runtime import ResearchRuntime
 
-__all__ = ['GPTResearcher']
\ No newline at end of file
+__all__ = ['GPTResearcher', 'ResearchRuntime']
\ No newline at end of file
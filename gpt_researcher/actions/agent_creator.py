@@ -2,6 +2,8 @@ import json
 import re
 import json_repair
 from ..utils.llm import create_chat_completion
+from ..utils.llm_cache import get_llm_cache
+from ..utils.rate_limiter import get_rate_limits
 from ..prompts import PromptFamily
 
 async def choose_agent(
@@ -38,6 +40,8 @@ async def choose_agent(
             ],
             temperature=0.15,
             llm_provider=cfg.smart_llm_provider,
+            cache=get_llm_cache(cfg),
+            rate_limits=get_rate_limits(cfg),
             llm_kwargs=cfg.llm_kwargs,
             cost_callback=cost_callback,
         )
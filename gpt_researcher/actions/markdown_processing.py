@@ -2,6 +2,9 @@ import re
 import markdown
 from typing import List, Dict
 
+from ..context.packer import deduplicate_chunks
+from ..utils.urls import unique_urls
+
 def extract_headers(markdown_text: str) -> List[Dict]:
     """
     Extract headers from markdown text.
@@ -97,16 +100,73 @@ def add_references(report_markdown: str, visited_urls: set) -> str:
 
     Args:
         report_markdown (str): The existing markdown report.
-        visited_urls (set): A set of URLs that have been visited during research.
+        visited_urls (set): A set of URLs that have been visited during research. URLs of the
+            same page are listed once.
 
     Returns:
         str: The updated markdown report with added references.
     """
     try:
         url_markdown = "\n\n\n## References\n\n"
-        url_markdown += "".join(f"- [{url}]({url})\n" for url in visited_urls)
+        url_markdown += "".join(f"- [{url}]({url})\n" for url in unique_urls(visited_urls))
         updated_markdown_report = report_markdown + url_markdown
         return updated_markdown_report
     except Exception as e:
         print(f"Encountered exception in adding source urls : {e}")
-        return report_markdown
\ No newline at end of file
+        return report_markdown
+
+
+def _normalize_header(header: str) -> str:
+    return " ".join(re.findall(r"\w+", header.lower()))
+
+
+def reconcile_sections(reports: List[str], threshold: float = 0.8) -> List[str]:
+    """
+    Remove repeated sections from subtopic reports that were written concurrently.
+
+    Each report is split at its level 3 headers. A section whose content nearly repeats an
+    earlier section is dropped, and a header that repeats an earlier one with new content is
+    qualified with the title of its report.
+
+    Args:
+        reports (List[str]): Subtopic reports, in the order they appear in the final report.
+        threshold (float): Shingle similarity from which two sections are duplicates.
+
+    Returns:
+        List[str]: The reconciled reports.
+    """
+    split_reports = []
+    chunks = []
+    for report in reports:
+        preamble, sections = [], []
+        for line in report.splitlines(keepends=True):
+            if line.startswith("### "):
+                sections.append({"header": line[4:].strip(), "lines": []})
+            elif sections:
+                sections[-1]["lines"].append(line)
+            else:
+                preamble.append(line)
+        title = next((line[3:].strip() for line in preamble if line.startswith("## ")), "")
+        for section in sections:
+            section["content"] = "".join(section["lines"]).strip()
+            if section["content"]:
+                chunks.append(section)
+        split_reports.append((preamble, title, sections))
+
+    kept = {id(section) for section in deduplicate_chunks(chunks, threshold)}
+    seen_headers = set()
+    reconciled = []
+    for preamble, title, sections in split_reports:
+        lines = list(preamble)
+        for section in sections:
+            if section["content"] and id(section) not in kept:
+                continue
+            header = section["header"]
+            normalized = _normalize_header(header)
+            if normalized in seen_headers and title:
+                header = f"{header} ({title})"
+            seen_headers.add(normalized)
+            lines.append(f"### {header}\n")
+            lines.extend(section["lines"])
+        reconciled.append("".join(lines))
+    return reconciled
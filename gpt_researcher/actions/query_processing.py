@@ -1,7 +1,11 @@
 import json_repair
 
 from gpt_researcher.llm_provider.generic.base import ReasoningEfforts
+from ..utils.hedging import hedge_delay, hedged
 from ..utils.llm import create_chat_completion
+from ..utils.llm_cache import get_llm_cache
+from ..utils.rate_limiter import get_rate_limits
+from .retriever import search_async
 from ..prompts import PromptFamily
 from typing import Any, List, Dict
 from ..config import Config
@@ -21,7 +25,7 @@ async def get_search_results(query: str, retriever: Any, query_domains: List[str
         A list of search results
     """
     search_retriever = retriever(query, query_domains=query_domains)
-    return search_retriever.search()
+    return await search_async(search_retriever)
 
 async def generate_sub_queries(
     query: str,
@@ -56,12 +60,17 @@ async def generate_sub_queries(
         context=context,
     )
 
+    if cfg.llm_hedging:
+        return await _generate_sub_queries_hedged(gen_queries_prompt, cfg, cost_callback)
+
     try:
         response = await create_chat_completion(
             model=cfg.strategic_llm_model,
             messages=[{"role": "user", "content": gen_queries_prompt}],
             temperature=0.6,
             llm_provider=cfg.strategic_llm_provider,
+            cache=get_llm_cache(cfg),
+            rate_limits=get_rate_limits(cfg),
             max_tokens=None,
             llm_kwargs=cfg.llm_kwargs,
             reasoning_effort=ReasoningEfforts.High.value,
@@ -76,6 +85,8 @@ async def generate_sub_queries(
                 messages=[{"role": "user", "content": gen_queries_prompt}],
                 temperature=1,
                 llm_provider=cfg.strategic_llm_provider,
+                cache=get_llm_cache(cfg),
+                rate_limits=get_rate_limits(cfg),
                 max_tokens=cfg.strategic_token_limit,
                 llm_kwargs=cfg.llm_kwargs,
                 cost_callback=cost_callback,
@@ -90,12 +101,76 @@ async def generate_sub_queries(
                 temperature=cfg.temperature,
                 max_tokens=cfg.smart_token_limit,
                 llm_provider=cfg.smart_llm_provider,
+                cache=get_llm_cache(cfg),
+                rate_limits=get_rate_limits(cfg),
                 llm_kwargs=cfg.llm_kwargs,
                 cost_callback=cost_callback,
             )
 
     return json_repair.loads(response)
 
+async def _generate_sub_queries_hedged(prompt: str, cfg: Config, cost_callback: callable = None) -> List[str]:
+    """
+    Generate sub-queries with the strategic LLM, hedged with the smart LLM.
+
+    The strategic LLM is asked again with temperature 1 and the strategic token limit if its first
+    answer fails, like in `generate_sub_queries`. If both fail, or the strategic LLM hasn't answered
+    within its usual latency (the configured percentile of its recent calls), the same prompt is
+    also sent to the smart LLM. The first parsable list of sub-queries wins and the other request
+    is cancelled. The cost of both requests is recorded. Strategic answers served from the LLM
+    response cache do not count towards its latency.
+    """
+    messages = [{"role": "user", "content": prompt}]
+    cache_hits = []
+
+    async def ask(**kwargs) -> List[str]:
+        response = await create_chat_completion(
+            messages=messages,
+            llm_kwargs=cfg.llm_kwargs,
+            cost_callback=cost_callback,
+            cache=get_llm_cache(cfg),
+            rate_limits=get_rate_limits(cfg),
+            **kwargs,
+        )
+        sub_queries = json_repair.loads(response)
+        if not sub_queries or not isinstance(sub_queries, list):
+            raise ValueError(f"Invalid sub-queries: {response}")
+        return sub_queries
+
+    async def ask_strategic() -> List[str]:
+        try:
+            return await ask(
+                model=cfg.strategic_llm_model,
+                llm_provider=cfg.strategic_llm_provider,
+                temperature=0.6,
+                max_tokens=None,
+                reasoning_effort=ReasoningEfforts.High.value,
+                cache_hit_callback=lambda: cache_hits.append(True),
+            )
+        except Exception as e:
+            logger.warning(f"Error with strategic LLM: {e}. Retrying with max_tokens={cfg.strategic_token_limit}.")
+            return await ask(
+                model=cfg.strategic_llm_model,
+                llm_provider=cfg.strategic_llm_provider,
+                temperature=1,
+                max_tokens=cfg.strategic_token_limit,
+                cache_hit_callback=lambda: cache_hits.append(True),
+            )
+
+    latency_key = (cfg.strategic_llm_provider, cfg.strategic_llm_model)
+    return await hedged(
+        ask_strategic,
+        lambda: ask(
+            model=cfg.smart_llm_model,
+            llm_provider=cfg.smart_llm_provider,
+            temperature=cfg.temperature,
+            max_tokens=cfg.smart_token_limit,
+        ),
+        delay=hedge_delay(latency_key, cfg.llm_hedge_percentile, cfg.llm_hedge_delay),
+        latency_key=latency_key,
+        record_latency=lambda: not cache_hits,
+    )
+
 async def plan_research_outline(
     query: str,
     search_results: List[Dict[str, Any]],
@@ -2,6 +2,8 @@ import asyncio
 from typing import List, Dict, Any
 from ..config.config import Config
 from ..utils.llm import create_chat_completion
+from ..utils.llm_cache import get_llm_cache
+from ..utils.rate_limiter import get_rate_limits
 from ..utils.logger import get_formatted_logger
 from ..prompts import PromptFamily, get_prompt_by_report_type
 from ..utils.enum import Tone
@@ -46,6 +48,8 @@ async def write_report_introduction(
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
+            cache=get_llm_cache(config),
+            rate_limits=get_rate_limits(config),
             stream=True,
             websocket=websocket,
             max_tokens=config.smart_token_limit,
@@ -96,6 +100,8 @@ async def write_conclusion(
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
+            cache=get_llm_cache(config),
+            rate_limits=get_rate_limits(config),
             stream=True,
             websocket=websocket,
             max_tokens=config.smart_token_limit,
@@ -139,6 +145,8 @@ async def summarize_url(
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
+            cache=get_llm_cache(config),
+            rate_limits=get_rate_limits(config),
             stream=True,
             websocket=websocket,
             max_tokens=config.smart_token_limit,
@@ -186,6 +194,8 @@ async def generate_draft_section_titles(
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
+            cache=get_llm_cache(config),
+            rate_limits=get_rate_limits(config),
             stream=True,
             websocket=None,
             max_tokens=config.smart_token_limit,
@@ -253,6 +263,8 @@ async def generate_report(
             ],
             temperature=0.35,
             llm_provider=cfg.smart_llm_provider,
+            cache=get_llm_cache(cfg),
+            rate_limits=get_rate_limits(cfg),
             stream=True,
             websocket=websocket,
             max_tokens=cfg.smart_token_limit,
@@ -268,6 +280,8 @@ async def generate_report(
                 ],
                 temperature=0.35,
                 llm_provider=cfg.smart_llm_provider,
+                cache=get_llm_cache(cfg),
+                rate_limits=get_rate_limits(cfg),
                 stream=True,
                 websocket=websocket,
                 max_tokens=cfg.smart_token_limit,
@@ -1,4 +1,18 @@
+import asyncio
+import copy
+import inspect
+import json
+import logging
+import os
+import re
+import threading
+from typing import Any
+
 from ..config.config import Config
+from ..utils.cache import TieredCache, get_shared_cache, hash_key
+from ..utils.urls import canonicalize_url
+
+logger = logging.getLogger(__name__)
 
 def get_retriever(retriever: str):
     """
@@ -97,10 +111,199 @@ def get_retrievers(headers: dict[str, str], cfg: Config):
 
     # Convert retriever names to actual retriever classes
     # Use get_default_retriever() as a fallback for any invalid retriever names
-    return [get_retriever(r) or get_default_retriever() for r in retrievers]
+    retriever_classes = [get_retriever(r) or get_default_retriever() for r in retrievers]
+
+    if getattr(cfg, "search_cache", False):
+        cache = get_search_cache(cfg.cache_dir, ttl=cfg.search_cache_ttl)
+        retriever_classes = [with_search_cache(r, cache) for r in retriever_classes]
+    return retriever_classes
 
 
 def get_default_retriever():
     from gpt_researcher.retrievers import TavilySearch
 
-    return TavilySearch
\ No newline at end of file
+    return TavilySearch
+
+
+def normalize_query(query: str) -> str:
+    """Normalise a search query so that trivially different spellings share a cache entry."""
+    return re.sub(r"\s+", " ", query or "").strip().lower()
+
+
+def get_search_cache(cache_dir: str | None, ttl: float | None = 86400, max_size: int = 1024) -> TieredCache:
+    """
+    Get the process-wide search result cache.
+
+    Args:
+        cache_dir: Directory for the persistent SQLite tier. If empty, results are only cached in memory.
+        ttl: Number of seconds search results are reused.
+        max_size: Number of searches kept in the in-memory LRU tier.
+
+    Returns:
+        TieredCache: The shared search cache.
+    """
+    path = os.path.join(cache_dir, "search.sqlite") if cache_dir else None
+    return get_shared_cache(path, table="search", max_size=max_size, ttl=ttl)
+
+
+def _retriever_state(retriever: Any, query: str, query_domains: Any) -> str:
+    """The JSON serialisable instance attributes of a retriever, other than its query and domains."""
+    state = {}
+    for name, value in vars(retriever).items():
+        # The query and domains are part of the key in their normalised form
+        if name.startswith("_search_cache") or value == query or (query_domains and value == query_domains):
+            continue
+        try:
+            state[name] = json.dumps(value, sort_keys=True)
+        except (TypeError, ValueError):
+            # Clients, sessions and the like don't change the results
+            continue
+    return json.dumps(state, sort_keys=True)
+
+
+_cached_retrievers: dict[tuple[type, int], type] = {}
+_cached_retrievers_lock = threading.Lock()
+
+
+def with_search_cache(retriever_class: type, cache: TieredCache) -> type:
+    """
+    Wrap a retriever class so its searches go through a search cache.
+
+    Results are keyed by (retriever, configuration, normalised query, domains, max_results), so
+    repeated searches within a run (planning, sub-queries, overlapping subtopics) and across runs
+    are only sent to the search API once. The configuration is the retriever's plain instance
+    attributes (e.g. Tavily's `topic` or settings read from the headers), so differently
+    configured retrievers don't share results. Empty results are never cached.
+
+    Args:
+        retriever_class: The retriever class to wrap.
+        cache: The cache to store results in.
+
+    Returns:
+        type: A subclass of the retriever with the same name.
+    """
+    with _cached_retrievers_lock:
+        key = (retriever_class, id(cache))
+        if key in _cached_retrievers:
+            return _cached_retrievers[key]
+
+        search_signature = inspect.signature(retriever_class.search)
+
+        def __init__(self, query, *args, **kwargs):
+            self._search_cache_query = query
+            self._search_cache_domains = sorted(kwargs.get("query_domains") or [])
+            retriever_class.__init__(self, query, *args, **kwargs)
+            self._search_cache_state = _retriever_state(self, query, kwargs.get("query_domains"))
+
+        def cache_key(self, args, kwargs):
+            # Both search methods share their arguments, so the sync signature resolves the defaults
+            arguments = search_signature.bind(self, *args, **kwargs)
+            arguments.apply_defaults()
+            return hash_key(
+                retriever_class.__name__,
+                self._search_cache_state,
+                normalize_query(self._search_cache_query),
+                ",".join(self._search_cache_domains),
+                arguments.arguments.get("max_results"),
+            )
+
+        def lookup(self, key):
+            results = cache.get(key)
+            if results is None:
+                return None
+            logger.info(f"Search cache hit for {retriever_class.__name__}: {self._search_cache_query}")
+            # Callers may modify the results, the cached copy must stay intact
+            return copy.deepcopy(results)
+
+        def store(self, key, results):
+            if results:
+                try:
+                    cache.set(key, results)
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Could not cache search results of {retriever_class.__name__}: {e}")
+
+        def search(self, *args, **kwargs):
+            key = cache_key(self, args, kwargs)
+            results = lookup(self, key)
+            if results is None:
+                results = retriever_class.search(self, *args, **kwargs)
+                store(self, key, results)
+            return results
+
+        async def asearch(self, *args, **kwargs):
+            key = cache_key(self, args, kwargs)
+            results = await asyncio.to_thread(lookup, self, key)
+            if results is None:
+                if hasattr(retriever_class, "asearch"):
+                    results = await retriever_class.asearch(self, *args, **kwargs)
+                else:
+                    results = await asyncio.to_thread(retriever_class.search, self, *args, **kwargs)
+                await asyncio.to_thread(store, self, key, results)
+            return results
+
+        cached_class = type(
+            retriever_class.__name__,
+            (retriever_class,),
+            {"__init__": __init__, "search": search, "asearch": asearch, "__module__": retriever_class.__module__},
+        )
+        _cached_retrievers[key] = cached_class
+        return cached_class
+
+
+async def search_async(retriever, **kwargs) -> list[dict]:
+    """
+    Run a retriever's search without blocking the event loop.
+
+    Uses the retriever's native `asearch` when it has one, and runs the blocking `search` in a
+    worker thread otherwise (e.g. for user provided retrievers).
+    """
+    if hasattr(retriever, "asearch"):
+        return await retriever.asearch(**kwargs)
+    return await asyncio.to_thread(retriever.search, **kwargs)
+
+
+async def search_all(
+    retriever_classes: list[type],
+    query: str,
+    query_domains: list[str] | None = None,
+    timeout: float | None = None,
+    **kwargs,
+) -> list[dict]:
+    """
+    Search a query with every retriever concurrently and merge their results.
+
+    A retriever that fails or exceeds its timeout is logged and skipped, so the search takes as
+    long as the slowest successful retriever rather than the sum of all of them. Results are
+    merged in retriever order and de-duplicated by canonical url.
+
+    Args:
+        retriever_classes: The retriever classes to search with.
+        query: The search query.
+        query_domains: Domains to restrict the search to.
+        timeout: Seconds each retriever may take. None means no limit.
+        **kwargs: Passed to every retriever's search, e.g. `max_results`.
+
+    Returns:
+        list[dict]: The merged search results.
+    """
+
+    async def run(retriever_class):
+        retriever = retriever_class(query, query_domains=query_domains)
+        return await asyncio.wait_for(search_async(retriever, **kwargs), timeout)
+
+    responses = await asyncio.gather(*[run(r) for r in retriever_classes], return_exceptions=True)
+
+    merged, seen = [], set()
+    for retriever_class, results in zip(retriever_classes, responses):
+        if isinstance(results, BaseException):
+            reason = "timed out" if isinstance(results, asyncio.TimeoutError) else f"failed: {results}"
+            logger.warning(f"{retriever_class.__name__} search {reason}")
+            continue
+        for result in results or []:
+            href = result.get("href")
+            key = canonicalize_url(href) if href else href
+            if key and key in seen:
+                continue
+            seen.add(key)
+            merged.append(result)
+    return merged
@@ -1,8 +1,9 @@
-from typing import Any
+from typing import Any, AsyncIterator
 from colorama import Fore, Style
 
 from gpt_researcher.utils.workers import WorkerPool
 from ..scraper import Scraper
+from ..scraper.cache import ScrapeCache
 from ..config.config import Config
 from ..utils.logger import get_formatted_logger
 
@@ -24,14 +25,9 @@ async def scrape_urls(
     """
     scraped_data = []
     images = []
-    user_agent = (
-        cfg.user_agent
-        if cfg
-        else "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36"
-    )
 
     try:
-        scraper = Scraper(urls, user_agent, cfg.scraper, worker_pool=worker_pool)
+        scraper = _get_scraper(urls, cfg, worker_pool)
         scraped_data = await scraper.run()
         for item in scraped_data:
             if 'image_urls' in item:
@@ -42,6 +38,34 @@ async def scrape_urls(
     return scraped_data, images
 
 
+async def stream_urls(urls, cfg: Config, worker_pool: WorkerPool) -> AsyncIterator[dict[str, Any]]:
+    """
+    Scrapes the urls, yielding every page as soon as it is scraped
+    Args:
+        urls: List of urls
+        cfg: Config
+
+    Yields:
+        dict[str, Any]: A scraped page, including its `image_urls`
+
+    """
+    try:
+        async for page in _get_scraper(urls, cfg, worker_pool).stream():
+            yield page
+    except Exception as e:
+        print(f"{Fore.RED}Error in stream_urls: {e}{Style.RESET_ALL}")
+
+
+def _get_scraper(urls, cfg: Config, worker_pool: WorkerPool) -> Scraper:
+    user_agent = (
+        cfg.user_agent
+        if cfg
+        else "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36"
+    )
+    cache = ScrapeCache(cfg.cache_dir, ttl=cfg.scraper_cache_ttl) if cfg.scraper_cache else None
+    return Scraper(urls, user_agent, cfg.scraper, worker_pool=worker_pool, cache=cache)
+
+
 async def filter_urls(urls: list[str], config: Config) -> list[str]:
     """
     Filter URLs based on configuration settings.
@@ -1,8 +1,8 @@
 from typing import Any, Optional
 import json
 
-from .config import Config
-from .memory import Memory
+from .context import ResearchContext
+from .runtime import ResearchRuntime
 from .utils.enum import ReportSource, ReportType, Tone
 from .llm_provider import GenericLLMProvider
 from .prompts import get_prompt_family
@@ -22,7 +22,6 @@ from .actions import (
     extract_sections,
     table_of_contents,
     get_search_results,
-    get_retrievers,
     choose_agent
 )
 
@@ -55,10 +54,15 @@ class GPTResearcher:
         max_subtopics: int = 5,
         log_handler=None,
         prompt_family: str | None = None,
+        runtime: ResearchRuntime | None = None,
     ):
         self.query = query
         self.report_type = report_type
-        self.cfg = Config(config_path)
+        # Researchers spawned by this one share its runtime (config, embeddings, retrievers, scraper pool).
+        # A researcher only closes the runtime it created.
+        self.runtime = runtime or ResearchRuntime(config_path)
+        self._owns_runtime = runtime is None
+        self.cfg = self.runtime.config()
         self.llm = GenericLLMProvider(self.cfg)
         self.report_source = report_source if report_source else getattr(self.cfg, 'report_source', None)
         self.report_format = report_format
@@ -83,10 +87,8 @@ class GPTResearcher:
         self.context = context or []
         self.headers = headers or {}
         self.research_costs = 0.0
-        self.retrievers = get_retrievers(self.headers, self.cfg)
-        self.memory = Memory(
-            self.cfg.embedding_provider, self.cfg.embedding_model, **self.cfg.embedding_kwargs
-        )
+        self.retrievers = self.runtime.get_retrievers(self.headers)
+        self.memory = self.runtime.memory
         self.log_handler = log_handler
         self.prompt_family = get_prompt_family(prompt_family or self.cfg.prompt_family, self.cfg)
 
@@ -100,6 +102,17 @@ class GPTResearcher:
         if report_type == ReportType.DeepResearch.value:
             self.deep_researcher = DeepResearchSkill(self)
 
+    async def __aenter__(self) -> "GPTResearcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the runtime's scraper threads if this researcher created the runtime."""
+        if self._owns_runtime:
+            self.runtime.close()
+
     async def _log_event(self, event_type: str, **kwargs):
         """Helper method to handle logging events"""
         if self.log_handler:
@@ -153,10 +166,11 @@ class GPTResearcher:
         })
         self.context = await self.research_conductor.conduct_research()
 
+        research_context = self.get_research_context()
         await self._log_event("research", step="research_completed", details={
-            "context_length": len(self.context)
+            "context_length": len(research_context)
         })
-        return self.context
+        return research_context
 
     async def _handle_deep_research(self, on_progress=None):
         """Handle deep research execution and logging."""
@@ -184,7 +198,7 @@ class GPTResearcher:
 
         # Log deep research completion with costs
         await self._log_event("research", step="deep_research_complete", details={
-            "context_length": len(self.context),
+            "context_length": len(self.get_research_context()),
             "visited_urls": len(self.visited_urls),
             "total_costs": total_costs
         })
@@ -197,7 +211,7 @@ class GPTResearcher:
         })
 
         # Return the research context
-        return self.context
+        return self.get_research_context()
 
     async def write_report(self, existing_headers: list = [], relevant_written_contents: list = [], ext_context=None, custom_prompt="") -> str:
         await self._log_event("research", step="writing_report", details={
@@ -280,9 +294,16 @@ class GPTResearcher:
     def get_source_urls(self) -> list:
         return list(self.visited_urls)
 
-    def get_research_context(self) -> list:
+    def get_research_context(self) -> list | str:
+        """The context gathered by the research, rendered as it is passed to the LLM."""
+        if isinstance(self.context, ResearchContext):
+            return self.context.render(self.prompt_family)
         return self.context
 
+    def get_research_records(self) -> ResearchContext:
+        """The chunks gathered by the research, with their source, title, score and offset in the page."""
+        return ResearchContext.of(self.context, self.prompt_family)
+
     def get_costs(self) -> float:
         return self.research_costs
 
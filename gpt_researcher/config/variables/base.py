@@ -17,6 +17,19 @@ class BaseConfig(TypedDict):
     TEMPERATURE: float
     USER_AGENT: str
     MAX_SEARCH_RESULTS_PER_QUERY: int
+    RETRIEVER_TIMEOUT: int
+    CONTEXT_TOKEN_BUDGET: int
+    CONTEXT_CHUNK_BUDGET: int
+    CONTEXT_MMR_LAMBDA: float
+    LLM_CACHE: bool
+    LLM_CACHE_TTL: int
+    LLM_CACHE_SIMILARITY: float
+    LLM_HEDGING: bool
+    LLM_HEDGE_PERCENTILE: float
+    LLM_HEDGE_DELAY: float
+    LLM_MAX_REQUESTS_PER_MINUTE: int
+    LLM_MAX_TOKENS_PER_MINUTE: int
+    LLM_MAX_RETRIES: int
     MEMORY_BACKEND: str
     TOTAL_WORDS: int
     REPORT_FORMAT: str
@@ -26,7 +39,9 @@ class BaseConfig(TypedDict):
     AGENT_ROLE: Union[str, None]
     SCRAPER: str
     MAX_SCRAPER_WORKERS: int
+    SCRAPER_PROCESS_WORKERS: int
     MAX_SUBTOPICS: int
+    SUBTOPIC_CONCURRENCY: int
     REPORT_SOURCE: Union[str, None]
     DOC_PATH: str
     PROMPT_FAMILY: str
@@ -35,3 +50,15 @@ class BaseConfig(TypedDict):
     DEEP_RESEARCH_CONCURRENCY: int
     DEEP_RESEARCH_DEPTH: int
     DEEP_RESEARCH_BREADTH: int
+    DEEP_RESEARCH_PRIORITY: str
+    CHUNK_STORE: bool
+    NEAR_DUPLICATE_THRESHOLD: float
+    SCRAPE_EARLY_STOP_PATIENCE: int
+    CACHE_DIR: Union[str, None]
+    EMBEDDING_CACHE: bool
+    EMBEDDING_CACHE_SIZE: int
+    EMBEDDING_BATCH_WAIT_MS: float
+    SCRAPER_CACHE: bool
+    SCRAPER_CACHE_TTL: int
+    SEARCH_CACHE: bool
+    SEARCH_CACHE_TTL: int
@@ -23,7 +23,9 @@ DEFAULT_CONFIG: BaseConfig = {
     "AGENT_ROLE": None,
     "SCRAPER": "bs",
     "MAX_SCRAPER_WORKERS": 15,
+    "SCRAPER_PROCESS_WORKERS": 0,
     "MAX_SUBTOPICS": 3,
+    "SUBTOPIC_CONCURRENCY": 1,
     "LANGUAGE": "english",
     "REPORT_SOURCE": "web",
     "DOC_PATH": "./my-docs",
@@ -34,4 +36,30 @@ DEFAULT_CONFIG: BaseConfig = {
     "DEEP_RESEARCH_BREADTH": 3,
     "DEEP_RESEARCH_DEPTH": 2,
     "DEEP_RESEARCH_CONCURRENCY": 4,
+    "DEEP_RESEARCH_PRIORITY": "depth",
+    "CHUNK_STORE": True,  # Embed every scraped page once per run and score all sub-queries against it
+    "NEAR_DUPLICATE_THRESHOLD": 0,  # Shingle Jaccard similarity from which pages and chunks are dropped as near-duplicates, e.g. 0.8. 0 disables it.
+    "SCRAPE_EARLY_STOP_PATIENCE": 0,
+    # Caching settings
+    "CACHE_DIR": "./.gptr_cache",  # Persistent cache tiers live here. Set to None for memory-only caches.
+    "EMBEDDING_CACHE": False,
+    "EMBEDDING_CACHE_SIZE": 10000,
+    "EMBEDDING_BATCH_WAIT_MS": 5,
+    "SCRAPER_CACHE": False,
+    "SCRAPER_CACHE_TTL": 86400,  # Seconds a scraped page is reused before it is revalidated
+    "SEARCH_CACHE": False,
+    "SEARCH_CACHE_TTL": 86400,
+    "RETRIEVER_TIMEOUT": 30,
+    "CONTEXT_TOKEN_BUDGET": 0,  # Tokens of research context in report prompts. 0 passes the whole context.
+    "CONTEXT_CHUNK_BUDGET": 0,  # Chunks kept when merging the sub-queries' context. 0 keeps every unique chunk.
+    "CONTEXT_MMR_LAMBDA": 0.7,
+    "LLM_CACHE": False,
+    "LLM_CACHE_TTL": 86400,
+    "LLM_CACHE_SIMILARITY": 0,  # Cosine similarity a near-duplicate prompt needs to reuse a response. 0 disables it.
+    "LLM_HEDGING": False,
+    "LLM_HEDGE_PERCENTILE": 90,
+    "LLM_HEDGE_DELAY": 15,  # Seconds to wait before hedging until the strategic LLM has enough latency samples
+    "LLM_MAX_REQUESTS_PER_MINUTE": 0,  # Per provider and model. 0 is unlimited.
+    "LLM_MAX_TOKENS_PER_MINUTE": 0,  # Per provider and model. 0 is unlimited.
+    "LLM_MAX_RETRIES": 5,
 }
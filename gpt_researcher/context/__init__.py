@@ -1,4 +1,6 @@
 from .compression import ContextCompressor
 from .retriever import SearchAPIRetriever
+from .chunk_store import ChunkStore
+from .records import ChunkRecord, ResearchContext
 
-__all__ = ['ContextCompressor', 'SearchAPIRetriever']
+__all__ = ['ContextCompressor', 'SearchAPIRetriever', 'ChunkStore', 'ChunkRecord', 'ResearchContext']
@@ -0,0 +1,227 @@
+import asyncio
+import hashlib
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+from langchain.schema import Document
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from .dedup import NearDuplicateIndex
+from .selection import mmr_select
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from ..utils.costs import aestimate_embedding_cost
+
+
+class ChunkStore:
+    """
+    Per-run store of embedded page chunks.
+
+    Every unique page is split and embedded exactly once, and its chunk vectors are appended
+    to a single normalised matrix. Any number of queries can then be scored against all chunks
+    with one matrix product, instead of building a LangChain compression pipeline (and
+    re-embedding the same pages) for every sub-query.
+
+    With a `near_duplicate_threshold`, chunks that nearly duplicate a chunk already in the store
+    are dropped before they are embedded. The source of a dropped chunk is recorded on the kept
+    chunk, so queries restricted to the dropped chunk's page still find its content.
+    """
+
+    def __init__(
+        self, embeddings, chunk_size: int = 1000, chunk_overlap: int = 100, near_duplicate_threshold: float = 0
+    ):
+        self.embeddings = embeddings
+        self.splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size, chunk_overlap=chunk_overlap, add_start_index=True
+        )
+        self.near_duplicates = NearDuplicateIndex(near_duplicate_threshold) if near_duplicate_threshold else None
+        self.documents: List[Document] = []
+        self._sources: List[str] = []
+        self._blocks: List[np.ndarray] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._pages: Dict[str, asyncio.Future] = {}
+        self._query_vectors: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    @property
+    def dropped_chunks(self) -> int:
+        """Number of near-duplicate chunks that were not embedded."""
+        return self.near_duplicates.dropped if self.near_duplicates is not None else 0
+
+    @staticmethod
+    def page_key(page: Dict[str, Any]) -> str:
+        """Identify a page by its url and content, as local documents can share a url across pages."""
+        content = page.get("raw_content") or ""
+        digest = hashlib.sha1(content.encode("utf-8", errors="ignore")).hexdigest()
+        return f"{page.get('url', '')}#{digest}"
+
+    @property
+    def matrix(self) -> np.ndarray:
+        if self._matrix is None:
+            self._matrix = np.vstack(self._blocks) if self._blocks else np.zeros((0, 0), dtype=np.float32)
+            self._blocks = [self._matrix] if self._blocks else []
+        return self._matrix
+
+    def _split(self, pages: Sequence[Dict[str, Any]]) -> List[Document]:
+        documents = [
+            Document(
+                page_content=page.get("raw_content", ""),
+                metadata={"title": page.get("title", ""), "source": page.get("url", "")},
+            )
+            for page in pages
+        ]
+        chunks = self.splitter.split_documents(documents)
+        if self.near_duplicates is None:
+            return chunks
+
+        unique = []
+        for chunk in chunks:
+            duplicate = self.near_duplicates.add(chunk, chunk.page_content)
+            if duplicate is None:
+                unique.append(chunk)
+            elif duplicate.metadata["source"] != chunk.metadata["source"]:
+                duplicate.metadata.setdefault("duplicate_sources", set()).add(chunk.metadata["source"])
+        return unique
+
+    async def add_pages(self, pages: Sequence[Dict[str, Any]], cost_callback: Callable | None = None) -> List[Document]:
+        """
+        Split and embed the pages that are not in the store yet.
+
+        Pages already being embedded by a concurrent call are awaited rather than embedded twice.
+
+        Args:
+            pages: Scraped pages with `url`, `raw_content` and `title` keys.
+            cost_callback: Receives the embedding cost of the newly embedded chunks.
+
+        Returns:
+            List[Document]: The newly added chunks.
+        """
+        loop = asyncio.get_running_loop()
+        new_pages, pending = [], []
+        for page in pages:
+            if not page.get("raw_content"):
+                continue
+            key = self.page_key(page)
+            if key in self._pages:
+                if not self._pages[key].done():
+                    pending.append(self._pages[key])
+                continue
+            self._pages[key] = loop.create_future()
+            new_pages.append((key, page))
+
+        chunks: List[Document] = []
+        try:
+            if new_pages:
+                chunks = await asyncio.to_thread(self._split, [page for _, page in new_pages])
+            if chunks:
+                texts = [chunk.page_content for chunk in chunks]
+                if cost_callback:
+                    cost_callback(await aestimate_embedding_cost(OPENAI_EMBEDDING_MODEL, texts))
+                vectors = np.asarray(await self.embeddings.aembed_documents(texts), dtype=np.float32)
+                norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+                vectors /= np.where(norms == 0, 1, norms)
+                for chunk in chunks:
+                    chunk.metadata["chunk_id"] = len(self.documents)
+                    self.documents.append(chunk)
+                    self._sources.append(chunk.metadata["source"])
+                self._blocks.append(vectors)
+                self._matrix = None
+        except BaseException:
+            # Forget the pages so a later call can retry them
+            for key, _ in new_pages:
+                self._pages.pop(key).set_result(False)
+            raise
+        for key, _ in new_pages:
+            self._pages[key].set_result(True)
+
+        if pending:
+            await asyncio.gather(*pending)
+        return chunks
+
+    async def _embed_queries(self, queries: Sequence[str]) -> np.ndarray:
+        """Embed and normalise queries, reusing the vectors of queries scored before in this run."""
+        missing = [query for query in dict.fromkeys(queries) if query not in self._query_vectors]
+        if missing:
+            vectors = np.asarray(
+                await asyncio.gather(*[self.embeddings.aembed_query(query) for query in missing]),
+                dtype=np.float32,
+            )
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors /= np.where(norms == 0, 1, norms)
+            self._query_vectors.update(zip(missing, vectors))
+        return np.vstack([self._query_vectors[query] for query in queries])
+
+    async def similarity_search_many(
+        self,
+        queries: Sequence[str],
+        k: int = 10,
+        similarity_threshold: float | None = None,
+        sources: Sequence[Optional[set]] | None = None,
+    ) -> List[List[tuple[Document, float]]]:
+        """
+        Score every query against every chunk with a single matrix product.
+
+        Args:
+            queries: The queries to score.
+            k: Maximum number of chunks returned per query.
+            similarity_threshold: Minimum cosine similarity for a chunk to be returned.
+            sources: Optional per-query set of source urls the query is restricted to.
+
+        Returns:
+            List[List[tuple[Document, float]]]: For every query, its best chunks and scores, best first.
+        """
+        if not queries:
+            return []
+        if not self.documents:
+            return [[] for _ in queries]
+
+        scores = await self._embed_queries(queries) @ self.matrix.T
+
+        if sources is not None:
+            chunk_sources = np.asarray(self._sources, dtype=object)
+            duplicated = [
+                (i, document.metadata["duplicate_sources"])
+                for i, document in enumerate(self.documents) if document.metadata.get("duplicate_sources")
+            ]
+            for row, allowed in enumerate(sources):
+                if allowed is not None:
+                    excluded = ~np.isin(chunk_sources, list(allowed))
+                    for i, duplicate_sources in duplicated:
+                        if duplicate_sources & allowed:
+                            excluded[i] = False
+                    scores[row, excluded] = -np.inf
+        if similarity_threshold is not None:
+            scores[scores <= similarity_threshold] = -np.inf
+
+        results = []
+        k = min(k, scores.shape[1])
+        for row in scores:
+            top = np.argpartition(-row, k - 1)[:k] if k else np.array([], dtype=int)
+            top = top[np.argsort(-row[top])]
+            results.append([(self.documents[i], float(row[i])) for i in top if np.isfinite(row[i])])
+        return results
+
+    async def select_diverse(
+        self, documents: Sequence[Document], queries: Sequence[str], k: int, lambda_mult: float = 0.7
+    ) -> List[Document]:
+        """
+        Select `k` of the store's chunks by maximal marginal relevance.
+
+        A chunk's relevance is its best similarity to any of the queries, and its redundancy its
+        highest similarity to a chunk selected before it.
+        """
+        if len(documents) <= k:
+            return list(documents)
+        vectors = self._vectors(documents)
+        relevance = await self.relevance(documents, queries)
+        return [documents[i] for i in mmr_select(relevance, vectors, k, lambda_mult)]
+
+    async def relevance(self, documents: Sequence[Document], queries: Sequence[str]) -> np.ndarray:
+        """The best cosine similarity of each of the store's chunks to any of the queries."""
+        if not documents or not queries:
+            return np.zeros(len(documents), dtype=np.float32)
+        return (self._vectors(documents) @ (await self._embed_queries(queries)).T).max(axis=1)
+
+    def _vectors(self, documents: Sequence[Document]) -> np.ndarray:
+        return self.matrix[[document.metadata["chunk_id"] for document in documents]]
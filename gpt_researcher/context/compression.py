@@ -1,6 +1,7 @@
 import os
 import asyncio
 from typing import Optional
+from .dedup import NearDuplicateFilter
 from .retriever import SearchAPIRetriever, SectionRetriever
 from langchain.retrievers import (
     ContextualCompressionRetriever,
@@ -11,7 +12,7 @@ from langchain.retrievers.document_compressors import (
 )
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from ..vector_store import VectorStoreWrapper
-from ..utils.costs import estimate_embedding_cost
+from ..utils.costs import aestimate_embedding_cost
 from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
 from ..prompts import PromptFamily
 
@@ -45,6 +46,7 @@ class ContextCompressor:
         embeddings,
         max_results=5,
         prompt_family: type[PromptFamily] | PromptFamily = PromptFamily,
+        near_duplicate_threshold: float = 0,
         **kwargs,
     ):
         self.max_results = max_results
@@ -53,14 +55,17 @@ class ContextCompressor:
         self.embeddings = embeddings
         self.similarity_threshold = os.environ.get("SIMILARITY_THRESHOLD", 0.35)
         self.prompt_family = prompt_family
+        self.near_duplicate_threshold = near_duplicate_threshold
 
     def __get_contextual_retriever(self):
-        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
+        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100, add_start_index=True)
         relevance_filter = EmbeddingsFilter(embeddings=self.embeddings,
                                             similarity_threshold=self.similarity_threshold)
-        pipeline_compressor = DocumentCompressorPipeline(
-            transformers=[splitter, relevance_filter]
-        )
+        transformers = [splitter, relevance_filter]
+        if self.near_duplicate_threshold:
+            # Drop near-duplicate chunks before the relevance filter embeds them
+            transformers.insert(1, NearDuplicateFilter(self.near_duplicate_threshold))
+        pipeline_compressor = DocumentCompressorPipeline(transformers=transformers)
         base_retriever = SearchAPIRetriever(
             pages=self.documents
         )
@@ -69,12 +74,16 @@ class ContextCompressor:
         )
         return contextual_retriever
 
-    async def async_get_context(self, query, max_results=5, cost_callback=None):
+    async def async_get_documents(self, query, max_results=5, cost_callback=None):
         compressed_docs = self.__get_contextual_retriever()
         if cost_callback:
-            cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
+            cost_callback(await aestimate_embedding_cost(OPENAI_EMBEDDING_MODEL, self.documents))
         relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query)
-        return self.prompt_family.pretty_print_docs(relevant_docs, max_results)
+        return relevant_docs[:max_results]
+
+    async def async_get_context(self, query, max_results=5, cost_callback=None):
+        relevant_docs = await self.async_get_documents(query, max_results, cost_callback)
+        return self.prompt_family.pretty_print_docs(relevant_docs)
 
 
 class WrittenContentCompressor:
@@ -105,6 +114,6 @@ class WrittenContentCompressor:
     async def async_get_context(self, query, max_results=5, cost_callback=None):
         compressed_docs = self.__get_contextual_retriever()
         if cost_callback:
-            cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
+            cost_callback(await aestimate_embedding_cost(OPENAI_EMBEDDING_MODEL, self.documents))
         relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query)
         return self.__pretty_docs_list(relevant_docs, max_results)
@@ -0,0 +1,117 @@
+"""
+Near-duplicate detection with MinHash and locality-sensitive hashing.
+
+Syndicated articles, mirrors and boilerplate-heavy pages have nearly the same text under
+different urls. A MinHash signature estimates the Jaccard similarity of two texts' word
+shingles, and banding the signatures (LSH) finds the candidates for a new text without
+comparing it to every text seen before. `NearDuplicateIndex` drops pages and
+`NearDuplicateFilter` drops chunks before they are embedded.
+"""
+import logging
+import re
+import threading
+import zlib
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from langchain_core.documents import BaseDocumentTransformer, Document
+
+logger = logging.getLogger(__name__)
+
+# Prime above 2^32, so permuted 32-bit shingle hashes don't collide
+_PRIME = np.uint64(4294967311)
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class MinHasher:
+    """MinHash signatures of texts' word shingles."""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 5, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        # Coefficients below 2^31 keep a * hash + b within 64 bits
+        self.a = rng.integers(1, 2 ** 31, num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, 2 ** 31, num_perm, dtype=np.uint64)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+
+    def shingles(self, text: str) -> set:
+        words = _WORD_PATTERN.findall(text.lower())
+        size = self.shingle_size
+        if len(words) < size:
+            return {" ".join(words)} if words else set()
+        return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """The signature of a text, or None if it has no words."""
+        shingles = self.shingles(text)
+        if not shingles:
+            return None
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+        return ((np.outer(hashes, self.a) + self.b) % _PRIME).min(axis=0)
+
+
+class NearDuplicateIndex:
+    """
+    Thread safe index of texts that recognises near-duplicates of the texts added before.
+
+    Args:
+        threshold: Estimated Jaccard similarity of word shingles from which a text is a duplicate.
+        num_perm: Length of the MinHash signatures.
+        bands: Number of LSH bands the signatures are split into. More bands find more
+            candidates with lower similarity, which are then checked against the threshold.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 16, shingle_size: int = 5):
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm, shingle_size)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.dropped = 0
+        self._keys: List[Any] = []
+        self._signatures: List[np.ndarray] = []
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def add(self, key: Any, text: str) -> Optional[Any]:
+        """
+        Add a text unless it nearly duplicates one added before.
+
+        Returns:
+            The key of the earlier text if this one is a near-duplicate (and was not added), else None.
+        """
+        signature = self.hasher.signature(text)
+        if signature is None:
+            return None
+        band_keys = self._band_keys(signature)
+        with self._lock:
+            candidates = {i for band, band_key in zip(self._buckets, band_keys) for i in band.get(band_key, ())}
+            for i in sorted(candidates):
+                if np.mean(self._signatures[i] == signature) >= self.threshold:
+                    self.dropped += 1
+                    return self._keys[i]
+            position = len(self._keys)
+            self._keys.append(key)
+            self._signatures.append(signature)
+            for band, band_key in zip(self._buckets, band_keys):
+                band.setdefault(band_key, []).append(position)
+        return None
+
+
+class NearDuplicateFilter(BaseDocumentTransformer):
+    """Drops documents that nearly duplicate an earlier document, for LangChain compressor pipelines."""
+
+    def __init__(self, threshold: float = 0.8):
+        self.threshold = threshold
+
+    def transform_documents(self, documents: Sequence[Document], **kwargs: Any) -> Sequence[Document]:
+        index = NearDuplicateIndex(self.threshold)
+        kept = [doc for i, doc in enumerate(documents) if index.add(i, doc.page_content) is None]
+        if index.dropped:
+            logger.info(f"Dropped {index.dropped} near-duplicate chunks of {len(documents)}")
+        return kept
@@ -0,0 +1,168 @@
+"""
+Token-budgeted packing of research context into report prompts.
+
+The research context is the concatenation of every sub-query's relevant chunks, formatted as
+`Source: ...\\nTitle: ...\\nContent: ...` blocks, so its size grows with the number of
+sub-queries and overlapping chunks are repeated. `pack_context` splits it back into chunks (or
+takes the chunks of a `ResearchContext` as they are), drops duplicate and near-duplicate
+chunks, ranks the rest by BM25 relevance to the query and greedily packs them into a token
+budget, keeping every chunk's source for citations. The packed chunks are rendered with the
+prompt family, like the unpacked context.
+"""
+import logging
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List
+
+from langchain_core.documents import Document
+
+from .records import ChunkRecord, ResearchContext
+from ..prompts import PromptFamily
+from ..utils.costs import get_token_counter
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_PATTERN = re.compile(
+    r"Source: (?P<source>[^\n]*)\nTitle: (?P<title>[^\n]*)\nContent: (?P<content>.*?)(?=\n\s*Source: |\Z)",
+    re.S,
+)
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def split_context(context: str) -> List[Dict[str, Any]]:
+    """
+    Split a context string into chunks.
+
+    Text that isn't formatted as a source block (e.g. a prefix added around local documents) is
+    kept as chunks without a source.
+    """
+    chunks = []
+    position = 0
+
+    def add_loose_text(text: str) -> None:
+        for paragraph in re.split(r"\n\s*\n", text):
+            if paragraph.strip():
+                chunks.append({"source": None, "title": None, "content": paragraph.strip()})
+
+    for match in _CHUNK_PATTERN.finditer(context):
+        add_loose_text(context[position:match.start()])
+        chunks.append({
+            "source": match.group("source").strip(),
+            "title": match.group("title").strip(),
+            "content": match.group("content").strip(),
+        })
+        position = match.end()
+    add_loose_text(context[position:])
+    return chunks
+
+
+def render_chunk(chunk: Dict[str, Any], prompt_family: Any = PromptFamily) -> str:
+    """Render a chunk on its own with the prompt family's `pretty_print_docs`."""
+    if chunk["source"] is None:
+        return chunk["content"] + "\n"
+    return prompt_family.pretty_print_docs(
+        [Document(page_content=chunk["content"], metadata={"source": chunk["source"], "title": chunk["title"]})]
+    )
+
+
+def _words(text: str) -> List[str]:
+    return _WORD_PATTERN.findall(text.lower())
+
+
+def _shingles(words: List[str], size: int = 5) -> set:
+    if len(words) < size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def rank_chunks(chunks: List[Dict[str, Any]], query: str, k1: float = 1.2, b: float = 0.75) -> List[Dict[str, Any]]:
+    """Order chunks by BM25 relevance to the query. Ties keep their original order."""
+    documents = [_words(chunk["content"]) for chunk in chunks]
+    if not documents:
+        return []
+    average_length = sum(len(words) for words in documents) / len(documents) or 1
+    document_frequency = Counter(word for words in documents for word in set(words))
+    query_terms = set(_words(query))
+
+    def score(words: List[str]) -> float:
+        frequencies = Counter(words)
+        total = 0.0
+        for term in query_terms:
+            tf = frequencies.get(term, 0)
+            if not tf:
+                continue
+            idf = math.log(1 + (len(documents) - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+            total += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(words) / average_length))
+        return total
+
+    scores = [score(words) for words in documents]
+    order = sorted(range(len(chunks)), key=lambda i: -scores[i])
+    return [chunks[i] for i in order]
+
+
+def deduplicate_chunks(chunks: List[Dict[str, Any]], threshold: float = 0.8) -> List[Dict[str, Any]]:
+    """
+    Drop chunks whose content repeats an earlier chunk.
+
+    Chunks are near-duplicates when the Jaccard similarity of their 5-word shingles is at least
+    `threshold`. The first of a group of duplicates is kept, so rank the chunks first.
+    """
+    kept, kept_shingles, seen = [], [], set()
+    for chunk in chunks:
+        words = _words(chunk["content"])
+        normalized = " ".join(words)
+        if normalized in seen:
+            continue
+        shingles = _shingles(words)
+        if any(len(shingles & other) / len(shingles | other) >= threshold for other in kept_shingles):
+            continue
+        seen.add(normalized)
+        kept.append(chunk)
+        kept_shingles.append(shingles)
+    return kept
+
+
+def pack_context(
+    context: Any, query: str, token_budget: int, model: str | None = None, prompt_family: Any = None
+) -> str:
+    """
+    Pack research context into a token budget.
+
+    Args:
+        context: The research context: a string, a list of strings or a `ResearchContext`.
+        query: The research query chunks are ranked against.
+        token_budget: Maximum number of tokens of the packed context.
+        model: The model the context is written for, used to count tokens.
+        prompt_family: Renders the packed chunks, and joins those of local documents and of the
+            web of a hybrid `ResearchContext`. Defaults to the context's prompt family.
+
+    Returns:
+        str: The most relevant unique chunks that fit in the budget, most relevant first.
+    """
+    if isinstance(context, list):
+        context = "\n".join(str(item) for item in context)
+    family = prompt_family or getattr(context, "prompt_family", None) or PromptFamily
+    count_tokens = get_token_counter(model)
+    # Structured context doesn't need to be parsed back into chunks
+    chunks = context.to_chunks() if isinstance(context, ResearchContext) else split_context(context)
+    ranked = deduplicate_chunks(rank_chunks(chunks, query))
+
+    packed, used = [], 0
+    for chunk in ranked:
+        tokens = count_tokens(render_chunk(chunk, family))
+        # Skip chunks that don't fit, a smaller less relevant one may still fit
+        if used + tokens > token_budget:
+            continue
+        packed.append(chunk)
+        used += tokens
+
+    logger.info(
+        f"Packed {len(packed)} of {len(chunks)} context chunks ({len(chunks) - len(ranked)} duplicates) "
+        f"into {used} of {token_budget} tokens"
+    )
+    # Rendered together, so the family can wrap them as one set of documents, and chunks of a
+    # hybrid research, ranked together, are joined by the family with local documents apart
+    return ResearchContext(
+        [ChunkRecord(chunk["content"], chunk["source"], chunk["title"], origin=chunk.get("origin")) for chunk in packed]
+    ).render(family)
@@ -0,0 +1,176 @@
+"""
+Structured research context.
+
+Research used to produce its context as one formatted string, which was copied, concatenated
+and re-parsed on its way to the report prompts. `ResearchContext` keeps the relevant chunks as
+`ChunkRecord`s instead, so they can be deduplicated, packed into a token budget and shared
+between researchers by reference, and only renders them with the prompt family when a prompt
+is written.
+"""
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional
+
+from langchain_core.documents import Document
+
+from ..prompts import PromptFamily
+
+
+class ChunkRecord:
+    """
+    A chunk of a researched page.
+
+    Args:
+        content: The text of the chunk.
+        source: The url or path of the page, or None for text that isn't from a single page.
+        title: The title of the page.
+        score: Relevance of the chunk to the research, if known.
+        chunk_id: Row of the chunk's embedding in the run's chunk store, if it is in one.
+        start: Offset of the chunk in the page's text, if known.
+        origin: "local" for chunks of local documents in hybrid research.
+    """
+
+    __slots__ = ("content", "source", "title", "score", "chunk_id", "start", "origin")
+
+    def __init__(
+        self,
+        content: str,
+        source: Optional[str] = None,
+        title: Optional[str] = None,
+        score: Optional[float] = None,
+        chunk_id: Optional[int] = None,
+        start: Optional[int] = None,
+        origin: Optional[str] = None,
+    ):
+        self.content = content
+        self.source = source
+        self.title = title
+        self.score = score
+        self.chunk_id = chunk_id
+        self.start = start
+        self.origin = origin
+
+    @classmethod
+    def from_document(cls, document: Document, score: Optional[float] = None) -> "ChunkRecord":
+        metadata = document.metadata
+        return cls(
+            document.page_content,
+            source=metadata.get("source"),
+            title=metadata.get("title"),
+            score=score,
+            chunk_id=metadata.get("chunk_id"),
+            start=metadata.get("start_index"),
+        )
+
+    @property
+    def key(self) -> Hashable:
+        """
+        Identity of the chunk: its source, offset and content.
+
+        Not the chunk store id, which is only the row in one researcher's store, so contexts
+        merged from several researchers would mistake different chunks for the same.
+        """
+        return (self.source, self.start, self.content)
+
+    def to_document(self) -> Document:
+        return Document(page_content=self.content, metadata={"source": self.source, "title": self.title})
+
+    def __repr__(self) -> str:
+        return f"ChunkRecord(source={self.source!r}, score={self.score!r}, chunk_id={self.chunk_id!r})"
+
+
+class ResearchContext:
+    """
+    The chunks gathered by a research, each kept once, in the order they were added.
+
+    Strings added to the context (e.g. context from a vector store or deep research) are kept as
+    records without a source and rendered as they are.
+
+    Args:
+        records: The initial records or strings.
+        prompt_family: The prompt family the context is rendered with by default.
+    """
+
+    __slots__ = ("records", "prompt_family", "_keys")
+
+    def __init__(self, records: Iterable[ChunkRecord | str] = (), prompt_family: Any = None):
+        self.records: List[ChunkRecord] = []
+        self.prompt_family = prompt_family
+        self._keys = set()
+        self.extend(records)
+
+    @classmethod
+    def of(cls, context: Any, prompt_family: Any = None) -> "ResearchContext":
+        """The context itself if it is a `ResearchContext`, else a new one holding a string or list of strings."""
+        if isinstance(context, ResearchContext):
+            return context
+        if not context:
+            return cls(prompt_family=prompt_family)
+        return cls([context] if isinstance(context, str) else context, prompt_family)
+
+    def add(self, record: ChunkRecord | str) -> bool:
+        """Add a record, unless the context already has it. Returns whether it was added."""
+        if isinstance(record, str):
+            record = ChunkRecord(record)
+        if not record.content or record.key in self._keys:
+            return False
+        self._keys.add(record.key)
+        self.records.append(record)
+        return True
+
+    def extend(self, records: Iterable[ChunkRecord | str]) -> int:
+        """Add records, sharing rather than copying them. Returns the number added."""
+        if isinstance(records, str):
+            records = [records]
+        return sum(self.add(record) for record in records)
+
+    def __iter__(self) -> Iterator[ChunkRecord]:
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def sources(self) -> List[str]:
+        """The sources of the chunks, each once, in order."""
+        return list(dict.fromkeys(record.source for record in self.records if record.source is not None))
+
+    def to_chunks(self) -> List[Dict[str, Any]]:
+        """The records as the chunk dicts of `gpt_researcher.context.packer`."""
+        return [
+            {"source": record.source, "title": record.title, "content": record.content, "origin": record.origin}
+            for record in self.records
+        ]
+
+    def render(self, prompt_family: Any = None) -> str:
+        """
+        Render the context for a prompt.
+
+        Chunks are formatted by the prompt family's `pretty_print_docs`. When the context has
+        chunks of local documents and of the web, they are joined by `join_local_web_documents`.
+        """
+        family = prompt_family or self.prompt_family or PromptFamily
+        local = [record for record in self.records if record.origin == "local"]
+        if local and len(local) < len(self.records):
+            web = [record for record in self.records if record.origin != "local"]
+            return family.join_local_web_documents(_render(family, local), _render(family, web))
+        return _render(family, self.records)
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __repr__(self) -> str:
+        return f"ResearchContext({len(self.records)} chunks from {len(self.sources)} sources)"
+
+
+def _render(family: Any, records: List[ChunkRecord]) -> str:
+    parts, documents = [], []
+    for record in records:
+        if record.source is None:
+            if documents:
+                parts.append(family.pretty_print_docs(documents))
+                documents = []
+            parts.append(record.content)
+        else:
+            documents.append(record.to_document())
+    if documents:
+        parts.append(family.pretty_print_docs(documents))
+    return "\n".join(parts)
@@ -0,0 +1,68 @@
+"""
+Merging the relevant chunks of a research's sub-queries into one context.
+
+Sub-queries overlap, so a chunk that is relevant to one is often relevant to several, and
+joining every sub-query's formatted chunks repeats it. `merge_chunks` keeps every chunk once by
+its identity, and `mmr_select` picks a budget of chunks by maximal marginal relevance, trading
+each chunk's relevance against its similarity to the chunks already picked so the budget isn't
+spent on chunks that say the same thing.
+"""
+from typing import Hashable, List, Sequence
+
+import numpy as np
+from langchain_core.documents import Document
+
+
+def chunk_key(document: Document) -> Hashable:
+    """Identify a chunk by its chunk store id, or by its source and content."""
+    chunk_id = document.metadata.get("chunk_id")
+    if chunk_id is not None:
+        return chunk_id
+    return document.metadata.get("source"), document.page_content
+
+
+def merge_chunks(results: Sequence[Sequence[Document]]) -> List[Document]:
+    """
+    Merge the chunks found for several queries, keeping each chunk once.
+
+    Args:
+        results: Every query's chunks, most relevant first.
+
+    Returns:
+        List[Document]: The unique chunks by rank: the best chunk of every query, then the second best...
+    """
+    merged, seen = [], set()
+    for rank in range(max((len(documents) for documents in results), default=0)):
+        for documents in results:
+            if rank < len(documents):
+                key = chunk_key(documents[rank])
+                if key not in seen:
+                    seen.add(key)
+                    merged.append(documents[rank])
+    return merged
+
+
+def mmr_select(relevance: np.ndarray, vectors: np.ndarray, k: int, lambda_mult: float = 0.7) -> List[int]:
+    """
+    Select chunks by maximal marginal relevance.
+
+    Args:
+        relevance: Relevance of every chunk to the research.
+        vectors: Normalised embeddings of the chunks, one row per chunk.
+        k: Number of chunks to select.
+        lambda_mult: Weight of relevance against diversity, from 0 (only diversity) to 1 (only relevance).
+
+    Returns:
+        List[int]: Indices of the selected chunks, in the order they were selected.
+    """
+    relevance = np.asarray(relevance, dtype=np.float32)
+    redundancy = np.zeros(len(relevance), dtype=np.float32)
+    available = np.ones(len(relevance), dtype=bool)
+    selected: List[int] = []
+    for _ in range(min(k, len(relevance))):
+        scores = np.where(available, lambda_mult * relevance - (1 - lambda_mult) * redundancy, -np.inf)
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        redundancy = np.maximum(redundancy, vectors @ vectors[best])
+    return selected
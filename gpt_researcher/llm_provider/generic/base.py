@@ -1,15 +1,20 @@
 import aiofiles
 import asyncio
+import functools
 import importlib
 import json
 import subprocess
 import sys
+import threading
 import traceback
+import weakref
 from typing import Any
 from colorama import Fore, Style, init
 import os
 from enum import Enum
 
+from langchain_core.messages.ai import add_usage
+
 _SUPPORTED_PROVIDERS = {
     "openai",
     "anthropic",
@@ -80,6 +85,29 @@ class GenericLLMProvider:
         self.llm = llm
         self.chat_logger = ChatLogger(chat_log) if chat_log else None
 
+    @classmethod
+    def get_shared(cls, provider: str, chat_log: str | None = None, **kwargs: Any):
+        """
+        Get a provider from the process-wide registry, creating it on first use.
+
+        Providers are keyed by (provider, chat_log, kwargs), so every call with the same settings
+        reuses the same chat model and with it its HTTP client and keep-alive connections.
+        Async clients are bound to the event loop they were first used on, so every loop gets
+        its own providers.
+        """
+        key = (provider, chat_log, json.dumps(kwargs, sort_keys=True, default=repr))
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        with _providers_lock:
+            providers = _loop_providers.setdefault(loop, {}) if loop is not None else _providers
+            llm_provider = providers.get(key)
+            if llm_provider is None:
+                llm_provider = cls.from_provider(provider, chat_log, **kwargs)
+                providers[key] = llm_provider
+            return llm_provider
+
     @classmethod
     def from_provider(cls, provider: str, chat_log: str | None = None, **kwargs: Any):
         if provider == "openai":
@@ -215,38 +243,59 @@ class GenericLLMProvider:
 
 
     async def get_chat_response(self, messages, stream, websocket=None):
+        res, _ = await self.get_chat_response_with_usage(messages, stream, websocket)
+        return res
+
+    async def get_chat_response_with_usage(self, messages, stream, websocket=None):
+        """
+        Like `get_chat_response`, also returning the token usage reported by the provider.
+
+        Returns:
+            tuple[str, dict | None]: The response and its usage metadata (`input_tokens`,
+            `output_tokens`, `total_tokens`), or None if the provider reported none.
+        """
         if not stream:
             # Getting output from the model chain using ainvoke for asynchronous invoking
             output = await self.llm.ainvoke(messages)
 
             res = output.content
+            usage = getattr(output, "usage_metadata", None)
 
         else:
-            res = await self.stream_response(messages, websocket)
+            res, usage = await self._stream_response(messages, websocket)
 
         if self.chat_logger:
             await self.chat_logger.log_request(messages, res)
 
-        return res
+        return res, usage
 
     async def stream_response(self, messages, websocket=None):
-        paragraph = ""
-        response = ""
+        response, _ = await self._stream_response(messages, websocket)
+        return response
+
+    async def _stream_response(self, messages, websocket=None):
+        paragraph = []
+        response = []
+        usage = None
 
         # Streaming the response using the chain astream method from langchain
         async for chunk in self.llm.astream(messages):
             content = chunk.content
-            if content is not None:
-                response += content
-                paragraph += content
-                if "\n" in paragraph:
-                    await self._send_output(paragraph, websocket)
-                    paragraph = ""
+            if content:
+                response.append(content)
+                paragraph.append(content)
+                if "\n" in content:
+                    await self._send_output("".join(paragraph), websocket)
+                    paragraph = []
+            # Providers report usage on the first and/or last chunk, the totals are the sum
+            chunk_usage = getattr(chunk, "usage_metadata", None)
+            if chunk_usage:
+                usage = add_usage(usage, chunk_usage)
 
         if paragraph:
-            await self._send_output(paragraph, websocket)
+            await self._send_output("".join(paragraph), websocket)
 
-        return response
+        return "".join(response), usage
 
     async def _send_output(self, content, websocket=None):
         if websocket is not None:
@@ -255,6 +304,13 @@ class GenericLLMProvider:
             print(f"{Fore.GREEN}{content}{Style.RESET_ALL}")
 
 
+_providers: dict[tuple, GenericLLMProvider] = {}
+_loop_providers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, GenericLLMProvider]]" = weakref.WeakKeyDictionary()
+_providers_lock = threading.Lock()
+
+
+# find_spec scans sys.path, so every package is only checked once per process
+@functools.lru_cache(maxsize=None)
 def _check_pkg(pkg: str) -> None:
     if not importlib.util.find_spec(pkg):
         pkg_kebab = pkg.replace("_", "-")
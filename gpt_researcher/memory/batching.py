@@ -0,0 +1,145 @@
+import asyncio
+import threading
+from typing import List, Optional, Set
+
+from langchain_core.embeddings import Embeddings
+
+# Providers whose query embeddings are identical to their document embeddings, so that several
+# `embed_query` calls can safely be sent as a single `embed_documents` request. Providers that
+# embed queries differently (DashScope's `text_type`, Cohere models on Bedrock, HuggingFace
+# `query_encode_kwargs`) are not batched.
+BATCHABLE_QUERY_PROVIDERS = {
+    "openai",
+    "azure_openai",
+    "custom",
+    "ollama",
+    "together",
+    "mistralai",
+    "fireworks",
+}
+
+
+class _Batch:
+    def __init__(self):
+        self.texts: List[str] = []
+        self.vectors: Optional[List[List[float]]] = None
+        self.error: Optional[BaseException] = None
+
+    def add(self, text: str) -> int:
+        self.texts.append(text)
+        return len(self.texts) - 1
+
+
+class _SyncBatch(_Batch):
+    def __init__(self):
+        super().__init__()
+        self.full = threading.Event()
+        self.done = threading.Event()
+
+
+class _AsyncBatch(_Batch):
+    def __init__(self):
+        super().__init__()
+        self.full = asyncio.Event()
+        self.done = asyncio.get_running_loop().create_future()
+
+
+class BatchedEmbeddings(Embeddings):
+    """
+    Micro-batching client in front of a LangChain embeddings object.
+
+    Query embeddings requested within `wait` seconds of each other are collected and sent as one
+    `embed_documents` call, then handed back to each waiting caller. The first caller of a batch
+    waits for the window to close and issues the request on behalf of the others; in async code
+    the request is issued from a separate task, so cancelling that caller does not fail the rest
+    of its batch. Document
+    embeddings are already batched and are passed straight through. A batch that fills up is
+    sent immediately.
+
+    Args:
+        embeddings: The embeddings object to send requests to.
+        wait: How long in seconds a batch stays open for more queries.
+        max_batch_size: A batch is sent early once it holds this many queries.
+    """
+
+    def __init__(self, embeddings: Embeddings, wait: float = 0.005, max_batch_size: int = 64):
+        self.embeddings = embeddings
+        self.wait = wait
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._sync_batch: Optional[_SyncBatch] = None
+        self._async_batch: Optional[_AsyncBatch] = None
+        self._dispatches: Set[asyncio.Task] = set()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        with self._lock:
+            batch = self._sync_batch
+            is_leader = batch is None
+            if is_leader:
+                batch = self._sync_batch = _SyncBatch()
+            index = batch.add(text)
+            if len(batch.texts) >= self.max_batch_size:
+                self._sync_batch = None
+                batch.full.set()
+
+        if is_leader:
+            batch.full.wait(self.wait)
+            with self._lock:
+                if self._sync_batch is batch:
+                    self._sync_batch = None
+            try:
+                batch.vectors = self.embeddings.embed_documents(batch.texts)
+            except BaseException as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        return batch.vectors[index]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        # Only touched from the event loop, so no lock is needed here
+        batch = self._async_batch
+        if batch is None:
+            batch = self._async_batch = _AsyncBatch()
+            # Sent from its own task, so cancelling the caller that opened the batch does not
+            # fail the queries of the others
+            dispatch = asyncio.ensure_future(self._adispatch(batch))
+            self._dispatches.add(dispatch)
+            dispatch.add_done_callback(self._dispatches.discard)
+        index = batch.add(text)
+        if len(batch.texts) >= self.max_batch_size:
+            self._async_batch = None
+            batch.full.set()
+
+        await asyncio.shield(batch.done)
+
+        if batch.error is not None:
+            raise batch.error
+        return batch.vectors[index]
+
+    async def _adispatch(self, batch: _AsyncBatch) -> None:
+        try:
+            try:
+                await asyncio.wait_for(batch.full.wait(), self.wait)
+            except asyncio.TimeoutError:
+                pass
+            if self._async_batch is batch:
+                self._async_batch = None
+            batch.vectors = await self.embeddings.aembed_documents(batch.texts)
+        except BaseException as e:
+            # Also covers cancellation during the window, so the batch is never reused
+            if self._async_batch is batch:
+                self._async_batch = None
+            batch.error = e
+        finally:
+            batch.done.set_result(None)
@@ -0,0 +1,89 @@
+import asyncio
+import os
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from ..utils.cache import TieredCache, get_shared_cache, hash_key
+
+
+def get_embedding_cache(cache_dir: str | None, max_size: int = 10000) -> TieredCache:
+    """
+    Get the process-wide embedding cache.
+
+    Args:
+        cache_dir: Directory for the persistent SQLite tier. If empty, embeddings are only cached in memory.
+        max_size: Number of embeddings kept in the in-memory LRU tier.
+
+    Returns:
+        TieredCache: The shared embedding cache.
+    """
+    path = os.path.join(cache_dir, "embeddings.sqlite") if cache_dir else None
+    return get_shared_cache(
+        path,
+        table="embeddings",
+        max_size=max_size,
+        encode=lambda vector: np.asarray(vector, dtype=np.float32).tobytes(),
+        decode=lambda raw: np.frombuffer(raw, dtype=np.float32),
+    )
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Content-addressed cache around any LangChain embeddings object.
+
+    Vectors are keyed by (namespace, kind, sha256 of the text), where the namespace identifies
+    the embedding provider and model, so the same chunk is only ever embedded once per model
+    no matter how many sub-queries, researchers or runs ask for it.
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: TieredCache, namespace: str):
+        self.embeddings = embeddings
+        self.cache = cache
+        self.namespace = namespace
+
+    def _key(self, kind: str, text: str) -> str:
+        return hash_key(self.namespace, kind, text)
+
+    def _lookup(self, texts: List[str]) -> tuple[list[str], dict[str, np.ndarray], list[str]]:
+        keys = [self._key("document", text) for text in texts]
+        found = self.cache.get_many(keys)
+        missing = list(dict.fromkeys(text for text, key in zip(texts, keys) if key not in found))
+        return keys, found, missing
+
+    def _store(self, texts: List[str], vectors: List[List[float]], kind: str = "document") -> dict[str, np.ndarray]:
+        items = {
+            self._key(kind, text): np.asarray(vector, dtype=np.float32)
+            for text, vector in zip(texts, vectors)
+        }
+        self.cache.set_many(items)
+        return items
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, found, missing = self._lookup(texts)
+        if missing:
+            found.update(self._store(missing, self.embeddings.embed_documents(missing)))
+        return [found[key].tolist() for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key("query", text)
+        vector = self.cache.get(key)
+        if vector is None:
+            vector = self._store([text], [self.embeddings.embed_query(text)], "query")[key]
+        return vector.tolist()
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, found, missing = await asyncio.to_thread(self._lookup, texts)
+        if missing:
+            vectors = await self.embeddings.aembed_documents(missing)
+            found.update(await asyncio.to_thread(self._store, missing, vectors))
+        return [found[key].tolist() for key in keys]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = self._key("query", text)
+        vector = await asyncio.to_thread(self.cache.get, key)
+        if vector is None:
+            embedded = await self.embeddings.aembed_query(text)
+            vector = (await asyncio.to_thread(self._store, [text], [embedded], "query"))[key]
+        return vector.tolist()
@@ -1,5 +1,9 @@
+import json
 import os
-from typing import Any
+from typing import Any, Dict
+
+from ..utils.cache import TieredCache, hash_key
+from .batching import BATCHABLE_QUERY_PROVIDERS, BatchedEmbeddings
 
 OPENAI_EMBEDDING_MODEL = os.environ.get(
     "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
@@ -25,8 +29,30 @@ _SUPPORTED_PROVIDERS = {
 }
 
 
+def cache_namespace(embedding_provider: str, model: str, embedding_kwargs: Dict[str, Any]) -> str:
+    """
+    Namespace of a provider's embeddings in the embedding cache.
+
+    Keyword args such as `dimensions` or `base_url` change the vectors, so they are part of the
+    namespace, as is the endpoint of the `custom` provider.
+    """
+    settings = dict(embedding_kwargs)
+    if embedding_provider == "custom":
+        settings["openai_api_base"] = os.getenv("OPENAI_BASE_URL", "http://localhost:1234/v1")
+    if not settings:
+        return f"{embedding_provider}:{model}"
+    return f"{embedding_provider}:{model}:{hash_key(json.dumps(settings, sort_keys=True, default=str))[:16]}"
+
+
 class Memory:
-    def __init__(self, embedding_provider: str, model: str, **embdding_kwargs: Any):
+    def __init__(
+        self,
+        embedding_provider: str,
+        model: str,
+        embedding_cache: TieredCache | None = None,
+        batch_wait_ms: float = 0,
+        **embdding_kwargs: Any,
+    ):
         _embeddings = None
         match embedding_provider:
             case "custom":
@@ -120,6 +146,16 @@ class Memory:
             case _:
                 raise Exception("Embedding not found.")
 
+        if batch_wait_ms > 0 and embedding_provider in BATCHABLE_QUERY_PROVIDERS:
+            _embeddings = BatchedEmbeddings(_embeddings, wait=batch_wait_ms / 1000)
+
+        if embedding_cache is not None:
+            from .cache import CachedEmbeddings
+
+            _embeddings = CachedEmbeddings(
+                _embeddings, embedding_cache, namespace=cache_namespace(embedding_provider, model, embdding_kwargs)
+            )
+
         self._embeddings = _embeddings
 
     def get_embeddings(self):
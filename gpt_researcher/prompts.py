@@ -6,6 +6,7 @@ from langchain.docstore.document import Document
 from .config import Config
 from .utils.enum import ReportSource, ReportType, Tone
 from .utils.enum import PromptFamily as PromptFamilyEnum
+from .utils.prompt_cache import CACHE_BREAKPOINT
 from typing import Callable, List, Dict, Any
 
 
@@ -631,6 +632,278 @@ class Granite33PromptFamily(PromptFamily):
         """Joins local web documents using Granite's preferred format"""
         return "\n\n".join([docs_context, web_context])
 
+
+class CacheFriendlyPromptFamily(PromptFamily):
+    """Prompts laid out for provider-side prompt prefix caching
+
+    Providers cache the longest prompt prefix they have seen recently, so the
+    report prompts put what stays the same across calls first: the static
+    instructions, then the research context, then the values that change
+    with every call (query, subtopic, date and previously written sections).
+    Each cacheable prefix ends with a CACHE_BREAKPOINT marker, which is
+    turned into the provider's format (or removed) by create_chat_completion.
+    """
+
+    @staticmethod
+    def _reference_prompt(report_source: str) -> str:
+        if report_source == ReportSource.Web.value:
+            return """
+You MUST write all used source urls at the end of the report as references, and make sure to not add duplicated sources, but only one reference for each.
+Every url should be hyperlinked: [url website](url)
+Additionally, you MUST include hyperlinks to the relevant URLs wherever they are referenced in the report:
+
+eg: Author, A. A. (Year, Month Date). Title of web page. Website Name. [url website](url)
+"""
+        return """
+You MUST write all used source document names at the end of the report as references, and make sure to not add duplicated sources, but only one reference for each.
+"""
+
+    @staticmethod
+    def generate_search_queries_prompt(
+        question: str,
+        parent_query: str,
+        report_type: str,
+        max_iterations: int = 3,
+        context: List[Dict[str, Any]] = [],
+    ):
+        if (
+            report_type == ReportType.DetailedReport.value
+            or report_type == ReportType.SubtopicReport.value
+        ):
+            task = f"{parent_query} - {question}"
+        else:
+            task = question
+
+        dynamic_example = ", ".join([f'"query {i+1}"' for i in range(max_iterations)])
+        context_prompt = f"""
+Context: {context}
+
+Use this context to inform and refine your search queries. The context provides real-time web information that can help you generate more specific and relevant queries. Consider any current events, recent developments, or specific details mentioned in the context that could enhance the search queries.
+""" if context else ""
+
+        return f"""You are a seasoned research assistant. Write {max_iterations} google search queries to search online that form an objective opinion from the task given at the end.
+You must respond with a list of strings in the following format: [{dynamic_example}].
+The response should contain ONLY the list.
+{CACHE_BREAKPOINT}{context_prompt}
+Task: "{task}"
+Assume the current date is {datetime.now(timezone.utc).strftime('%B %d, %Y')} if required.
+"""
+
+    @staticmethod
+    def generate_report_prompt(
+        question: str,
+        context,
+        report_source: str,
+        report_format="apa",
+        total_words=1000,
+        tone=None,
+        language="english",
+    ):
+        reference_prompt = CacheFriendlyPromptFamily._reference_prompt(report_source)
+        tone_prompt = f"Write the report in a {tone.value} tone." if tone else ""
+
+        return f"""
+Using the information given below, answer the query or task given at the end in a detailed report --
+The report should focus on the answer to the query, should be well structured, informative,
+in-depth, and comprehensive, with facts and numbers if available and at least {total_words} words.
+You should strive to write the report as long as you can using all relevant and necessary information provided.
+
+Please follow all of the following guidelines in your report:
+- You MUST determine your own concrete and valid opinion based on the given information. Do NOT defer to general and meaningless conclusions.
+- You MUST write the report with markdown syntax and {report_format} format.
+- Use markdown tables when presenting structured data or comparisons to enhance readability.
+- You MUST prioritize the relevance, reliability, and significance of the sources you use. Choose trusted sources over less reliable ones.
+- You must also prioritize new articles over older articles if the source can be trusted.
+- Use in-text citation references in {report_format} format and make it with markdown hyperlink placed at the end of the sentence or paragraph that references them like this: ([in-text citation](url)).
+- Don't forget to add a reference list at the end of the report in {report_format} format and full url links without hyperlinks.
+- {reference_prompt}
+- {tone_prompt}
+
+You MUST write the report in the following language: {language}.
+Please do your best, this is very important to my career.
+{CACHE_BREAKPOINT}
+Information: "{context}"
+{CACHE_BREAKPOINT}
+Query or task: "{question}"
+Assume that the current date is {date.today()}.
+"""
+
+    @staticmethod
+    def generate_deep_research_prompt(
+        question: str,
+        context: str,
+        report_source: str,
+        report_format="apa",
+        tone=None,
+        total_words=2000,
+        language: str = "english"
+    ):
+        reference_prompt = CacheFriendlyPromptFamily._reference_prompt(report_source)
+        tone_prompt = f"Write the report in a {tone.value} tone." if tone else ""
+
+        return f"""
+Using the hierarchically researched information and citations given below, write a comprehensive research report answering the query given at the end.
+
+The report should:
+1. Synthesize information from multiple levels of research depth
+2. Integrate findings from various research branches
+3. Present a coherent narrative that builds from foundational to advanced insights
+4. Maintain proper citation of sources throughout
+5. Be well-structured with clear sections and subsections
+6. Have a minimum length of {total_words} words
+7. Follow {report_format} format with markdown syntax
+8. Use markdown tables, lists and other formatting features when presenting comparative data, statistics, or structured information
+
+Additional requirements:
+- Prioritize insights that emerged from deeper levels of research
+- Highlight connections between different research branches
+- Include relevant statistics, data, and concrete examples
+- You MUST determine your own concrete and valid opinion based on the given information. Do NOT defer to general and meaningless conclusions.
+- You MUST prioritize the relevance, reliability, and significance of the sources you use. Choose trusted sources over less reliable ones.
+- You must also prioritize new articles over older articles if the source can be trusted.
+- Use in-text citation references in {report_format} format and make it with markdown hyperlink placed at the end of the sentence or paragraph that references them like this: ([in-text citation](url)).
+- {tone_prompt}
+- Write in {language}
+
+{reference_prompt}
+
+Please write a thorough, well-researched report that synthesizes all the gathered information into a cohesive whole.
+{CACHE_BREAKPOINT}
+Research information: "{context}"
+{CACHE_BREAKPOINT}
+Query: "{question}"
+Assume the current date is {datetime.now(timezone.utc).strftime('%B %d, %Y')}.
+"""
+
+    @staticmethod
+    def generate_subtopic_report_prompt(
+        current_subtopic,
+        existing_headers: list,
+        relevant_written_contents: list,
+        main_topic: str,
+        context,
+        report_format: str = "apa",
+        max_subsections=5,
+        total_words=800,
+        tone: Tone = Tone.Objective,
+        language: str = "english",
+    ) -> str:
+        return f"""
+Task:
+Using the latest information available in the context given below, construct a detailed report on the subtopic and main topic given at the end.
+You must limit the number of subsections to a maximum of {max_subsections}.
+
+Content Focus:
+- The report should focus on answering the question, be well-structured, informative, in-depth, and include facts and numbers if available.
+- Use markdown syntax and follow the {report_format.upper()} format.
+- When presenting data, comparisons, or structured information, use markdown tables to enhance readability.
+
+IMPORTANT:Content and Sections Uniqueness:
+- This part of the instructions is crucial to ensure the content is unique and does not overlap with existing reports.
+- Carefully review the existing headers and existing written contents given at the end before writing any new subsections.
+- Prevent any content that is already covered in the existing written contents.
+- Do not use any of the existing headers as the new subsection headers.
+- Do not repeat any information already covered in the existing written contents or closely related variations to avoid duplicates.
+- If you have nested subsections, ensure they are unique and not covered in the existing written contents.
+- Ensure that your content is entirely new and does not overlap with any information already covered in the previous subtopic reports.
+
+"Structure and Formatting":
+- As this sub-report will be part of a larger report, include only the main body divided into suitable subtopics without any introduction or conclusion section.
+
+- You MUST include markdown hyperlinks to relevant source URLs wherever referenced in the report, for example:
+
+    ### Section Header
+
+    This is a sample text ([in-text citation](url)).
+
+- Use H2 for the main subtopic header (##) and H3 for subsections (###).
+- Use smaller Markdown headers (e.g., H2 or H3) for content structure, avoiding the largest header (H1) as it will be used for the larger report's heading.
+- Organize your content into distinct sections that complement but do not overlap with existing reports.
+- When adding similar or identical subsections to your report, you should clearly indicate the differences between and the new content and the existing written content from previous subtopic reports. For example:
+
+    ### New header (similar to existing header)
+
+    While the previous section discussed [topic A], this section will explore [topic B]."
+
+"IMPORTANT!":
+- You MUST write the report in the following language: {language}.
+- The focus MUST be on the main topic! You MUST Leave out any information un-related to it!
+- Must NOT have any introduction, conclusion, summary or reference section.
+- You MUST use in-text citation references in {report_format.upper()} format and make it with markdown hyperlink placed at the end of the sentence or paragraph that references them like this: ([in-text citation](url)).
+- You MUST mention the difference between the existing content and the new content in the report if you are adding the similar or same subsections wherever necessary.
+- The report should have a minimum length of {total_words} words.
+- Use an {tone.value} tone throughout the report.
+
+Do NOT add a conclusion section.
+{CACHE_BREAKPOINT}
+Context:
+"{context}"
+{CACHE_BREAKPOINT}
+"Existing Subtopic Reports":
+- Existing subtopic reports and their section headers:
+
+    {existing_headers}
+
+- Existing written contents from previous subtopic reports:
+
+    {relevant_written_contents}
+
+Main Topic and Subtopic:
+The subtopic: {current_subtopic} under the main topic: {main_topic}.
+
+"Date":
+Assume the current date is {datetime.now(timezone.utc).strftime('%B %d, %Y')} if required.
+"""
+
+    @staticmethod
+    def generate_draft_titles_prompt(
+        current_subtopic: str,
+        main_topic: str,
+        context: str,
+        max_subsections: int = 5
+    ) -> str:
+        return f"""
+"Task":
+Using the latest information available in the context given below, construct draft section title headers for a detailed report on the subtopic and main topic given at the end.
+1. Create a list of draft section title headers for the subtopic report.
+2. Each header should be concise and relevant to the subtopic.
+3. The header should't be too high level, but detailed enough to cover the main aspects of the subtopic.
+4. Use markdown syntax for the headers, using H3 (###) as H1 and H2 will be used for the larger report's heading.
+5. Ensure the headers cover main aspects of the subtopic.
+
+"Structure and Formatting":
+Provide the draft headers in a list format using markdown syntax, for example:
+
+### Header 1
+### Header 2
+### Header 3
+
+"IMPORTANT!":
+- The focus MUST be on the main topic! You MUST Leave out any information un-related to it!
+- Must NOT have any introduction, conclusion, summary or reference section.
+- Focus solely on creating headers, not content.
+{CACHE_BREAKPOINT}
+"Context":
+"{context}"
+{CACHE_BREAKPOINT}
+"Main Topic and Subtopic":
+The subtopic: {current_subtopic} under the main topic: {main_topic}.
+"""
+
+    @staticmethod
+    def generate_report_introduction(question: str, research_summary: str = "", language: str = "english", report_format: str = "apa") -> str:
+        return f"""Using the latest information given below, prepare a detailed report introduction on the topic given at the end.
+- The introduction should be succinct, well-structured, informative with markdown syntax.
+- As this introduction will be part of a larger report, do NOT include any other sections, which are generally present in a report.
+- The introduction should be preceded by an H1 heading with a suitable topic for the entire report.
+- You must use in-text citation references in {report_format.upper()} format and make it with markdown hyperlink placed at the end of the sentence or paragraph that references them like this: ([in-text citation](url)).
+- The output must be in {language} language.
+{CACHE_BREAKPOINT}{research_summary}
+{CACHE_BREAKPOINT}
+Topic: {question}
+Assume that the current date is {datetime.now(timezone.utc).strftime('%B %d, %Y')} if required.
+"""
+
 ## Factory ######################################################################
 
 # This is the function signature for the various prompt generator functions
@@ -681,6 +954,7 @@ prompt_family_mapping = {
     PromptFamilyEnum.Granite31.value: Granite3PromptFamily,
     PromptFamilyEnum.Granite32.value: Granite3PromptFamily,
     PromptFamilyEnum.Granite33.value: Granite33PromptFamily,
+    PromptFamilyEnum.CacheFriendly.value: CacheFriendlyPromptFamily,
 }
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import arxiv
 
 
@@ -37,4 +38,12 @@ class ArxivSearch:
                 "body": result.summary,
             })
         
-        return search_result
\ No newline at end of file
+        return search_result
+
+    async def asearch(self, max_results=5):
+        """
+        Performs the search in a worker thread, as the client library is blocking
+        :param max_results:
+        :return:
+        """
+        return await asyncio.to_thread(self.search, max_results)
@@ -6,6 +6,10 @@ import requests
 import json
 import logging
 
+from ...utils.http import fetch_json
+
+BING_URL = "https://api.bing.microsoft.com/v7.0/search"
+
 
 class BingSearch():
     """
@@ -46,8 +50,42 @@ class BingSearch():
         """Useful for general internet search queries using the Bing API."""
 
         # Search the query
-        url = "https://api.bing.microsoft.com/v7.0/search"
+        url = BING_URL
+
+        headers, params = self._get_request(max_results)
 
+        resp = requests.get(url, headers=headers, params=params)
+
+        # Preprocess the results
+        if resp is None:
+            return []
+        try:
+            search_results = json.loads(resp.text)
+            results = search_results["webPages"]["value"]
+        except Exception as e:
+            self.logger.error(
+                f"Error parsing Bing search results: {e}. Resulting in empty response.")
+            return []
+        return self._format_results(results)
+
+    async def asearch(self, max_results=7) -> list[dict[str]]:
+        """
+        Searches the query through the shared pooled HTTP session
+        Returns:
+
+        """
+        print("Searching with query {0}...".format(self.query))
+        headers, params = self._get_request(max_results)
+        try:
+            search_results = await fetch_json(BING_URL, params=params, headers=headers)
+            results = search_results["webPages"]["value"]
+        except Exception as e:
+            self.logger.error(
+                f"Error parsing Bing search results: {e}. Resulting in empty response.")
+            return []
+        return self._format_results(results)
+
+    def _get_request(self, max_results):
         headers = {
             'Ocp-Apim-Subscription-Key': self.api_key,
             'Content-Type': 'application/json'
@@ -62,22 +100,10 @@ class BingSearch():
             "textFormat": "HTML",
             "safeSearch": "Strict"
         }
+        return headers, params
 
-        resp = requests.get(url, headers=headers, params=params)
-
-        # Preprocess the results
-        if resp is None:
-            return []
-        try:
-            search_results = json.loads(resp.text)
-            results = search_results["webPages"]["value"]
-        except Exception as e:
-            self.logger.error(
-                f"Error parsing Bing search results: {e}. Resulting in empty response.")
-            return []
-        if search_results is None:
-            self.logger.warning(f"No search results found for query: {self.query}")
-            return []
+    @staticmethod
+    def _format_results(results) -> list[dict[str]]:
         search_results = []
 
         # Normalize the results to match the format of the other search APIs
@@ -2,6 +2,8 @@ from typing import Any, Dict, List, Optional
 import requests
 import os
 
+from ...utils.http import fetch_json
+
 
 class CustomRetriever:
     """
@@ -48,5 +50,15 @@ class CustomRetriever:
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
+            print(f"Failed to retrieve search results: {e}")
+            return None
+
+    async def asearch(self, max_results: int = 5) -> Optional[List[Dict[str, Any]]]:
+        """
+        Performs the search through the shared pooled HTTP session, see `search`.
+        """
+        try:
+            return await fetch_json(self.endpoint, params={**self.params, 'query': self.query}, timeout=None)
+        except Exception as e:
             print(f"Failed to retrieve search results: {e}")
             return None
\ No newline at end of file
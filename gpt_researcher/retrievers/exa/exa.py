@@ -1,3 +1,4 @@
+import asyncio
 import os
 from ..utils import check_pkg
 
@@ -63,6 +64,16 @@ class ExaSearch:
         ]
         return search_response
 
+    async def asearch(
+        self, max_results=10, use_autoprompt=False, search_type="neural", **filters
+    ):
+        """
+        Searches the query in a worker thread, as the Exa client is blocking. See `search`.
+        """
+        return await asyncio.to_thread(
+            self.search, max_results, use_autoprompt, search_type, **filters
+        )
+
     def find_similar(self, url, exclude_source_domain=False, **filters):
         """
         Finds similar documents to the provided URL using the Exa API.
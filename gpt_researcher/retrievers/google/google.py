@@ -5,6 +5,8 @@ import os
 import requests
 import json
 
+from ...utils.http import fetch_json
+
 
 class GoogleSearch:
     """
@@ -56,12 +58,7 @@ class GoogleSearch:
         Returns:
             list: List of search results with title, href and body
         """
-        # Build query with domain restrictions if specified
-        search_query = self.query
-        if self.query_domains and len(self.query_domains) > 0:
-            domain_query = " OR ".join([f"site:{domain}" for domain in self.query_domains])
-            search_query = f"({domain_query}) {self.query}"
-
+        search_query = self._get_search_query()
         print("Searching with query {0}...".format(search_query))
 
         url = f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.cx_key}&q={search_query}&start=1"
@@ -79,6 +76,38 @@ class GoogleSearch:
         if search_results is None:
             return
 
+        return self._format_results(search_results, max_results)
+
+    async def asearch(self, max_results=7):
+        """
+        Searches the query through the shared pooled HTTP session, see `search`
+        Returns:
+            list: List of search results with title, href and body
+        """
+        search_query = self._get_search_query()
+        print("Searching with query {0}...".format(search_query))
+
+        params = {"key": self.api_key, "cx": self.cx_key, "q": search_query, "start": 1}
+        try:
+            search_results = await fetch_json("https://www.googleapis.com/customsearch/v1", params=params)
+        except Exception as e:
+            print("Google search: request failed: ", e)
+            return
+        if search_results is None:
+            return
+
+        return self._format_results(search_results, max_results)
+
+    def _get_search_query(self):
+        # Build query with domain restrictions if specified
+        search_query = self.query
+        if self.query_domains and len(self.query_domains) > 0:
+            domain_query = " OR ".join([f"site:{domain}" for domain in self.query_domains])
+            search_query = f"({domain_query}) {self.query}"
+        return search_query
+
+    @staticmethod
+    def _format_results(search_results, max_results):
         results = search_results.get("items", [])
         search_results = []
 
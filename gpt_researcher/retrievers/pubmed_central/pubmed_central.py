@@ -1,8 +1,15 @@
+import asyncio
 import os
+import urllib.parse
 import xml.etree.ElementTree as ET
 
 import requests
 
+from ...utils.http import fetch_json, fetch_url
+
+ESEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+
 
 class PubMedCentralSearch:
     """
@@ -43,16 +50,8 @@ class PubMedCentralSearch:
         Returns:
             A list of search results.
         """
-        base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
-        params = {
-            "db": "pmc",
-            "term": f"{self.query} AND free fulltext[filter]",
-            "retmax": max_results,
-            "usehistory": "y",
-            "api_key": self.api_key,
-            "retmode": "json",
-            "sort": "relevance"
-        }
+        base_url = ESEARCH_URL
+        params = self._get_search_params(max_results)
         response = requests.get(base_url, params=params)
 
         if response.status_code != 200:
@@ -65,22 +64,55 @@ class PubMedCentralSearch:
 
         search_response = []
         for article_id in ids:
-            xml_content = self.fetch([article_id])
-            if self.has_body_content(xml_content):
-                article_data = self.parse_xml(xml_content)
-                if article_data:
-                    search_response.append(
-                        {
-                            "href": f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{article_id}/",
-                            "body": f"{article_data['title']}\n\n{article_data['abstract']}\n\n{article_data['body'][:500]}...",
-                        }
-                    )
+            search_result = self._format_article(article_id, self.fetch([article_id]))
+            if search_result:
+                search_response.append(search_result)
 
             if len(search_response) >= max_results:
                 break
 
         return search_response
 
+    async def asearch(self, max_results=10):
+        """
+        Searches the query through the shared pooled HTTP session, fetching all articles concurrently.
+        Args:
+            max_results: The maximum number of results to return.
+        Returns:
+            A list of search results.
+        """
+        results = await fetch_json(ESEARCH_URL, params=self._get_search_params(max_results))
+        ids = results["esearchresult"]["idlist"]
+
+        xml_contents = await asyncio.gather(*[self.afetch([article_id]) for article_id in ids])
+        search_response = [
+            search_result
+            for article_id, xml_content in zip(ids, xml_contents)
+            if (search_result := self._format_article(article_id, xml_content))
+        ]
+        return search_response[:max_results]
+
+    def _get_search_params(self, max_results):
+        return {
+            "db": "pmc",
+            "term": f"{self.query} AND free fulltext[filter]",
+            "retmax": max_results,
+            "usehistory": "y",
+            "api_key": self.api_key,
+            "retmode": "json",
+            "sort": "relevance"
+        }
+
+    def _format_article(self, article_id, xml_content):
+        if self.has_body_content(xml_content):
+            article_data = self.parse_xml(xml_content)
+            if article_data:
+                return {
+                    "href": f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{article_id}/",
+                    "body": f"{article_data['title']}\n\n{article_data['abstract']}\n\n{article_data['body'][:500]}...",
+                }
+        return None
+
     def fetch(self, ids):
         """
         Fetches the full text content for given article IDs.
@@ -89,13 +121,8 @@ class PubMedCentralSearch:
         Returns:
             XML content of the articles.
         """
-        base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-        params = {
-            "db": "pmc",
-            "id": ",".join(ids),
-            "retmode": "xml",
-            "api_key": self.api_key,
-        }
+        base_url = EFETCH_URL
+        params = self._get_fetch_params(ids)
         response = requests.get(base_url, params=params)
 
         if response.status_code != 200:
@@ -105,6 +132,33 @@ class PubMedCentralSearch:
 
         return response.text
 
+    async def afetch(self, ids):
+        """
+        Fetches the full text content for given article IDs through the shared pooled HTTP session.
+        Args:
+            ids: List of article IDs.
+        Returns:
+            XML content of the articles.
+        """
+        url = f"{EFETCH_URL}?{urllib.parse.urlencode(self._get_fetch_params(ids))}"
+        status, _, body, charset = await fetch_url(url)
+        text = body.decode(charset or "utf-8", errors="replace")
+
+        if status != 200:
+            raise Exception(
+                f"Failed to retrieve data: {status} - {text}"
+            )
+
+        return text
+
+    def _get_fetch_params(self, ids):
+        return {
+            "db": "pmc",
+            "id": ",".join(ids),
+            "retmode": "xml",
+            "api_key": self.api_key,
+        }
+
     def has_body_content(self, xml_content):
         """
         Checks if the XML content has a body section.
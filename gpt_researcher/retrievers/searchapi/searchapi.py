@@ -5,6 +5,8 @@ import os
 import requests
 import urllib.parse
 
+from ...utils.http import fetch_json
+
 
 class SearchApiSearch():
     """
@@ -48,37 +50,62 @@ class SearchApiSearch():
             "engine": "google",
         }
 
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.api_key}',
-            'X-SearchApi-Source': 'gpt-researcher'
-        }
-
         encoded_url = url + "?" + urllib.parse.urlencode(params)
         search_response = []
 
         try:
-            response = requests.get(encoded_url, headers=headers, timeout=20)
+            response = requests.get(encoded_url, headers=self._get_headers(), timeout=20)
             if response.status_code == 200:
-                search_results = response.json()
-                if search_results:
-                    results = search_results["organic_results"]
-                    results_processed = 0
-                    for result in results:
-                        # skip youtube results
-                        if "youtube.com" in result["link"]:
-                            continue
-                        if results_processed >= max_results:
-                            break
-                        search_result = {
-                            "title": result["title"],
-                            "href": result["link"],
-                            "body": result["snippet"],
-                        }
-                        search_response.append(search_result)
-                        results_processed += 1
+                search_response = self._format_results(response.json(), max_results)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
 
         return search_response
+
+    async def asearch(self, max_results=7):
+        """
+        Searches the query through the shared pooled HTTP session
+        Returns:
+
+        """
+        print("SearchApiSearch: Searching with query {0}...".format(self.query))
+        try:
+            search_results = await fetch_json(
+                "https://www.searchapi.io/api/v1/search",
+                params={"q": self.query, "engine": "google"},
+                headers=self._get_headers(),
+                timeout=20,
+            )
+            return self._format_results(search_results, max_results)
+        except Exception as e:
+            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            return []
+
+    def _get_headers(self):
+        return {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.api_key}',
+            'X-SearchApi-Source': 'gpt-researcher'
+        }
+
+    @staticmethod
+    def _format_results(search_results, max_results):
+        search_response = []
+        if search_results:
+            results = search_results["organic_results"]
+            results_processed = 0
+            for result in results:
+                # skip youtube results
+                if "youtube.com" in result["link"]:
+                    continue
+                if results_processed >= max_results:
+                    break
+                search_result = {
+                    "title": result["title"],
+                    "href": result["link"],
+                    "body": result["snippet"],
+                }
+                search_response.append(search_result)
+                results_processed += 1
+        return search_response
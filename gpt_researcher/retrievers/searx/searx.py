@@ -4,6 +4,8 @@ import requests
 from typing import List, Dict
 from urllib.parse import urljoin
 
+from ...utils.http import fetch_json
+
 
 class SearxSearch():
     """
@@ -62,17 +64,42 @@ class SearxSearch():
             response.raise_for_status()
             results = response.json()
 
-            # Normalize results to match the expected format
-            search_response = []
-            for result in results.get('results', [])[:max_results]:
-                search_response.append({
-                    "href": result.get('url', ''),
-                    "body": result.get('content', '')
-                })
-
-            return search_response
+            return self._format_results(results, max_results)
 
         except requests.exceptions.RequestException as e:
             raise Exception(f"Error querying SearxNG: {str(e)}")
         except json.JSONDecodeError:
             raise Exception("Error parsing SearxNG response")
+
+    async def asearch(self, max_results: int = 10) -> List[Dict[str, str]]:
+        """
+        Searches the query using SearxNG API through the shared pooled HTTP session
+        Args:
+            max_results: Maximum number of results to return
+        Returns:
+            List of dictionaries containing search results
+        """
+        try:
+            results = await fetch_json(
+                urljoin(self.base_url, "search"),
+                params={'q': self.query, 'format': 'json'},
+                headers={'Accept': 'application/json'},
+            )
+        except json.JSONDecodeError:
+            raise Exception("Error parsing SearxNG response")
+        except Exception as e:
+            raise Exception(f"Error querying SearxNG: {str(e)}")
+
+        return self._format_results(results, max_results)
+
+    @staticmethod
+    def _format_results(results: Dict, max_results: int) -> List[Dict[str, str]]:
+        # Normalize results to match the expected format
+        search_response = []
+        for result in results.get('results', [])[:max_results]:
+            search_response.append({
+                "href": result.get('url', ''),
+                "body": result.get('content', '')
+            })
+
+        return search_response
@@ -2,6 +2,8 @@ from typing import Dict, List
 
 import requests
 
+from ...utils.http import fetch_json
+
 
 class SemanticScholarSearch:
     """
@@ -29,21 +31,38 @@ class SemanticScholarSearch:
         :param max_results: Maximum number of results to retrieve
         :return: List of dictionaries containing title, href, and body of each paper
         """
-        params = {
-            "query": self.query,
-            "limit": max_results,
-            "fields": "title,abstract,url,venue,year,authors,isOpenAccess,openAccessPdf",
-            "sort": self.sort,
-        }
-
         try:
-            response = requests.get(self.BASE_URL, params=params)
+            response = requests.get(self.BASE_URL, params=self._get_params(max_results))
             response.raise_for_status()
         except requests.RequestException as e:
             print(f"An error occurred while accessing Semantic Scholar API: {e}")
             return []
 
-        results = response.json().get("data", [])
+        return self._format_results(response.json())
+
+    async def asearch(self, max_results: int = 20) -> List[Dict[str, str]]:
+        """
+        Perform the search through the shared pooled HTTP session, see `search`.
+        """
+        try:
+            results = await fetch_json(self.BASE_URL, params=self._get_params(max_results))
+        except Exception as e:
+            print(f"An error occurred while accessing Semantic Scholar API: {e}")
+            return []
+
+        return self._format_results(results)
+
+    def _get_params(self, max_results: int) -> Dict:
+        return {
+            "query": self.query,
+            "limit": max_results,
+            "fields": "title,abstract,url,venue,year,authors,isOpenAccess,openAccessPdf",
+            "sort": self.sort,
+        }
+
+    @staticmethod
+    def _format_results(response: Dict) -> List[Dict[str, str]]:
+        results = response.get("data", [])
         search_result = []
 
         for result in results:
@@ -5,6 +5,8 @@ import os
 import requests
 import urllib.parse
 
+from ...utils.http import fetch_json
+
 
 class SerpApiSearch():
     """
@@ -44,39 +46,60 @@ class SerpApiSearch():
 
         url = "https://serpapi.com/search.json"
 
+        encoded_url = url + "?" + urllib.parse.urlencode(self._get_params())
+        search_response = []
+        try:
+            response = requests.get(encoded_url, timeout=10)
+            if response.status_code == 200:
+                search_response = self._format_results(response.json(), max_results)
+        except Exception as e:
+            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+
+        return search_response
+
+    async def asearch(self, max_results=7):
+        """
+        Searches the query through the shared pooled HTTP session
+        Returns:
+
+        """
+        print("SerpApiSearch: Searching with query {0}...".format(self.query))
+        try:
+            search_results = await fetch_json("https://serpapi.com/search.json", params=self._get_params(), timeout=10)
+            return self._format_results(search_results, max_results)
+        except Exception as e:
+            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            return []
+
+    def _get_params(self):
         search_query = self.query
         if self.query_domains:
             # Add site:domain1 OR site:domain2 OR ... to the search query
             search_query += " site:" + " OR site:".join(self.query_domains)
 
-        params = {
+        return {
             "q": search_query,
             "api_key": self.api_key
         }
-        encoded_url = url + "?" + urllib.parse.urlencode(params)
-        search_response = []
-        try:
-            response = requests.get(encoded_url, timeout=10)
-            if response.status_code == 200:
-                search_results = response.json()
-                if search_results:
-                    results = search_results["organic_results"]
-                    results_processed = 0
-                    for result in results:
-                        # skip youtube results
-                        if "youtube.com" in result["link"]:
-                            continue
-                        if results_processed >= max_results:
-                            break
-                        search_result = {
-                            "title": result["title"],
-                            "href": result["link"],
-                            "body": result["snippet"],
-                        }
-                        search_response.append(search_result)
-                        results_processed += 1
-        except Exception as e:
-            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
-            search_response = []
 
+    @staticmethod
+    def _format_results(search_results, max_results):
+        search_response = []
+        if search_results:
+            results = search_results["organic_results"]
+            results_processed = 0
+            for result in results:
+                # skip youtube results
+                if "youtube.com" in result["link"]:
+                    continue
+                if results_processed >= max_results:
+                    break
+                search_result = {
+                    "title": result["title"],
+                    "href": result["link"],
+                    "body": result["snippet"],
+                }
+                search_response.append(search_result)
+                results_processed += 1
         return search_response
@@ -5,6 +5,10 @@ import os
 import requests
 import json
 
+from ...utils.http import fetch_json
+
+SERPER_URL = "https://google.serper.dev/search"
+
 
 class SerperSearch():
     """
@@ -44,12 +48,9 @@ class SerperSearch():
         """Useful for general internet search queries using the Serp API."""
 
         # Search the query (see https://serper.dev/playground for the format)
-        url = "https://google.serper.dev/search"
+        url = SERPER_URL
 
-        headers = {
-            'X-API-KEY': self.api_key,
-            'Content-Type': 'application/json'
-        }
+        headers = self._get_headers()
 
         # TODO: Add support for query domains
         data = json.dumps({"q": self.query, "num": max_results})
@@ -66,6 +67,38 @@ class SerperSearch():
         if search_results is None:
             return
 
+        return self._format_results(search_results)
+
+    async def asearch(self, max_results=7):
+        """
+        Searches the query through the shared pooled HTTP session
+        Returns:
+
+        """
+        print("Searching with query {0}...".format(self.query))
+        try:
+            search_results = await fetch_json(
+                SERPER_URL,
+                method="POST",
+                json={"q": self.query, "num": max_results},
+                headers=self._get_headers(),
+                timeout=10,
+            )
+        except Exception:
+            return
+        if search_results is None:
+            return
+
+        return self._format_results(search_results)
+
+    def _get_headers(self):
+        return {
+            'X-API-KEY': self.api_key,
+            'Content-Type': 'application/json'
+        }
+
+    @staticmethod
+    def _format_results(search_results):
         results = search_results["organic"]
         search_results = []
 
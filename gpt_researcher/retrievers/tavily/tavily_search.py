@@ -6,6 +6,8 @@ from typing import Literal, Sequence, Optional
 import requests
 import json
 
+from ...utils.http import fetch_json
+
 
 class TavilySearch:
     """
@@ -50,7 +52,7 @@ class TavilySearch:
         return api_key
 
 
-    def _search(
+    def _get_payload(
         self,
         query: str,
         search_depth: Literal["basic", "advanced"] = "basic",
@@ -65,10 +67,9 @@ class TavilySearch:
         use_cache: bool = True,
     ) -> dict:
         """
-        Internal search method to send the request to the API.
+        Builds the request body sent to the API.
         """
-
-        data = {
+        return {
             "query": query,
             "search_depth": search_depth,
             "topic": topic,
@@ -83,6 +84,11 @@ class TavilySearch:
             "use_cache": use_cache,
         }
 
+    def _search(self, query: str, **kwargs) -> dict:
+        """
+        Internal search method to send the request to the API. See `_get_payload` for the arguments.
+        """
+        data = self._get_payload(query, **kwargs)
         response = requests.post(
             self.base_url, data=json.dumps(data), headers=self.headers, timeout=100
         )
@@ -93,6 +99,25 @@ class TavilySearch:
             # Raises a HTTPError if the HTTP request returned an unsuccessful status code
             response.raise_for_status()
 
+    async def _asearch(self, query: str, **kwargs) -> dict:
+        """
+        Async version of `_search`, sent through the shared pooled HTTP session.
+        """
+        return await fetch_json(
+            self.base_url,
+            method="POST",
+            json=self._get_payload(query, **kwargs),
+            headers=self.headers,
+            timeout=100,
+        )
+
+    @staticmethod
+    def _format_results(results: dict) -> list[dict]:
+        sources = results.get("results", [])
+        if not sources:
+            raise Exception("No results found with Tavily API search.")
+        return [{"href": obj["url"], "body": obj["content"]} for obj in sources]
+
     def search(self, max_results=10):
         """
         Searches the query
@@ -108,13 +133,28 @@ class TavilySearch:
                 topic=self.topic,
                 include_domains=self.query_domains,
             )
-            sources = results.get("results", [])
-            if not sources:
-                raise Exception("No results found with Tavily API search.")
             # Return the results
-            search_response = [
-                {"href": obj["url"], "body": obj["content"]} for obj in sources
-            ]
+            search_response = self._format_results(results)
+        except Exception as e:
+            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+        return search_response
+
+    async def asearch(self, max_results=10):
+        """
+        Searches the query without blocking the event loop
+        Returns:
+
+        """
+        try:
+            results = await self._asearch(
+                self.query,
+                search_depth="basic",
+                max_results=max_results,
+                topic=self.topic,
+                include_domains=self.query_domains,
+            )
+            search_response = self._format_results(results)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
@@ -0,0 +1,84 @@
+"""
+Resources shared by the researchers of a run.
+
+Detailed reports, deep research and the multi agent workflow spawn a `GPTResearcher` per
+subtopic or query. Passing them the runtime of the researcher that spawned them means the
+configuration is parsed once and the embeddings client, retriever classes and scraper worker
+pool are built once per run instead of once per child, and a page found by several of them
+is only fetched once. LLM clients and caches are already shared process-wide.
+"""
+import copy
+import json
+from typing import Any, Dict, List
+
+from .config import Config
+from .memory import Memory
+from .memory.cache import get_embedding_cache
+from .utils.urls import canonicalize_url
+from .utils.workers import WorkerPool
+
+
+class ResearchRuntime:
+    """Heavyweight resources shared by a researcher and the researchers it spawns."""
+
+    def __init__(self, config_path: str | None = None, cfg: Config | None = None):
+        self.cfg = cfg or Config(config_path)
+        self._memory: Memory | None = None
+        self._worker_pool: WorkerPool | None = None
+        self._retrievers: Dict[str, List[Any]] = {}
+        # Pages scraped in this run by canonical url, so a page found again is reused instead of fetched
+        self._scraped_pages: Dict[str, Dict[str, Any]] = {}
+
+    def config(self) -> Config:
+        """A copy of the run's configuration, so researchers can't change each other's."""
+        return copy.copy(self.cfg)
+
+    @property
+    def memory(self) -> Memory:
+        """The embeddings client of the run."""
+        if self._memory is None:
+            self._memory = Memory(
+                self.cfg.embedding_provider,
+                self.cfg.embedding_model,
+                embedding_cache=(
+                    get_embedding_cache(self.cfg.cache_dir, self.cfg.embedding_cache_size)
+                    if self.cfg.embedding_cache else None
+                ),
+                batch_wait_ms=self.cfg.embedding_batch_wait_ms,
+                **self.cfg.embedding_kwargs,
+            )
+        return self._memory
+
+    @property
+    def worker_pool(self) -> WorkerPool:
+        """The scraper worker pool of the run, which also caps concurrent scraping across researchers."""
+        if self._worker_pool is None:
+            self._worker_pool = WorkerPool(
+                self.cfg.max_scraper_workers,
+                process_workers=self.cfg.scraper_process_workers,
+            )
+        return self._worker_pool
+
+    def get_retrievers(self, headers: Dict[str, str]) -> List[Any]:
+        """The retriever classes for the request headers."""
+        from .actions import get_retrievers
+
+        key = json.dumps(headers, sort_keys=True, default=str)
+        if key not in self._retrievers:
+            self._retrievers[key] = get_retrievers(headers, self.cfg)
+        return self._retrievers[key]
+
+    def get_scraped_page(self, url: str) -> Dict[str, Any] | None:
+        """The page scraped from this url, or another url of the same page, earlier in the run."""
+        return self._scraped_pages.get(canonicalize_url(url))
+
+    def add_scraped_page(self, page: Dict[str, Any]) -> None:
+        """Keep a scraped page for the researchers that find it later in the run."""
+        if page.get("url") and page.get("raw_content"):
+            self._scraped_pages.setdefault(canonicalize_url(page["url"]), page)
+
+    def close(self) -> None:
+        """Shut down the worker pool's threads. A new pool is started if the runtime scrapes again."""
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
+            self._worker_pool = None
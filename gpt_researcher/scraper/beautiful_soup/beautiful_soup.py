@@ -1,19 +1,54 @@
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import asyncio
 
-from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
+from ..utils import extract_html
+from ...utils.http import fetch_url
 
 class BeautifulSoupScraper:
 
+    # Keyword arguments of `extract_html` used to parse pages of this scraper
+    EXTRACT_OPTIONS = {"parser": "lxml", "clean": True}
+
     def __init__(self, link, session=None):
         self.link = link
         self.session = session
 
+    def _headers(self, headers: dict | None = None) -> dict:
+        user_agent = self.session.headers.get("User-Agent") if self.session else None
+        return {**({"User-Agent": user_agent} if user_agent else {}), **(headers or {})}
+
+    def fetch(self, headers: dict | None = None) -> tuple:
+        """
+        Fetch the raw page with a GET request.
+
+        Args:
+          headers: Extra request headers, e.g. the validators of a cached copy for a conditional GET.
+
+        Returns:
+          A tuple of the status code, response headers, raw body and encoding of the response.
+        """
+        response = self.session.get(self.link, timeout=4, headers=headers)
+        return response.status_code, response.headers, response.content, response.encoding
+
+    async def afetch(self, headers: dict | None = None) -> tuple:
+        """
+        Fetch the raw page through the shared pooled async HTTP session, see `fetch`.
+        """
+        return await fetch_url(self.link, headers=self._headers(headers), timeout=4)
+
+    def parse(self, content: bytes, encoding: str | None) -> tuple:
+        """
+        Parse a fetched page, removing script, style and navigation elements.
+
+        Returns:
+          A tuple of the cleaned text content, relevant image urls and the page title.
+        """
+        return extract_html(content, encoding, self.link, **self.EXTRACT_OPTIONS)
+
     def scrape(self):
         """
         This function scrapes content from a webpage by making a GET request, parsing the HTML using
         BeautifulSoup, and extracting script and style elements before returning the cleaned content.
-        
+
         Returns:
           The `scrape` method is returning the cleaned and extracted content from the webpage specified
         by the `self.link` attribute. The method fetches the webpage content, removes script and style
@@ -21,22 +56,22 @@ class BeautifulSoupScraper:
         occurs during the process, an error message is printed and an empty string is returned.
         """
         try:
-            response = self.session.get(self.link, timeout=4)
-            soup = BeautifulSoup(
-                response.content, "lxml", from_encoding=response.encoding
-            )
-
-            soup = clean_soup(soup)
+            _, _, content, encoding = self.fetch()
+            return self.parse(content, encoding)
 
-            content = get_text_from_soup(soup)
-
-            image_urls = get_relevant_images(soup, self.link)
-            
-            # Extract the title using the utility function
-            title = extract_title(soup)
+        except Exception as e:
+            print("Error! : " + str(e))
+            return "", [], ""
 
-            return content, image_urls, title
+    async def scrape_async(self):
+        """
+        Async version of `scrape`: the page is fetched without blocking a thread, and only the
+        CPU-bound parsing is handed to a worker thread.
+        """
+        try:
+            _, _, content, encoding = await self.afetch()
+            return await asyncio.to_thread(self.parse, content, encoding)
 
         except Exception as e:
             print("Error! : " + str(e))
-            return "", [], ""
\ No newline at end of file
+            return "", [], ""
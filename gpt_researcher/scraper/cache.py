@@ -0,0 +1,85 @@
+import os
+import time
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ..utils.cache import TieredCache, get_shared_cache, hash_key
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalise a url so that trivially different spellings of the same page share a cache entry.
+
+    Lowercases the scheme and host, drops default ports and fragments, and sorts query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    host, _, port = netloc.rpartition(":")
+    if host and _DEFAULT_PORTS.get(scheme) == port:
+        netloc = host
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+class ScrapeCache:
+    """
+    Disk-backed cache of scraped pages keyed by normalised url.
+
+    Every entry holds the extracted `raw_content`, `image_urls` and `title` together with the
+    ETag / Last-Modified validators of the response. Entries younger than `ttl` are served
+    without touching the network; older entries with validators are revalidated with a
+    conditional GET, and a `304 Not Modified` reuses the stored extraction without parsing.
+
+    Args:
+        cache_dir: Directory for the persistent SQLite tier. If empty, pages are only cached in memory.
+        ttl: Number of seconds an entry is served without revalidation.
+        max_size: Number of pages kept in the in-memory LRU tier.
+    """
+
+    def __init__(self, cache_dir: str | None, ttl: float = 86400, max_size: int = 256):
+        self.ttl = ttl
+        path = os.path.join(cache_dir, "scrape.sqlite") if cache_dir else None
+        # Stale entries are kept so they can still be revalidated
+        self.store: TieredCache = get_shared_cache(path, table="scrape", max_size=max_size)
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hash_key(normalize_url(url))
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        return self.store.get(self.key(url))
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry.get("fetched_at", 0) <= self.ttl
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Request headers that revalidate a cached entry, empty if it has no validators."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def set(self, url: str, page: Dict[str, Any], response_headers: Mapping[str, str] | None = None) -> None:
+        """Store a scraped page along with the validators of the response it came from."""
+        response_headers = response_headers or {}
+        if "no-store" in response_headers.get("Cache-Control", "").lower():
+            return
+        self.store.set(self.key(url), {
+            "raw_content": page["raw_content"],
+            "image_urls": page.get("image_urls", []),
+            "title": page.get("title", ""),
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        })
+
+    def touch(self, url: str, entry: Dict[str, Any]) -> None:
+        """Mark an entry as fresh again after the server confirmed it is unchanged."""
+        self.store.set(self.key(url), {**entry, "fetched_at": time.time()})
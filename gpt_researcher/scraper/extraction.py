@@ -0,0 +1,101 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .utils import extract_html
+
+# (raw body, encoding, url, keyword arguments of `extract_html`)
+Page = Tuple[bytes, Optional[str], str, Dict[str, Any]]
+
+
+def extract_batch(pages: List[Page]) -> List[Any]:
+    """
+    Extract a batch of pages inside a worker process.
+
+    Failures are returned in place of the result rather than raised, so one broken page does
+    not fail the rest of its batch.
+    """
+    results = []
+    for content, encoding, url, options in pages:
+        try:
+            results.append(extract_html(content, encoding, url, **options))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+class _Batch:
+    def __init__(self):
+        self.pages: List[Page] = []
+        self.full = asyncio.Event()
+        self.done = asyncio.get_running_loop().create_future()
+
+
+class ExtractionBatcher:
+    """
+    Sends HTML extraction to a process pool in small batches.
+
+    Parsing with BeautifulSoup is CPU-bound and serialised by the GIL when run in threads. Pages
+    fetched within `wait` seconds of each other are grouped, up to `max_batch_size` pages, and
+    extracted by one worker process, so the IPC round trip is paid once per batch rather than once
+    per page.
+
+    Args:
+        executor: Process pool the batches are sent to.
+        max_batch_size: A batch is dispatched early once it holds this many pages.
+        wait: How long in seconds a batch stays open for more pages.
+    """
+
+    def __init__(self, executor: Executor, max_batch_size: int = 8, wait: float = 0.01):
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.wait = wait
+        self._batch: Optional[_Batch] = None
+        self._dispatches: Set[asyncio.Task] = set()
+
+    async def extract(
+        self, content: bytes, encoding: str | None, url: str, options: Dict[str, Any] | None = None
+    ) -> tuple[str, list, str]:
+        """
+        Extract a page's text, relevant images and title in a worker process.
+        """
+        batch = self._batch
+        if batch is None:
+            batch = self._batch = _Batch()
+            # Sent from its own task, so cancelling the caller that opened the batch does not
+            # fail the pages of the others
+            dispatch = asyncio.ensure_future(self._dispatch(batch))
+            self._dispatches.add(dispatch)
+            dispatch.add_done_callback(self._dispatches.discard)
+        index = len(batch.pages)
+        batch.pages.append((content, encoding, url, options or {}))
+        if len(batch.pages) >= self.max_batch_size:
+            self._batch = None
+            batch.full.set()
+
+        results = await asyncio.shield(batch.done)
+
+        result = results[index]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def _dispatch(self, batch: _Batch) -> None:
+        try:
+            try:
+                await asyncio.wait_for(batch.full.wait(), self.wait)
+            except asyncio.TimeoutError:
+                pass
+            if self._batch is batch:
+                self._batch = None
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.executor, extract_batch, batch.pages
+            )
+            batch.done.set_result(results)
+        except asyncio.CancelledError:
+            if self._batch is batch:
+                self._batch = None
+            batch.done.cancel()
+            raise
+        except Exception as e:
+            batch.done.set_exception(e)
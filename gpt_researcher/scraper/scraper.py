@@ -9,6 +9,8 @@ import logging
 
 from gpt_researcher.utils.workers import WorkerPool
 
+from .cache import ScrapeCache
+from .extraction import ExtractionBatcher
 from . import (
     ArxivScraper,
     BeautifulSoupScraper,
@@ -26,11 +28,12 @@ class Scraper:
     Scraper class to extract the content from the links
     """
 
-    def __init__(self, urls, user_agent, scraper, worker_pool: WorkerPool):
+    def __init__(self, urls, user_agent, scraper, worker_pool: WorkerPool, cache: ScrapeCache | None = None):
         """
         Initialize the Scraper class.
         Args:
             urls:
+            cache: Optional scrape cache used to skip or revalidate previously scraped urls.
         """
         self.urls = urls
         self.session = requests.Session()
@@ -42,6 +45,11 @@ class Scraper:
             self._check_pkg(self.scraper)
         self.logger = logging.getLogger(__name__)
         self.worker_pool = worker_pool
+        self.cache = cache
+        self.extractor = (
+            ExtractionBatcher(worker_pool.process_executor)
+            if worker_pool.process_executor is not None else None
+        )
 
     async def run(self):
         """
@@ -54,6 +62,26 @@ class Scraper:
         res = [content for content in contents if content["raw_content"] is not None]
         return res
 
+    async def stream(self):
+        """
+        Extracts the content from the links, yielding every page as soon as it is scraped
+        instead of waiting for the slowest one. Closing the generator early cancels the
+        scrapes that are still running.
+        """
+        tasks = [
+            asyncio.create_task(self.extract_data_from_url(url, self.session))
+            for url in self.urls
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                content = await next_done
+                if content["raw_content"] is not None:
+                    yield content
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     def _check_pkg(self, scrapper_name: str) -> None:
         """
         Checks and ensures required Python packages are available for scrapers that need
@@ -91,64 +119,113 @@ class Scraper:
         """
         Extracts the data from the link with logging
         """
-        async with self.worker_pool.throttle():
-            try:
-                Scraper = self.get_scraper(link)
-                scraper = Scraper(link, session)
-
-                # Get scraper name
-                scraper_name = scraper.__class__.__name__
-                self.logger.info(f"\n=== Using {scraper_name} ===")
-
-                # Get content
-                if hasattr(scraper, "scrape_async"):
-                    content, image_urls, title = await scraper.scrape_async()
-                else:
-                    (
-                        content,
-                        image_urls,
-                        title,
-                    ) = await asyncio.get_running_loop().run_in_executor(
-                        self.worker_pool.executor, scraper.scrape
-                    )
+        try:
+            Scraper = self.get_scraper(link)
+            scraper = Scraper(link, session)
 
-                if len(content) < 100:
-                    self.logger.warning(f"Content too short or empty for {link}")
-                    return {
-                        "url": link,
-                        "raw_content": None,
-                        "image_urls": [],
-                        "title": title,
-                    }
-
-                # Log results
-                self.logger.info(f"\nTitle: {title}")
-                self.logger.info(
-                    f"Content length: {len(content) if content else 0} characters"
-                )
-                self.logger.info(f"Number of images: {len(image_urls)}")
-                self.logger.info(f"URL: {link}")
-                self.logger.info("=" * 50)
-
-                if not content or len(content) < 100:
-                    self.logger.warning(f"Content too short or empty for {link}")
-                    return {
-                        "url": link,
-                        "raw_content": None,
-                        "image_urls": [],
-                        "title": title,
-                    }
+            # Get scraper name
+            scraper_name = scraper.__class__.__name__
+            self.logger.info(f"\n=== Using {scraper_name} ===")
+
+            # Get content
+            content, image_urls, title, response_headers = await self._scrape(scraper, link)
+
+            if len(content) < 100:
+                self.logger.warning(f"Content too short or empty for {link}")
+                return {
+                    "url": link,
+                    "raw_content": None,
+                    "image_urls": [],
+                    "title": title,
+                }
+
+            # Log results
+            self.logger.info(f"\nTitle: {title}")
+            self.logger.info(
+                f"Content length: {len(content) if content else 0} characters"
+            )
+            self.logger.info(f"Number of images: {len(image_urls)}")
+            self.logger.info(f"URL: {link}")
+            self.logger.info("=" * 50)
 
+            if not content or len(content) < 100:
+                self.logger.warning(f"Content too short or empty for {link}")
                 return {
                     "url": link,
-                    "raw_content": content,
-                    "image_urls": image_urls,
+                    "raw_content": None,
+                    "image_urls": [],
                     "title": title,
                 }
 
-            except Exception as e:
-                self.logger.error(f"Error processing {link}: {str(e)}")
-                return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
+            page = {
+                "url": link,
+                "raw_content": content,
+                "image_urls": image_urls,
+                "title": title,
+            }
+            if self.cache is not None and response_headers is not None:
+                await asyncio.get_running_loop().run_in_executor(
+                    self.worker_pool.executor, self.cache.set, link, page, response_headers
+                )
+            return page
+
+        except Exception as e:
+            self.logger.error(f"Error processing {link}: {str(e)}")
+            return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
+
+    async def _scrape(self, scraper, link) -> tuple:
+        """
+        Get the content, images and title of a link, going through the scrape cache when enabled.
+
+        Scrapers exposing `afetch`/`fetch` and `parse` are driven step by step, so that stale cache
+        entries are revalidated with a conditional GET and a `304 Not Modified` skips parsing entirely.
+        Async fetches are only bounded by the shared connection pool, while thread-bound scrapers are
+        throttled by the worker pool.
+
+        Returns:
+          A tuple of content, image urls, title and the response headers to cache the page with,
+          which is None when the page should not be (re-)cached.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self.worker_pool.executor
+
+        entry = None
+        if self.cache is not None:
+            entry = await loop.run_in_executor(executor, self.cache.get, link)
+            if entry and self.cache.is_fresh(entry):
+                self.logger.info(f"Scrape cache hit for {link}")
+                return entry["raw_content"], entry["image_urls"], entry["title"], None
+
+        if hasattr(scraper, "afetch") or hasattr(scraper, "fetch"):
+            headers = ScrapeCache.conditional_headers(entry) or None
+            if hasattr(scraper, "afetch"):
+                # Bounded by the shared connection pool rather than by worker threads
+                status, response_headers, body, encoding = await scraper.afetch(headers)
+            else:
+                async with self.worker_pool.throttle():
+                    status, response_headers, body, encoding = await loop.run_in_executor(
+                        executor, scraper.fetch, headers
+                    )
+            if status == 304 and entry:
+                self.logger.info(f"Scrape cache revalidated for {link}")
+                await loop.run_in_executor(executor, self.cache.touch, link, entry)
+                return entry["raw_content"], entry["image_urls"], entry["title"], None
+            if self.extractor is not None and hasattr(scraper, "EXTRACT_OPTIONS"):
+                content, image_urls, title = await self.extractor.extract(
+                    body, encoding, link, scraper.EXTRACT_OPTIONS
+                )
+            else:
+                content, image_urls, title = await loop.run_in_executor(
+                    executor, scraper.parse, body, encoding
+                )
+            return content, image_urls, title, response_headers if status == 200 else None
+
+        async with self.worker_pool.throttle():
+            if hasattr(scraper, "scrape_async"):
+                content, image_urls, title = await scraper.scrape_async()
+            else:
+                content, image_urls, title = await loop.run_in_executor(executor, scraper.scrape)
+        return content, image_urls, title, {}
 
     def get_scraper(self, link):
         """
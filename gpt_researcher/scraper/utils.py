@@ -121,4 +121,21 @@ def get_text_from_soup(soup: BeautifulSoup) -> str:
     text = soup.get_text(strip=True, separator="\n")
     # Remove excess whitespace
     text = re.sub(r"\s{2,}", " ", text)
-    return text
\ No newline at end of file
+    return text
+
+
+def extract_html(
+    content: bytes, encoding: str | None, url: str, parser: str = "lxml", clean: bool = True
+) -> tuple[str, list, str]:
+    """Parse raw html and return its text, relevant images and title.
+
+    With `clean`, navigation, scripts and styles are removed and whitespace is collapsed,
+    otherwise the plain text of the whole document is returned.
+    """
+    soup = BeautifulSoup(content, parser, from_encoding=encoding)
+    if clean:
+        soup = clean_soup(soup)
+        text = get_text_from_soup(soup)
+    else:
+        text = soup.get_text()
+    return text, get_relevant_images(soup, url), extract_title(soup)
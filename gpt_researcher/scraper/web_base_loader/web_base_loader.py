@@ -1,42 +1,68 @@
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import asyncio
+
 import requests
-from ..utils import get_relevant_images, extract_title
+from ..utils import extract_html
+from ...utils.http import fetch_url
 
 class WebBaseLoaderScraper:
 
+    # Keyword arguments of `extract_html`, matching the plain text extraction of LangChain's WebBaseLoader
+    EXTRACT_OPTIONS = {"parser": "html.parser", "clean": False}
+
     def __init__(self, link, session=None):
         self.link = link
         self.session = session or requests.Session()
 
+    def fetch(self, headers: dict | None = None) -> tuple:
+        """
+        Fetch the raw page with a GET request. Certificates are not verified, as with WebBaseLoader.
+
+        Returns:
+          A tuple of the status code, response headers, raw body and encoding of the response.
+        """
+        response = self.session.get(self.link, headers=headers, verify=False)
+        return response.status_code, response.headers, response.content, response.encoding
+
+    async def afetch(self, headers: dict | None = None) -> tuple:
+        """
+        Fetch the raw page through the shared pooled async HTTP session, see `fetch`.
+        """
+        user_agent = self.session.headers.get("User-Agent")
+        headers = {**({"User-Agent": user_agent} if user_agent else {}), **(headers or {})}
+        return await fetch_url(self.link, headers=headers, verify_ssl=False)
+
+    def parse(self, content: bytes, encoding: str | None) -> tuple:
+        """
+        Parse a fetched page into its text content, relevant image urls and title.
+        """
+        return extract_html(content, encoding, self.link, **self.EXTRACT_OPTIONS)
+
     def scrape(self) -> tuple:
         """
-        This Python function scrapes content from a webpage using a WebBaseLoader object and returns the
-        concatenated page content.
-        
+        This Python function scrapes content from a webpage and returns its page content, images and
+        title. The page is fetched once and parsed the same way LangChain's `WebBaseLoader` does.
+
         Returns:
           The `scrape` method is returning a string variable named `content` which contains the
-        concatenated page content from the documents loaded by the `WebBaseLoader`. If an exception
-        occurs during the process, an error message is printed and an empty string is returned.
+        page content of the webpage. If an exception occurs during the process, an error message is
+        printed and an empty string is returned.
+        """
+        try:
+            _, _, content, encoding = self.fetch()
+            return self.parse(content, encoding)
+
+        except Exception as e:
+            print("Error! : " + str(e))
+            return "", [], ""
+
+    async def scrape_async(self) -> tuple:
+        """
+        Async version of `scrape`: the page is fetched without blocking a thread, and only the
+        CPU-bound parsing is handed to a worker thread.
         """
         try:
-            from langchain_community.document_loaders import WebBaseLoader
-            loader = WebBaseLoader(self.link)
-            loader.requests_kwargs = {"verify": False}
-            docs = loader.load()
-            content = ""
-
-            for doc in docs:
-                content += doc.page_content
-
-            response = self.session.get(self.link)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            image_urls = get_relevant_images(soup, self.link)
-            
-            # Extract the title using the utility function
-            title = extract_title(soup)
-
-            return content, image_urls, title
+            _, _, content, encoding = await self.afetch()
+            return await asyncio.to_thread(self.parse, content, encoding)
 
         except Exception as e:
             print("Error! : " + str(e))
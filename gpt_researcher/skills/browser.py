@@ -1,8 +1,11 @@
-from gpt_researcher.utils.workers import WorkerPool
+import asyncio
+from typing import AsyncIterator
 
 from ..actions.utils import stream_output
-from ..actions.web_scraping import scrape_urls
+from ..actions.web_scraping import scrape_urls, stream_urls
+from ..context.dedup import NearDuplicateIndex
 from ..scraper.utils import get_image_hash
+from ..utils.urls import URLIndex
 
 
 class BrowserManager:
@@ -10,7 +13,20 @@ class BrowserManager:
 
     def __init__(self, researcher):
         self.researcher = researcher
-        self.worker_pool = WorkerPool(researcher.cfg.max_scraper_workers)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the pages of the previous research."""
+        # Pages of the current research by canonical url and content
+        self.url_index = URLIndex()
+        # Pages whose text nearly duplicates a page of the current research are dropped too
+        threshold = getattr(self.researcher.cfg, "near_duplicate_threshold", 0)
+        self.near_duplicates = NearDuplicateIndex(threshold) if threshold else None
+
+    @property
+    def worker_pool(self):
+        # Looked up on every use, so a closed runtime starts a new pool if it scrapes again
+        return self.researcher.runtime.worker_pool
 
     async def browse_urls(self, urls: list[str]) -> list[dict]:
         """
@@ -30,9 +46,94 @@ class BrowserManager:
                 self.researcher.websocket,
             )
 
+        reused, urls = await self._reuse_scraped_pages(urls)
         scraped_content, images = await scrape_urls(
             urls, self.researcher.cfg, self.worker_pool
-        )
+        ) if urls else ([], [])
+        for page in scraped_content:
+            self.researcher.runtime.add_scraped_page(page)
+        for page in reused:
+            images.extend(page.get("image_urls", []))
+        scraped_content = [page for page in reused + scraped_content if await self._is_new_content(page)]
+        await self._add_scraped_content(scraped_content, images)
+        return scraped_content
+
+    async def stream_urls(self, urls: list[str]) -> AsyncIterator[dict]:
+        """
+        Scrape content from a list of URLs, yielding every page as soon as it is scraped.
+
+        The pages yielded before the generator is exhausted or closed are added to the research
+        sources, just like `browse_urls` does for all of them.
+
+        Args:
+            urls (list[str]): list of URLs to scrape.
+
+        Yields:
+            dict: scraped content of a single page.
+        """
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "scraping_urls",
+                f"🌐 Scraping content from {len(urls)} URLs...",
+                self.researcher.websocket,
+            )
+
+        reused, urls = await self._reuse_scraped_pages(urls)
+        scraped_content, images = [], []
+        try:
+            for page in reused:
+                if await self._is_new_content(page):
+                    scraped_content.append(page)
+                    images.extend(page.get("image_urls", []))
+                    yield page
+            if urls:
+                async for page in stream_urls(urls, self.researcher.cfg, self.worker_pool):
+                    self.researcher.runtime.add_scraped_page(page)
+                    if not await self._is_new_content(page):
+                        continue
+                    scraped_content.append(page)
+                    images.extend(page.get("image_urls", []))
+                    yield page
+        finally:
+            await self._add_scraped_content(scraped_content, images)
+
+    async def _reuse_scraped_pages(self, urls: list[str]) -> tuple[list[dict], list[str]]:
+        """Split urls into the pages other researchers of the run already scraped and the urls left to fetch."""
+        reused, remaining = [], []
+        for url in urls:
+            page = self.researcher.runtime.get_scraped_page(url)
+            if page is not None:
+                reused.append(page)
+            else:
+                remaining.append(url)
+        if reused and self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "reusing_scraped_pages",
+                f"♻️ Reusing {len(reused)} pages already scraped in this run",
+                self.researcher.websocket,
+            )
+        return reused, remaining
+
+    async def _is_new_content(self, page: dict) -> bool:
+        """Whether a page's content wasn't already scraped, or nearly so, from another url in this research."""
+        url, content = page.get("url", ""), page.get("raw_content")
+        if not self.url_index.add_content(url, content):
+            return False
+        if self.near_duplicates is None or not content:
+            return True
+        duplicate = await asyncio.to_thread(self.near_duplicates.add, url, content)
+        if duplicate is not None and self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "near_duplicate_page",
+                f"🧹 Skipped {url}, a near-duplicate of {duplicate}",
+                self.researcher.websocket,
+            )
+        return duplicate is None
+
+    async def _add_scraped_content(self, scraped_content: list[dict], images: list[dict]) -> None:
         self.researcher.add_research_sources(scraped_content)
         new_images = self.select_top_images(images, k=4)  # Select top 4 images
         self.researcher.add_research_images(new_images)
@@ -59,8 +160,6 @@ class BrowserManager:
                 self.researcher.websocket,
             )
 
-        return scraped_content
-
     def select_top_images(self, images: list[dict], k: int = 2) -> list[str]:
         """
         Select most relevant images and remove duplicates based on image content.
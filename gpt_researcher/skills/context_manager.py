@@ -1,7 +1,13 @@
 import asyncio
-from typing import List, Dict, Optional, Set
+import os
+from typing import AsyncIterator, List, Dict, Optional, Set
+
+from langchain_core.documents import Document
 
 from ..context.compression import ContextCompressor, WrittenContentCompressor, VectorstoreCompressor
+from ..context.chunk_store import ChunkStore
+from ..context.records import ChunkRecord, ResearchContext
+from ..context.selection import merge_chunks
 from ..actions.utils import stream_output
 
 
@@ -10,8 +16,31 @@ class ContextManager:
 
     def __init__(self, researcher):
         self.researcher = researcher
+        self.chunk_store: Optional[ChunkStore] = None
+        if getattr(researcher.cfg, "chunk_store", False):
+            self.chunk_store = ChunkStore(
+                self.researcher.memory.get_embeddings(),
+                near_duplicate_threshold=getattr(researcher.cfg, "near_duplicate_threshold", 0),
+            )
 
     async def get_similar_content_by_query(self, query, pages):
+        documents = await self.get_similar_documents_by_query(query, pages)
+        return self.researcher.prompt_family.pretty_print_docs(documents)
+
+    async def get_similar_content_by_queries(self, queries: List[str], pages_per_query: List[List[Dict]]) -> List[str]:
+        """
+        Get the formatted relevant content for several queries at once.
+
+        Returns:
+            List[str]: The formatted relevant content for each query.
+        """
+        results = await self.get_similar_documents_by_queries(queries, pages_per_query)
+        return [self.researcher.prompt_family.pretty_print_docs(documents) for documents in results]
+
+    async def get_similar_documents_by_query(self, query, pages, max_results: int = 10) -> List[Document]:
+        if self.chunk_store is not None:
+            return (await self.get_similar_documents_by_queries([query], [pages], max_results))[0]
+
         if self.researcher.verbose:
             await stream_output(
                 "logs",
@@ -24,11 +53,177 @@ class ContextManager:
             documents=pages,
             embeddings=self.researcher.memory.get_embeddings(),
             prompt_family=self.researcher.prompt_family,
+            near_duplicate_threshold=getattr(self.researcher.cfg, "near_duplicate_threshold", 0),
+        )
+        return await context_compressor.async_get_documents(
+            query=query, max_results=max_results, cost_callback=self.researcher.add_costs
+        )
+
+    async def get_similar_documents_by_queries(
+        self, queries: List[str], pages_per_query: List[List[Dict]], max_results: int = 10
+    ) -> List[List[Document]]:
+        """
+        Get the relevant chunks for several queries at once from the run's chunk store.
+
+        Every page is split and embedded once, then all queries are scored together, each one
+        restricted to the pages that were gathered for it.
+
+        Args:
+            queries (List[str]): The queries to get content for.
+            pages_per_query (List[List[Dict]]): The scraped pages gathered for each query.
+            max_results (int): Maximum number of chunks per query.
+
+        Returns:
+            List[List[Document]]: The relevant chunks for each query, most relevant first.
+        """
+        if self.chunk_store is None:
+            return list(await asyncio.gather(*[
+                self.get_similar_documents_by_query(query, pages, max_results)
+                for query, pages in zip(queries, pages_per_query)
+            ]))
+
+        if self.researcher.verbose:
+            for query in queries:
+                await stream_output(
+                    "logs",
+                    "fetching_query_content",
+                    f"📚 Getting relevant content based on query: {query}...",
+                    self.researcher.websocket,
+                )
+
+        dropped = self.chunk_store.dropped_chunks
+        await self.chunk_store.add_pages(
+            [page for pages in pages_per_query for page in pages],
+            cost_callback=self.researcher.add_costs,
+        )
+        dropped = self.chunk_store.dropped_chunks - dropped
+        if dropped and self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "near_duplicate_chunks",
+                f"🧹 Skipped embedding {dropped} near-duplicate chunks",
+                self.researcher.websocket,
+            )
+        results = await self.chunk_store.similarity_search_many(
+            queries,
+            k=max_results,
+            similarity_threshold=_similarity_threshold(),
+            sources=[{page.get("url", "") for page in pages} for pages in pages_per_query],
         )
-        return await context_compressor.async_get_context(
-            query=query, max_results=10, cost_callback=self.researcher.add_costs
+        return [[doc for doc, _ in docs] for docs in results]
+
+    async def merge_documents(self, queries: List[str], results: List[List[Document]]) -> ResearchContext:
+        """
+        Merge the relevant chunks of several queries into one research context.
+
+        Every chunk is kept once. With a `CONTEXT_CHUNK_BUDGET`, at most that many chunks are
+        kept, selected by maximal marginal relevance when they come from the chunk store.
+
+        Args:
+            queries (List[str]): The queries the chunks were found for.
+            results (List[List[Document]]): The relevant chunks of each query, most relevant first.
+
+        Returns:
+            ResearchContext: The merged chunks, with their relevance when they come from the chunk store.
+        """
+        found = sum(len(documents) for documents in results)
+        documents = merge_chunks(results)
+        budget = getattr(self.researcher.cfg, "context_chunk_budget", 0)
+        if budget and len(documents) > budget:
+            if self.chunk_store is not None:
+                documents = await self.chunk_store.select_diverse(
+                    documents, queries, budget, getattr(self.researcher.cfg, "context_mmr_lambda", 0.7)
+                )
+            else:
+                documents = documents[:budget]
+        if self.researcher.verbose and len(documents) < found:
+            await stream_output(
+                "logs",
+                "merged_context",
+                f"🧩 Kept {len(documents)} of the {found} chunks found for {len(queries)} queries",
+                self.researcher.websocket,
+            )
+
+        scores = [None] * len(documents)
+        if self.chunk_store is not None:
+            scores = [float(score) for score in await self.chunk_store.relevance(documents, queries)]
+        return ResearchContext(
+            [ChunkRecord.from_document(document, score) for document, score in zip(documents, scores)],
+            prompt_family=self.researcher.prompt_family,
         )
 
+    async def add_pages_as_scraped(
+        self, query: str, pages: AsyncIterator[Dict], patience: int = 0, k: int = 10
+    ) -> List[Dict]:
+        """
+        Split and embed pages into the run's chunk store while they are still being scraped.
+
+        Pages that arrive while a batch is being embedded are embedded together in the next batch.
+        With a `patience`, scraping stops early once the query has `k` relevant chunks and its
+        top-k has not changed for `patience` consecutive pages.
+
+        Args:
+            query (str): The query the pages were found for.
+            pages (AsyncIterator[Dict]): The pages, in the order they finish scraping.
+            patience (int): Number of pages that must leave the top-k unchanged before stopping. 0 disables early stopping.
+            k (int): Number of chunks the top-k is made of.
+
+        Returns:
+            List[Dict]: The pages that were consumed.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        async def produce():
+            try:
+                async for page in pages:
+                    queue.put_nowait(page)
+            finally:
+                queue.put_nowait(done)
+
+        producer = asyncio.create_task(produce())
+        consumed: List[Dict] = []
+        top, stable = None, 0
+        try:
+            finished = False
+            while not finished:
+                batch = [await queue.get()]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+                finished = any(page is done for page in batch)
+                batch = [page for page in batch if page is not done]
+                if not batch:
+                    continue
+
+                consumed.extend(batch)
+                await self.chunk_store.add_pages(batch, cost_callback=self.researcher.add_costs)
+                if not patience or finished:
+                    continue
+
+                results = await self.chunk_store.similarity_search_many(
+                    [query],
+                    k=k,
+                    similarity_threshold=_similarity_threshold(),
+                    sources=[{page.get("url", "") for page in consumed}],
+                )
+                current = [doc.metadata["chunk_id"] for doc, _ in results[0]]
+                stable = stable + len(batch) if current == top else 0
+                top = current
+                if len(current) >= k and stable >= patience:
+                    if self.researcher.verbose:
+                        await stream_output(
+                            "logs",
+                            "enough_context",
+                            f"✋ Found enough context for '{query}' after {len(consumed)} pages, skipping the rest...",
+                            self.researcher.websocket,
+                        )
+                    break
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            await pages.aclose()
+        return consumed
+
     async def get_similar_content_by_query_with_vectorstore(self, query, filter):
         if self.researcher.verbose:
             await stream_output(
@@ -82,3 +277,7 @@ class ContextManager:
         return await written_content_compressor.async_get_context(
             query=query, max_results=max_results, cost_callback=self.researcher.add_costs
         )
+
+
+def _similarity_threshold() -> float:
+    return float(os.environ.get("SIMILARITY_THRESHOLD", 0.35))
@@ -2,6 +2,8 @@ from typing import Dict, Optional, List
 import json
 from ..config.config import Config
 from ..utils.llm import create_chat_completion
+from ..utils.llm_cache import get_llm_cache
+from ..utils.rate_limiter import get_rate_limits
 from ..actions import stream_output
 
 
@@ -48,6 +50,8 @@ class SourceCurator:
                 temperature=0.2,
                 max_tokens=8000,
                 llm_provider=self.researcher.cfg.smart_llm_provider,
+                cache=get_llm_cache(self.researcher.cfg),
+                rate_limits=get_rate_limits(self.researcher.cfg),
                 llm_kwargs=self.researcher.cfg.llm_kwargs,
                 cost_callback=self.researcher.add_costs,
             )
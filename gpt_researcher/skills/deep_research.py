@@ -1,11 +1,15 @@
-from typing import List, Dict, Any, Optional, Set
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Set
 import asyncio
+import itertools
 import logging
+import re
 import time
 from datetime import datetime, timedelta
 
 from gpt_researcher.llm_provider.generic.base import ReasoningEfforts
 from ..utils.llm import create_chat_completion
+from ..utils.llm_cache import get_llm_cache
+from ..utils.rate_limiter import get_rate_limits
 from ..utils.enum import ReportType, ReportSource, Tone
 from ..actions.query_processing import get_search_results
 
@@ -45,12 +49,98 @@ class ResearchProgress:
         self.completed_queries = 0
 
 
+def query_terms(query: str) -> Set[str]:
+    """Lowercased words of a query, for comparing queries"""
+    return set(re.findall(r"\w+", query.lower()))
+
+
+class ResearchFrontier:
+    """
+    Priority work queue of deep research queries.
+
+    Work items are planning steps (generating the search queries of a branch) and search
+    queries to research. Items are scheduled as soon as the item they follow from completes,
+    so a branch goes deeper without waiting for its siblings. Search queries nearly identical
+    to one already scheduled are dropped.
+
+    Priorities:
+        depth: Shallower queries first, the most novel first within a level.
+        novelty: The queries least similar to those already scheduled first.
+        budget: Queries with the least remaining depth first, finishing branches before starting new ones.
+    """
+
+    PRIORITIES = ("depth", "novelty", "budget")
+
+    def __init__(self, total_depth: int, priority: str = "depth", similarity_threshold: float = 0.8):
+        if priority not in self.PRIORITIES:
+            logger.warning(f"Unknown deep research priority '{priority}', using 'depth'")
+            priority = "depth"
+        self.total_depth = total_depth
+        self.priority = priority
+        self.similarity_threshold = similarity_threshold
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self.scheduled_queries: List[Set[str]] = []
+        self._order = itertools.count()
+
+    def novelty(self, terms: Set[str]) -> float:
+        """One minus the highest word overlap (Jaccard) with a scheduled search query"""
+        similarities = [len(terms & other) / len(terms | other) for other in self.scheduled_queries if terms | other]
+        return 1.0 - max(similarities, default=0.0)
+
+    def push(self, item: Dict[str, Any]) -> bool:
+        """
+        Schedule a work item with its `kind` ("plan" or "research"), `query` and remaining `depth`.
+
+        Returns:
+            bool: False if the item is a search query nearly identical to one already scheduled.
+        """
+        novelty = 1.0
+        if item["kind"] == "research":
+            terms = query_terms(item["query"])
+            novelty = self.novelty(terms)
+            if novelty <= 1.0 - self.similarity_threshold:
+                logger.info(f"Skipping search query similar to an earlier one: {item['query']}")
+                return False
+            self.scheduled_queries.append(terms)
+
+        level = self.total_depth - item["depth"]
+        if self.priority == "novelty":
+            priority = (-novelty, level)
+        elif self.priority == "budget":
+            priority = (item["depth"], -novelty)
+        else:
+            priority = (level, -novelty)
+        self.queue.put_nowait((priority, next(self._order), item))
+        return True
+
+    async def run(self, handle: Callable[[Dict[str, Any]], Awaitable[None]], concurrency: int) -> None:
+        """Process items with `handle` on `concurrency` workers until no item is queued or running."""
+        async def worker():
+            while True:
+                _, _, item = await self.queue.get()
+                try:
+                    await handle(item)
+                except Exception as e:
+                    logger.error(f"Error processing deep research {item['kind']} '{item['query']}': {str(e)}")
+                finally:
+                    self.queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+        try:
+            await self.queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+
 class DeepResearchSkill:
     def __init__(self, researcher):
         self.researcher = researcher
         self.breadth = getattr(researcher.cfg, 'deep_research_breadth', 4)
         self.depth = getattr(researcher.cfg, 'deep_research_depth', 2)
         self.concurrency_limit = getattr(researcher.cfg, 'deep_research_concurrency', 2)
+        self.priority = getattr(researcher.cfg, 'deep_research_priority', 'depth')
         self.websocket = researcher.websocket
         self.tone = researcher.tone
         self.config_path = researcher.cfg.config_path if hasattr(researcher.cfg, 'config_path') else None
@@ -71,6 +161,8 @@ class DeepResearchSkill:
         response = await create_chat_completion(
             messages=messages,
             llm_provider=self.researcher.cfg.strategic_llm_provider,
+            cache=get_llm_cache(self.researcher.cfg),
+            rate_limits=get_rate_limits(self.researcher.cfg),
             model=self.researcher.cfg.strategic_llm_model,
             reasoning_effort=ReasoningEfforts.Medium.value,
             temperature=0.4
@@ -121,6 +213,8 @@ Format each question on a new line starting with 'Question: '"""}
         response = await create_chat_completion(
             messages=messages,
             llm_provider=self.researcher.cfg.strategic_llm_provider,
+            cache=get_llm_cache(self.researcher.cfg),
+            rate_limits=get_rate_limits(self.researcher.cfg),
             model=self.researcher.cfg.strategic_llm_model,
             reasoning_effort=ReasoningEfforts.High.value,
             temperature=0.4
@@ -142,6 +236,8 @@ Format each question on a new line starting with 'Question: '"""}
         response = await create_chat_completion(
             messages=messages,
             llm_provider=self.researcher.cfg.strategic_llm_provider,
+            cache=get_llm_cache(self.researcher.cfg),
+            rate_limits=get_rate_limits(self.researcher.cfg),
             model=self.researcher.cfg.strategic_llm_model,
             temperature=0.4,
             reasoning_effort=ReasoningEfforts.High.value,
@@ -183,6 +279,44 @@ Format each question on a new line starting with 'Question: '"""}
             'citations': citations
         }
 
+    async def research_query(self, serp_query: Dict[str, str]) -> Dict[str, Any]:
+        """Research a search query and extract its learnings and follow-up questions"""
+        from .. import GPTResearcher
+        researcher = GPTResearcher(
+            query=serp_query['query'],
+            report_type=ReportType.ResearchReport.value,
+            report_source=ReportSource.Web.value,
+            tone=self.tone,
+            websocket=self.websocket,
+            config_path=self.config_path,
+            headers=self.headers,
+            visited_urls=self.visited_urls,
+            runtime=self.researcher.runtime,
+        )
+
+        # Conduct research. Deep research trims the contexts of its queries by words, so they're kept rendered
+        context = str(await researcher.conduct_research())
+
+        # Get results and visited URLs
+        visited = researcher.visited_urls
+        sources = researcher.research_sources
+
+        # Process results to extract learnings and citations
+        results = await self.process_research_results(
+            query=serp_query['query'],
+            context=context
+        )
+
+        return {
+            'learnings': results['learnings'],
+            'visited_urls': list(visited),
+            'followUpQuestions': results['followUpQuestions'],
+            'researchGoal': serp_query.get('researchGoal', ''),
+            'citations': results['citations'],
+            'context': context if context else "",
+            'sources': sources if sources else []
+        }
+
     async def deep_research(
             self,
             query: str,
@@ -193,7 +327,12 @@ Format each question on a new line starting with 'Question: '"""}
             visited_urls: Set[str] = None,
             on_progress=None
     ) -> Dict[str, Any]:
-        """Conduct deep iterative research"""
+        """
+        Conduct deep iterative research.
+
+        Every researched query schedules the follow-up research of its branch as soon as it
+        completes, on a shared frontier processed with the configured concurrency.
+        """
         if learnings is None:
             learnings = []
         if citations is None:
@@ -206,83 +345,40 @@ Format each question on a new line starting with 'Question: '"""}
         if on_progress:
             on_progress(progress)
 
-        # Generate search queries
-        serp_queries = await self.generate_search_queries(query, num_queries=breadth)
-        progress.total_queries = len(serp_queries)
-
         all_learnings = learnings.copy()
         all_citations = citations.copy()
         all_visited_urls = visited_urls.copy()
         all_context = []
         all_sources = []
 
-        # Process queries with concurrency limit
-        semaphore = asyncio.Semaphore(self.concurrency_limit)
-
-        async def process_query(serp_query: Dict[str, str]) -> Optional[Dict[str, Any]]:
-            async with semaphore:
-                try:
-                    progress.current_query = serp_query['query']
-                    if on_progress:
-                        on_progress(progress)
-
-                    from .. import GPTResearcher
-                    researcher = GPTResearcher(
-                        query=serp_query['query'],
-                        report_type=ReportType.ResearchReport.value,
-                        report_source=ReportSource.Web.value,
-                        tone=self.tone,
-                        websocket=self.websocket,
-                        config_path=self.config_path,
-                        headers=self.headers,
-                        visited_urls=self.visited_urls
-                    )
-
-                    # Conduct research
-                    context = await researcher.conduct_research()
-
-                    # Get results and visited URLs
-                    visited = researcher.visited_urls
-                    sources = researcher.research_sources
-
-                    # Process results to extract learnings and citations
-                    results = await self.process_research_results(
-                        query=serp_query['query'],
-                        context=context
-                    )
-
-                    # Update progress
-                    progress.completed_queries += 1
-                    progress.current_breadth += 1
-                    if on_progress:
-                        on_progress(progress)
-
-                    return {
-                        'learnings': results['learnings'],
-                        'visited_urls': list(visited),
-                        'followUpQuestions': results['followUpQuestions'],
-                        'researchGoal': serp_query['researchGoal'],
-                        'citations': results['citations'],
-                        'context': context if context else "",
-                        'sources': sources if sources else []
-                    }
-
-                except Exception as e:
-                    logger.error(f"Error processing query '{serp_query['query']}': {str(e)}")
-                    return None
-
-        # Process queries concurrently with limit
-        tasks = [process_query(query) for query in serp_queries]
-        results = await asyncio.gather(*tasks)
-        results = [r for r in results if r is not None]
+        frontier = ResearchFrontier(depth, priority=self.priority)
+        frontier.push({'kind': 'plan', 'query': query, 'breadth': breadth, 'depth': depth})
+
+        async def handle(item: Dict[str, Any]) -> None:
+            if item['kind'] == 'plan':
+                # Generate the search queries of a branch
+                serp_queries = await self.generate_search_queries(item['query'], num_queries=item['breadth'])
+                for serp_query in serp_queries:
+                    if frontier.push({**item, 'kind': 'research', 'query': serp_query['query'],
+                                      'researchGoal': serp_query.get('researchGoal', '')}):
+                        progress.total_queries += 1
+                if on_progress:
+                    on_progress(progress)
+                return
+
+            progress.current_query = item['query']
+            if on_progress:
+                on_progress(progress)
+
+            result = await self.research_query(item)
+
+            # Update progress
+            progress.completed_queries += 1
+            progress.current_breadth += 1
+            progress.current_depth = max(progress.current_depth, depth - item['depth'] + 1)
+            if on_progress:
+                on_progress(progress)
 
-        # Update breadth progress based on successful queries
-        progress.current_breadth = len(results)
-        if on_progress:
-            on_progress(progress)
-
-        # Collect all results
-        for result in results:
             all_learnings.extend(result['learnings'])
             all_visited_urls.update(result['visited_urls'])
             all_citations.update(result['citations'])
@@ -292,35 +388,20 @@ Format each question on a new line starting with 'Question: '"""}
                 all_sources.extend(result['sources'])
 
             # Continue deeper if needed
-            if depth > 1:
-                new_breadth = max(2, breadth // 2)
-                new_depth = depth - 1
-                progress.current_depth += 1
-
+            if item['depth'] > 1:
                 # Create next query from research goal and follow-up questions
                 next_query = f"""
                 Previous research goal: {result['researchGoal']}
                 Follow-up questions: {' '.join(result['followUpQuestions'])}
                 """
+                frontier.push({
+                    'kind': 'plan',
+                    'query': next_query,
+                    'breadth': max(2, item['breadth'] // 2),
+                    'depth': item['depth'] - 1,
+                })
 
-                # Recursive research
-                deeper_results = await self.deep_research(
-                    query=next_query,
-                    breadth=new_breadth,
-                    depth=new_depth,
-                    learnings=all_learnings,
-                    citations=all_citations,
-                    visited_urls=all_visited_urls,
-                    on_progress=on_progress
-                )
-
-                all_learnings = deeper_results['learnings']
-                all_visited_urls.update(deeper_results['visited_urls'])
-                all_citations.update(deeper_results['citations'])
-                if deeper_results.get('context'):
-                    all_context.extend(deeper_results['context'])
-                if deeper_results.get('sources'):
-                    all_sources.extend(deeper_results['sources'])
+        await frontier.run(handle, self.concurrency_limit)
 
         # Update class tracking
         self.context.extend(all_context)
@@ -331,7 +412,7 @@ Format each question on a new line starting with 'Question: '"""}
         logger.info(f"Trimmed context from {len(all_context)} items to {len(trimmed_context)} items to stay within word limit")
 
         return {
-            'learnings': list(set(all_learnings)),
+            'learnings': list(dict.fromkeys(all_learnings)),
             'visited_urls': list(all_visited_urls),
             'citations': all_citations,
             'context': trimmed_context,
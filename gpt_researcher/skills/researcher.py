@@ -4,6 +4,8 @@ import logging
 import os
 from ..actions.utils import stream_output
 from ..actions.query_processing import plan_research_outline, get_search_results
+from ..actions.retriever import search_all
+from ..context.records import ResearchContext
 from ..document import DocumentLoader, OnlineDocumentLoader, LangChainDocumentLoader
 from ..utils.enum import ReportSource
 from ..utils.logging_config import get_json_handler
@@ -60,6 +62,7 @@ class ResearchConductor:
         
         # Reset visited_urls and source_urls at the start of each research task
         self.researcher.visited_urls.clear()
+        self.researcher.scraper_manager.reset()
         research_data = []
 
         if self.researcher.verbose:
@@ -90,7 +93,7 @@ class ResearchConductor:
             if self.researcher.complement_source_urls:
                 self.logger.info("Complementing with web search")
                 additional_research = await self._get_context_by_web_search(self.researcher.query, [], self.researcher.query_domains)
-                research_data += ' '.join(additional_research)
+                research_data.extend(additional_research)
 
         elif self.researcher.report_source == ReportSource.Web.value:
             self.logger.info("Using web search")
@@ -101,7 +104,7 @@ class ResearchConductor:
             document_data = await DocumentLoader(self.researcher.cfg.doc_path).load()
             self.logger.info(f"Loaded {len(document_data)} documents")
             if self.researcher.vector_store:
-                self.researcher.vector_store.load(document_data)
+                await self.researcher.vector_store.aload(document_data)
 
             research_data = await self._get_context_by_web_search(self.researcher.query, document_data, self.researcher.query_domains)
 
@@ -112,10 +115,13 @@ class ResearchConductor:
             else:
                 document_data = await DocumentLoader(self.researcher.cfg.doc_path).load()
             if self.researcher.vector_store:
-                self.researcher.vector_store.load(document_data)
+                await self.researcher.vector_store.aload(document_data)
             docs_context = await self._get_context_by_web_search(self.researcher.query, document_data, self.researcher.query_domains)
             web_context = await self._get_context_by_web_search(self.researcher.query, [], self.researcher.query_domains)
-            research_data = self.researcher.prompt_family.join_local_web_documents(docs_context, web_context)
+            # Rendered with the prompt family's join_local_web_documents
+            for record in docs_context:
+                record.origin = "local"
+            research_data = ResearchContext([*docs_context, *web_context], self.researcher.prompt_family)
 
         elif self.researcher.report_source == ReportSource.Azure.value:
             from ..document.azure_document_loader import AzureDocumentLoader
@@ -132,7 +138,7 @@ class ResearchConductor:
                 self.researcher.documents
             ).load()
             if self.researcher.vector_store:
-                self.researcher.vector_store.load(langchain_documents_data)
+                await self.researcher.vector_store.aload(langchain_documents_data)
             research_data = await self._get_context_by_web_search(
                 self.researcher.query, langchain_documents_data, self.researcher.query_domains
             )
@@ -155,7 +161,8 @@ class ResearchConductor:
             )
             if self.json_handler:
                 self.json_handler.update_content("costs", self.researcher.get_costs())
-                self.json_handler.update_content("context", self.researcher.context)
+                context = self.researcher.context
+                self.json_handler.update_content("context", str(context) if isinstance(context, ResearchContext) else context)
 
         self.logger.info(f"Research completed. Context size: {len(str(self.researcher.context))}")
         return self.researcher.context
@@ -172,12 +179,12 @@ class ResearchConductor:
 
         if self.researcher.vector_store:
             self.logger.info("Loading content into vector store")
-            self.researcher.vector_store.load(scraped_content)
+            await self.researcher.vector_store.aload(scraped_content)
 
-        context = await self.researcher.context_manager.get_similar_content_by_query(
+        documents = await self.researcher.context_manager.get_similar_documents_by_query(
             self.researcher.query, scraped_content
         )
-        return context
+        return await self.researcher.context_manager.merge_documents([self.researcher.query], [documents])
 
     # Add logging to other methods similarly...
 
@@ -218,7 +225,7 @@ class ResearchConductor:
         """
         Generates the context for the research task by searching the query and scraping the results
         Returns:
-            context: List of context
+            context: The research context
         """
         self.logger.info(f"Starting web search for query: {query}")
         
@@ -247,32 +254,64 @@ class ResearchConductor:
 
         # Using asyncio.gather to process the sub_queries asynchronously
         try:
-            context = await asyncio.gather(
-                *[
-                    self._process_sub_query(sub_query, scraped_data, query_domains)
-                    for sub_query in sub_queries
-                ]
-            )
-            self.logger.info(f"Gathered context from {len(context)} sub-queries")
-            # Filter out empty results and join the context
-            context = [c for c in context if c]
-            if context:
-                combined_context = " ".join(context)
-                self.logger.info(f"Combined context size: {len(combined_context)}")
-                return combined_context
-            return []
+            if self.researcher.context_manager.chunk_store is not None:
+                results = await self._process_sub_queries_together(sub_queries, scraped_data, query_domains)
+            else:
+                results = await asyncio.gather(
+                    *[
+                        self._process_sub_query(sub_query, scraped_data, query_domains)
+                        for sub_query in sub_queries
+                    ]
+                )
+            self.logger.info(f"Gathered context from {len(results)} sub-queries")
+            # Merge the chunks, so a chunk relevant to several sub-queries is only in the context once
+            combined_context = await self.researcher.context_manager.merge_documents(sub_queries, list(results))
+            self.logger.info(f"Combined context: {len(combined_context)} chunks")
+            return combined_context
         except Exception as e:
             self.logger.error(f"Error during web search: {e}", exc_info=True)
-            return []
+            return ResearchContext(prompt_family=self.researcher.prompt_family)
 
     async def _process_sub_query(self, sub_query: str, scraped_data: list = [], query_domains: list = []):
         """Takes in a sub query and scrapes urls based on it and gathers context."""
+        try:
+            scraped_data = await self._gather_sub_query_data(sub_query, scraped_data, query_domains)
+            documents = await self.researcher.context_manager.get_similar_documents_by_query(sub_query, scraped_data)
+            await self._log_sub_query_content(sub_query, documents)
+            return documents
+        except Exception as e:
+            self.logger.error(f"Error processing sub-query {sub_query}: {e}", exc_info=True)
+            return []
+
+    async def _process_sub_queries_together(self, sub_queries: list[str], scraped_data: list = [], query_domains: list = []):
+        """Gathers the data for every sub query concurrently, then scores them all against the run's chunk store at once."""
+
+        async def gather_data(sub_query):
+            try:
+                return await self._gather_sub_query_data(sub_query, scraped_data, query_domains)
+            except Exception as e:
+                self.logger.error(f"Error processing sub-query {sub_query}: {e}", exc_info=True)
+                return []
+
+        data_per_query = await asyncio.gather(*[gather_data(sub_query) for sub_query in sub_queries])
+        try:
+            results = await self.researcher.context_manager.get_similar_documents_by_queries(sub_queries, data_per_query)
+        except Exception as e:
+            self.logger.error(f"Error getting content for sub-queries {sub_queries}: {e}", exc_info=True)
+            return [[] for _ in sub_queries]
+
+        for sub_query, documents in zip(sub_queries, results):
+            await self._log_sub_query_content(sub_query, documents)
+        return results
+
+    async def _gather_sub_query_data(self, sub_query: str, scraped_data: list, query_domains: list):
+        """Returns the data to research a sub query with, scraping new urls if no data was provided."""
         if self.json_handler:
             self.json_handler.log_event("sub_query", {
                 "query": sub_query,
                 "scraped_data_size": len(scraped_data)
             })
-        
+
         if self.researcher.verbose:
             await stream_output(
                 "logs",
@@ -281,31 +320,28 @@ class ResearchConductor:
                 self.researcher.websocket,
             )
 
-        try:
-            if not scraped_data:
-                scraped_data = await self._scrape_data_by_urls(sub_query, query_domains)
-                self.logger.info(f"Scraped data size: {len(scraped_data)}")
+        if not scraped_data:
+            scraped_data = await self._scrape_data_by_urls(sub_query, query_domains)
+            self.logger.info(f"Scraped data size: {len(scraped_data)}")
+        return scraped_data
 
-            content = await self.researcher.context_manager.get_similar_content_by_query(sub_query, scraped_data)
-            self.logger.info(f"Content found for sub-query: {len(str(content)) if content else 0} chars")
+    async def _log_sub_query_content(self, sub_query: str, documents: list):
+        content_size = sum(len(document.page_content) for document in documents)
+        self.logger.info(f"Content found for sub-query: {len(documents)} chunks, {content_size} chars")
 
-            if not content and self.researcher.verbose:
-                await stream_output(
-                    "logs",
-                    "subquery_context_not_found",
-                    f"🤷 No content found for '{sub_query}'...",
-                    self.researcher.websocket,
-                )
-            if content:
-                if self.json_handler:
-                    self.json_handler.log_event("content_found", {
-                        "sub_query": sub_query,
-                        "content_size": len(content)
-                    })
-            return content
-        except Exception as e:
-            self.logger.error(f"Error processing sub-query {sub_query}: {e}", exc_info=True)
-            return ""
+        if not documents and self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "subquery_context_not_found",
+                f"🤷 No content found for '{sub_query}'...",
+                self.researcher.websocket,
+            )
+        if documents:
+            if self.json_handler:
+                self.json_handler.log_event("content_found", {
+                    "sub_query": sub_query,
+                    "content_size": content_size
+                })
 
     async def _process_sub_query_with_vectorstore(self, sub_query: str, filter: dict | None = None):
         """Takes in a sub query and gathers context from the user provided vector store
@@ -336,7 +372,8 @@ class ResearchConductor:
 
         new_urls = []
         for url in url_set_input:
-            if url not in self.researcher.visited_urls:
+            # The index also catches other spellings of a url already researched
+            if url not in self.researcher.visited_urls and self.researcher.scraper_manager.url_index.add(url):
                 self.researcher.visited_urls.add(url)
                 new_urls.append(url)
                 if self.researcher.verbose:
@@ -356,19 +393,17 @@ class ResearchConductor:
         if query_domains is None:
             query_domains = []
 
-        # Iterate through all retrievers
-        for retriever_class in self.researcher.retrievers:
-            # Instantiate the retriever with the sub-query
-            retriever = retriever_class(query, query_domains=query_domains)
-
-            # Perform the search using the current retriever
-            search_results = await asyncio.to_thread(
-                retriever.search, max_results=self.researcher.cfg.max_search_results_per_query
-            )
+        # Search with all retrievers concurrently
+        search_results = await search_all(
+            self.researcher.retrievers,
+            query,
+            query_domains=query_domains,
+            timeout=self.researcher.cfg.retriever_timeout or None,
+            max_results=self.researcher.cfg.max_search_results_per_query,
+        )
 
-            # Collect new URLs from search results
-            search_urls = [url.get("href") for url in search_results]
-            new_search_urls.extend(search_urls)
+        # Collect new URLs from search results
+        new_search_urls.extend(url.get("href") for url in search_results)
 
         # Get unique URLs
         new_search_urls = await self._get_new_urls(new_search_urls)
@@ -401,9 +436,17 @@ class ResearchConductor:
             )
 
         # Scrape the new URLs
-        scraped_content = await self.researcher.scraper_manager.browse_urls(new_search_urls)
+        if self.researcher.context_manager.chunk_store is not None:
+            # Embed the pages as they arrive instead of waiting for the slowest one
+            scraped_content = await self.researcher.context_manager.add_pages_as_scraped(
+                sub_query,
+                self.researcher.scraper_manager.stream_urls(new_search_urls),
+                patience=self.researcher.cfg.scrape_early_stop_patience,
+            )
+        else:
+            scraped_content = await self.researcher.scraper_manager.browse_urls(new_search_urls)
 
         if self.researcher.vector_store:
-            self.researcher.vector_store.load(scraped_content)
+            await self.researcher.vector_store.aload(scraped_content)
 
         return scraped_content
@@ -1,6 +1,9 @@
 from typing import Dict, Optional
+import asyncio
 import json
 
+from ..context.packer import pack_context
+from ..context.records import ResearchContext
 from ..utils.llm import construct_subtopics
 from ..actions import (
     stream_output,
@@ -52,7 +55,7 @@ class ReportGenerator:
                 research_images
             )
 
-        context = ext_context or self.researcher.context
+        context = await self._pack_context(ext_context or self.researcher.context)
         if self.researcher.verbose:
             await stream_output(
                 "logs",
@@ -87,6 +90,21 @@ class ReportGenerator:
 
         return report
 
+    async def _pack_context(self, context):
+        """Pack the context into the configured token budget of the smart LLM, if there is one."""
+        budget = self.researcher.cfg.context_token_budget
+        if isinstance(context, ResearchContext) and not budget:
+            return context.render(self.researcher.prompt_family)
+        if not budget or not (
+            isinstance(context, (str, ResearchContext))
+            or (isinstance(context, list) and all(isinstance(c, str) for c in context))
+        ):
+            return context
+        return await asyncio.to_thread(
+            pack_context, context, self.researcher.query, budget, self.researcher.cfg.smart_llm_model,
+            self.researcher.prompt_family,
+        )
+
     async def write_report_conclusion(self, report_content: str) -> str:
         """
         Write the conclusion for the report.
@@ -137,7 +155,7 @@ class ReportGenerator:
 
         introduction = await write_report_introduction(
             query=self.researcher.query,
-            context=self.researcher.context,
+            context=await self._pack_context(self.researcher.context),
             agent_role_prompt=self.researcher.cfg.agent_role or self.researcher.role,
             config=self.researcher.cfg,
             websocket=self.researcher.websocket,
@@ -167,7 +185,7 @@ class ReportGenerator:
 
         subtopics = await construct_subtopics(
             task=self.researcher.query,
-            data=self.researcher.context,
+            data=await self._pack_context(self.researcher.context),
             config=self.researcher.cfg,
             subtopics=self.researcher.subtopics,
             prompt_family=self.researcher.prompt_family,
@@ -196,7 +214,7 @@ class ReportGenerator:
         draft_section_titles = await generate_draft_section_titles(
             query=self.researcher.query,
             current_subtopic=current_subtopic,
-            context=self.researcher.context,
+            context=await self._pack_context(self.researcher.context),
             role=self.researcher.cfg.agent_role or self.researcher.role,
             websocket=self.researcher.websocket,
             config=self.researcher.cfg,
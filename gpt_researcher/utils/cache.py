@@ -0,0 +1,228 @@
+"""
+Small caching primitives shared by the embedding, scraping, search and LLM caches.
+
+A `TieredCache` keeps hot entries in an in-process LRU and, when a path is given,
+persists every entry to a SQLite file so it survives across runs and processes.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterable
+
+
+def hash_key(*parts: Any) -> str:
+    """Build a stable cache key from arbitrary parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8", errors="ignore"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache with an optional per-entry TTL."""
+
+    def __init__(self, max_size: int = 1024, ttl: float | None = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            created_at, value = item
+            if self.ttl is not None and time.time() - created_at > self.ttl:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, created_at: float | None = None) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = (created_at or time.time(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """Persistent key/value store backed by a single SQLite table.
+
+    Values are stored as raw bytes, callers are responsible for serialising them.
+    The connection is shared between threads and guarded by a lock, and WAL mode
+    allows several processes to share the same file.
+    """
+
+    def __init__(self, path: str, table: str = "cache"):
+        self.path = path
+        self.table = table
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str, ttl: float | None = None) -> tuple[bytes, float] | None:
+        """Return `(value, created_at)` for a key, or None if missing or expired."""
+        return self.get_many([key], ttl).get(key)
+
+    def get_many(self, keys: Iterable[str], ttl: float | None = None) -> dict[str, tuple[bytes, float]]:
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        found = {}
+        now = time.time()
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, value, created_at FROM {self.table} WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, value, created_at in rows:
+                    if ttl is None or now - created_at <= ttl:
+                        found[key] = (value, created_at)
+        return found
+
+    def set(self, key: str, value: bytes, created_at: float | None = None) -> None:
+        self.set_many({key: value}, created_at)
+
+    def set_many(self, items: dict[str, bytes], created_at: float | None = None) -> None:
+        if not items:
+            return
+        created_at = created_at or time.time()
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, created_at) VALUES (?, ?, ?)",
+                [(key, sqlite3.Binary(value), created_at) for key, value in items.items()],
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCache:
+    """An in-memory LRU in front of an optional persistent SQLite tier.
+
+    Args:
+        path: SQLite file for the persistent tier. If None, only the memory tier is used.
+        max_size: Maximum number of entries kept in memory.
+        ttl: Time to live in seconds for every entry. None means entries never expire.
+        encode: Serialises a value to bytes for the persistent tier.
+        decode: Deserialises bytes from the persistent tier.
+        table: Table name used in the SQLite file.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        max_size: int = 1024,
+        ttl: float | None = None,
+        encode: Callable[[Any], bytes] | None = None,
+        decode: Callable[[bytes], Any] | None = None,
+        table: str = "cache",
+    ):
+        self.ttl = ttl
+        self.memory = LRUCache(max_size=max_size, ttl=ttl)
+        self.disk = SQLiteCache(path, table=table) if path else None
+        self.encode = encode or _encode_json
+        self.decode = decode or _decode_json
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.get_many([key]).get(key, default)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        found = {}
+        missing = []
+        for key in keys:
+            value = self.memory.get(key, _MISSING)
+            if value is _MISSING:
+                missing.append(key)
+            else:
+                found[key] = value
+        if missing and self.disk is not None:
+            for key, (raw, created_at) in self.disk.get_many(missing, self.ttl).items():
+                value = self.decode(raw)
+                self.memory.set(key, value, created_at)
+                found[key] = value
+        return found
+
+    def set(self, key: str, value: Any) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, items: dict[str, Any]) -> None:
+        for key, value in items.items():
+            self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set_many({key: self.encode(value) for key, value in items.items()})
+
+    def delete(self, key: str) -> None:
+        self.memory.delete(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+
+_MISSING = object()
+
+
+def _encode_json(value: Any) -> bytes:
+    return json.dumps(value).encode("utf-8")
+
+
+def _decode_json(raw: bytes) -> Any:
+    return json.loads(raw)
+
+
+_shared_caches: dict[tuple, TieredCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_shared_cache(path: str | None, table: str = "cache", **kwargs: Any) -> TieredCache:
+    """Return the process-wide TieredCache for a (path, table) pair and settings, creating it on first use.
+
+    Sharing the instance means every researcher in the process also shares the hot memory tier.
+    Callers with a different `max_size` or `ttl` get their own instance over the same persistent tier.
+    """
+    settings = tuple(sorted((name, value) for name, value in kwargs.items() if not callable(value)))
+    key = (path, table, settings)
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = TieredCache(path=path, table=table, **kwargs)
+            _shared_caches[key] = cache
+        return cache
@@ -1,5 +1,12 @@
+import asyncio
+import functools
+import logging
+from typing import Any, Callable, Iterable, Mapping
+
 import tiktoken
 
+from .cache import LRUCache, hash_key
+
 # Per OpenAI Pricing Page: https://openai.com/api/pricing/
 ENCODING_MODEL = "o200k_base"
 INPUT_COST_PER_TOKEN = 0.000005
@@ -7,19 +14,84 @@ OUTPUT_COST_PER_TOKEN = 0.000015
 IMAGE_INFERENCE_COST = 0.003825
 EMBEDDING_COST = 0.02 / 1000000 # Assumes new ada-3-small
 
+# Token counts of documents, so the same chunk is only tokenised once however many sub-queries embed it
+_token_counts = LRUCache(max_size=50000)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(name: str) -> tiktoken.Encoding:
+    return tiktoken.get_encoding(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_model_encoding(model: str) -> tiktoken.Encoding:
+    return tiktoken.encoding_for_model(model)
+
+
+def count_tokens(text: str, encoding: tiktoken.Encoding | None = None) -> int:
+    """Count the tokens of a text, memoised by a hash of the text."""
+    encoding = encoding or _get_encoding(ENCODING_MODEL)
+    key = hash_key(encoding.name, text)
+    count = _token_counts.get(key)
+    if count is None:
+        count = len(encoding.encode(text, disallowed_special=()))
+        _token_counts.set(key, count)
+    return count
+
+
+@functools.lru_cache(maxsize=None)
+def get_token_counter(model: str | None = None) -> Callable[[str], int]:
+    """
+    Get a memoised token counter for a model.
+
+    Uses the model's tiktoken encoding, or o200k_base for models tiktoken doesn't know. If no
+    encoding can be loaded (e.g. offline), tokens are estimated as four characters each.
+    """
+    for load in (lambda: _get_model_encoding(model), lambda: _get_encoding(ENCODING_MODEL)):
+        try:
+            encoding = load()
+            return lambda text: count_tokens(text, encoding)
+        except Exception:
+            continue
+    logging.getLogger(__name__).warning("Could not load a tokenizer, estimating token counts from text length")
+    return lambda text: len(text) // 4 + 1
+
 
 # Cost estimation is via OpenAI libraries and models. May vary for other models
-def estimate_llm_cost(input_content: str, output_content: str) -> float:
-    encoding = tiktoken.get_encoding(ENCODING_MODEL)
-    input_tokens = encoding.encode(input_content)
-    output_tokens = encoding.encode(output_content)
-    input_costs = len(input_tokens) * INPUT_COST_PER_TOKEN
-    output_costs = len(output_tokens) * OUTPUT_COST_PER_TOKEN
+def estimate_llm_cost(input_content: str, output_content: str, usage: Mapping[str, Any] | None = None) -> float:
+    """
+    Estimate the cost of an LLM call.
+
+    Args:
+        input_content: The prompt that was sent.
+        output_content: The response that was received.
+        usage: Token usage reported by the provider, with `input_tokens` and `output_tokens`.
+            When given, the content is not tokenised.
+    """
+    if usage and usage.get("input_tokens") is not None and usage.get("output_tokens") is not None:
+        input_tokens, output_tokens = usage["input_tokens"], usage["output_tokens"]
+    else:
+        encoding = _get_encoding(ENCODING_MODEL)
+        input_tokens = len(encoding.encode(input_content, disallowed_special=()))
+        output_tokens = len(encoding.encode(output_content, disallowed_special=()))
+    input_costs = input_tokens * INPUT_COST_PER_TOKEN
+    output_costs = output_tokens * OUTPUT_COST_PER_TOKEN
     return input_costs + output_costs
 
 
 def estimate_embedding_cost(model, docs):
-    encoding = tiktoken.encoding_for_model(model)
-    total_tokens = sum(len(encoding.encode(str(doc))) for doc in docs)
+    encoding = _get_model_encoding(model)
+    total_tokens = sum(count_tokens(str(doc), encoding) for doc in docs)
     return total_tokens * EMBEDDING_COST
 
+
+async def aestimate_llm_cost(input_content: str, output_content: str, usage: Mapping[str, Any] | None = None) -> float:
+    """Like `estimate_llm_cost`, tokenising in a worker thread when the provider reported no usage."""
+    if usage and usage.get("input_tokens") is not None and usage.get("output_tokens") is not None:
+        return estimate_llm_cost(input_content, output_content, usage)
+    return await asyncio.to_thread(estimate_llm_cost, input_content, output_content)
+
+
+async def aestimate_embedding_cost(model: str, docs: Iterable[Any]) -> float:
+    """Like `estimate_embedding_cost`, tokenising in a worker thread."""
+    return await asyncio.to_thread(estimate_embedding_cost, model, list(docs))
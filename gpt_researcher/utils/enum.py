@@ -61,3 +61,4 @@ class PromptFamily(Enum):
     Granite31 = "granite3.1"
     Granite32 = "granite3.2"
     Granite33 = "granite3.3"
+    CacheFriendly = "cache_friendly"
@@ -0,0 +1,109 @@
+"""
+Hedged requests for latency-critical LLM calls.
+
+A hedged call starts the primary request and, if it hasn't finished within a high percentile
+of its recent latencies (or fails), also starts a secondary request. The first one to return
+a valid result wins and the other one is cancelled.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Recent latencies per key, e.g. per (provider, model)."""
+
+    def __init__(self, window: int = 100, min_samples: int = 5):
+        self.window = window
+        self.min_samples = min_samples
+        self._latencies: dict[Hashable, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: Hashable, seconds: float) -> None:
+        with self._lock:
+            self._latencies.setdefault(key, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, key: Hashable, percentile: float, default: float) -> float:
+        """The percentile of the recent latencies of a key, or `default` until there are enough samples."""
+        with self._lock:
+            latencies = list(self._latencies.get(key, ()))
+        if len(latencies) < self.min_samples:
+            return default
+        return float(np.percentile(latencies, percentile))
+
+
+latency_tracker = LatencyTracker()
+
+
+async def hedged(
+    primary: Callable[[], Awaitable[T]],
+    secondary: Callable[[], Awaitable[T]],
+    delay: float,
+    latency_key: Hashable | None = None,
+    record_latency: Callable[[], bool] | None = None,
+) -> T:
+    """
+    Run `primary`, and `secondary` as well if the primary takes longer than `delay` or fails.
+
+    Both callables should raise when their result is invalid (e.g. unparsable), so that only a
+    valid result can win.
+
+    Args:
+        primary: Starts the primary request.
+        secondary: Starts the secondary request.
+        delay: Seconds to wait for the primary before hedging.
+        latency_key: Key the primary's latency is recorded under in `latency_tracker`.
+        record_latency: Checked once the requests are over, the primary's latency is only recorded
+            if it returns True. Lets callers leave out answers that did not come from the provider,
+            e.g. cache hits, which would drag the percentile towards 0.
+
+    Returns:
+        The result of whichever request returned a valid result first.
+    """
+    started_at = time.monotonic()
+    primary_task = asyncio.ensure_future(primary())
+    tasks = {primary_task}
+    secondary_task = None
+    errors: list[BaseException] = []
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        while True:
+            for task in done:
+                tasks.discard(task)
+                if task.exception() is None:
+                    return task.result()
+                errors.append(task.exception())
+                logger.warning(f"{'Primary' if task is primary_task else 'Secondary'} request failed: {task.exception()}")
+
+            if secondary_task is None:
+                if primary_task in tasks:
+                    logger.info(f"No response after {delay:.1f}s, hedging with the secondary model")
+                secondary_task = asyncio.ensure_future(secondary())
+                tasks.add(secondary_task)
+            if not tasks:
+                raise errors[-1]
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        failed = primary_task.done() and not primary_task.cancelled() and primary_task.exception()
+        if latency_key is not None and not failed and (record_latency is None or record_latency()):
+            # A cancelled primary took at least this long, which keeps the percentile from drifting down
+            latency_tracker.record(latency_key, time.monotonic() - started_at)
+
+
+def hedge_delay(latency_key: Hashable, percentile: float, default: float) -> float:
+    """How long to wait for a primary request before hedging it."""
+    return latency_tracker.percentile(latency_key, percentile, default)
+
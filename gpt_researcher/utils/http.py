@@ -0,0 +1,108 @@
+"""
+Shared async HTTP client.
+
+Every coroutine on an event loop shares one pooled `aiohttp.ClientSession`, so connections are
+kept alive and DNS lookups are cached across scrapers and researchers instead of being
+re-established for every request. Connection limits are read from the environment:
+
+- `HTTP_MAX_CONNECTIONS`: total number of simultaneous connections (default 256).
+- `HTTP_MAX_CONNECTIONS_PER_HOST`: simultaneous connections to a single host (default 8).
+"""
+import asyncio
+import os
+import weakref
+from typing import Any
+
+import aiohttp
+
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+# Strong references, the event loop only keeps weak ones to its tasks
+_shutdown_tasks: set[asyncio.Task] = set()
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the pooled HTTP session of the running event loop, creating it on first use.
+
+    The session is closed automatically when the loop shuts down its remaining tasks
+    (as `asyncio.run` does), or explicitly with `close_http_session`.
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=int(os.environ.get("HTTP_MAX_CONNECTIONS", 256)),
+            limit_per_host=int(os.environ.get("HTTP_MAX_CONNECTIONS_PER_HOST", 8)),
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        _sessions[loop] = session
+        task = loop.create_task(_close_on_shutdown(session))
+        _shutdown_tasks.add(task)
+        task.add_done_callback(_shutdown_tasks.discard)
+    return session
+
+
+async def close_http_session() -> None:
+    """Close the pooled HTTP session of the running event loop, if any."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+async def _close_on_shutdown(session: aiohttp.ClientSession) -> None:
+    # Parks until the loop cancels its remaining tasks on shutdown
+    try:
+        await asyncio.Event().wait()
+    finally:
+        if not session.closed:
+            await session.close()
+
+
+async def fetch_url(url: str, headers: dict | None = None, timeout: float = 10, verify_ssl: bool = True) -> tuple:
+    """
+    GET a url through the shared session.
+
+    Returns:
+        tuple: The status code, response headers, raw body and declared charset (or None).
+    """
+    async with get_http_session().get(
+        url,
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        ssl=None if verify_ssl else False,
+    ) as response:
+        body = await response.read()
+        return response.status, response.headers, body, response.charset
+
+
+async def fetch_json(
+    url: str,
+    method: str = "GET",
+    params: dict | None = None,
+    json: Any = None,
+    headers: dict | None = None,
+    timeout: float | None = 10,
+) -> Any:
+    """
+    Send a request through the shared session and decode its JSON response.
+
+    Query parameters are encoded like `requests` does: None values are dropped and booleans
+    are sent as strings.
+
+    Raises:
+        aiohttp.ClientResponseError: If the response has an error status.
+    """
+    if params is not None:
+        params = {key: str(value) if isinstance(value, bool) else value for key, value in params.items() if value is not None}
+    async with get_http_session().request(
+        method,
+        url,
+        params=params,
+        json=json,
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as response:
+        response.raise_for_status()
+        return await response.json(content_type=None)
@@ -1,6 +1,7 @@
 # libraries
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -10,14 +11,34 @@ from langchain.prompts import PromptTemplate
 from gpt_researcher.llm_provider.generic.base import NO_SUPPORT_TEMPERATURE_MODELS, SUPPORT_REASONING_EFFORT_MODELS, ReasoningEfforts
 
 from ..prompts import PromptFamily
-from .costs import estimate_llm_cost
+from .costs import aestimate_llm_cost, estimate_llm_cost, get_token_counter
+from .llm_cache import LLMResponseCache
+from .prompt_cache import apply_cache_breakpoints, prompt_cache_stats
+from .rate_limiter import RateLimits, get_rate_limiter, is_retryable, retry_delay
 from .validators import Subtopics
 import os
 
+# Providers whose LangChain clients retry failed calls themselves. create_chat_completion already
+# retries with a shared backoff, so their own retries are turned off unless llm_kwargs set them.
+CLIENT_RETRY_PROVIDERS = {"openai", "azure_openai", "anthropic", "deepseek", "openrouter", "groq", "mistralai"}
+
+
+class _StreamOutput:
+    """Websocket stand-in for a streamed call that remembers whether any output was sent."""
+
+    def __init__(self, provider, websocket):
+        self.provider = provider
+        self.websocket = websocket
+        self.sent = False
+
+    async def send_json(self, data):
+        self.sent = True
+        await self.provider._send_output(data["output"], self.websocket)
+
 
 def get_llm(llm_provider, **kwargs):
     from gpt_researcher.llm_provider import GenericLLMProvider
-    return GenericLLMProvider.from_provider(llm_provider, **kwargs)
+    return GenericLLMProvider.get_shared(llm_provider, **kwargs)
 
 
 async def create_chat_completion(
@@ -30,7 +51,10 @@ async def create_chat_completion(
         websocket: Any | None = None,
         llm_kwargs: dict[str, Any] | None = None,
         cost_callback: callable = None,
-        reasoning_effort: str | None = ReasoningEfforts.Medium.value
+        reasoning_effort: str | None = ReasoningEfforts.Medium.value,
+        cache: LLMResponseCache | None = None,
+        rate_limits: RateLimits | None = None,
+        cache_hit_callback: callable = None,
 ) -> str:
     """Create a chat completion using the OpenAI API
     Args:
@@ -44,6 +68,9 @@ async def create_chat_completion(
         llm_kwargs (dict[str, Any], optional): Additional LLM keyword arguments. Defaults to None.
         cost_callback: Callback function for updating cost.
         reasoning_effort (str, optional): Reasoning effort for OpenAI's reasoning models. Defaults to 'low'.
+        cache (LLMResponseCache, optional): Cache to reuse responses from. A cached response is sent to the websocket in one piece when streaming.
+        rate_limits (RateLimits, optional): Rate limits and retries of the call, see `get_rate_limits`. Defaults to the default config's.
+        cache_hit_callback: Called when the response is served from the cache rather than by the provider.
     Returns:
         str: The response from the chat completion.
     """
@@ -72,18 +99,65 @@ async def create_chat_completion(
         if base_url:
             kwargs['openai_api_base'] = base_url
 
-    provider = get_llm(llm_provider, **kwargs)
+    client_kwargs = {"max_retries": 0, **kwargs} if llm_provider in CLIENT_RETRY_PROVIDERS else kwargs
+    provider = get_llm(llm_provider, **client_kwargs)
+
+    cache_scope = None
+    if cache is not None:
+        cache_scope = cache.scope(llm_provider, **kwargs)
+        cached = await cache.get(cache_scope, messages)
+        if cached is not None:
+            if stream:
+                # Replay the cached response in one piece, so streaming clients still receive it
+                await provider._send_output(cached, websocket)
+            if cache_hit_callback:
+                cache_hit_callback()
+            return cached
+
+    # Rough token estimate for the limiter, corrected with the reported usage after the call
+    rate_limits = rate_limits or RateLimits()
+    limiter = get_rate_limiter(llm_provider, model, rate_limits)
+    estimated_tokens = len(str(messages)) // 4 + (max_tokens or 0)
+    max_retries = rate_limits.max_retries
     response = ""
+    provider_messages = apply_cache_breakpoints(messages, llm_provider)
     # create response
-    for _ in range(10):  # maximum of 10 attempts
-        response = await provider.get_chat_response(
-            messages, stream, websocket
-        )
+    for attempt in range(max_retries + 1):
+        await limiter.acquire(estimated_tokens)
+        output = _StreamOutput(provider, websocket) if stream else websocket
+        try:
+            response, usage = await provider.get_chat_response_with_usage(
+                provider_messages, stream, output
+            )
+        except asyncio.CancelledError:
+            # The prompt of a cancelled request is billed all the same, e.g. the losing request of a hedge
+            if cost_callback:
+                prompt_tokens = get_token_counter(model)(str(messages))
+                cost_callback(estimate_llm_cost(str(messages), "", {"input_tokens": prompt_tokens, "output_tokens": 0}))
+            raise
+        except Exception as e:
+            # A retry would send the part of the response that was already streamed again
+            streamed = stream and output.sent
+            if not is_retryable(e) or attempt == max_retries or streamed:
+                logging.error(f"Failed to get response from {llm_provider} API: {e}")
+                raise
+            delay = retry_delay(e, attempt)
+            logging.warning(f"{llm_provider} API call failed ({e}), retrying in {delay:.1f}s")
+            # Every caller of this provider and model backs off, not just this one
+            limiter.pause(delay)
+            continue
+
+        if usage and usage.get("total_tokens"):
+            limiter.record(estimated_tokens, usage["total_tokens"])
+        prompt_cache_stats.record(llm_provider, model, usage)
 
         if cost_callback:
-            llm_costs = estimate_llm_cost(str(messages), response)
+            llm_costs = await aestimate_llm_cost(str(messages), response, usage)
             cost_callback(llm_costs)
 
+        if cache_scope is not None:
+            await cache.set(cache_scope, messages, response)
+
         return response
 
     logging.error(f"Failed to get response from {llm_provider} API")
@@ -137,7 +211,7 @@ async def construct_subtopics(
 
         chain = prompt | model | parser
 
-        output = chain.invoke({
+        output = await chain.ainvoke({
             "task": task,
             "data": data,
             "subtopics": subtopics,
@@ -0,0 +1,198 @@
+"""
+Response cache for `create_chat_completion`.
+
+Responses are keyed by (provider, model, sampling settings, normalised messages). With a
+similarity threshold, a prompt that misses the exact cache is embedded and compared against
+the prompts cached for the same provider, model and settings, so near-duplicate prompts
+(e.g. the same task phrased slightly differently) reuse a response too.
+"""
+import asyncio
+import json
+import logging
+import os
+import re
+import threading
+from typing import Any
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from .cache import LRUCache, TieredCache, get_shared_cache, hash_key
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_messages(messages: list[dict[str, str]]) -> str:
+    """Serialise messages with collapsed whitespace, so formatting-only differences share a key."""
+    return json.dumps(
+        [
+            {"role": message.get("role", ""), "content": re.sub(r"\s+", " ", str(message.get("content", ""))).strip()}
+            for message in messages
+        ],
+        ensure_ascii=False,
+    )
+
+
+def _encode_index(index: dict[str, Any]) -> bytes:
+    header = "\n".join(index["keys"]).encode("utf-8")
+    return header + b"\0" + np.asarray(index["vectors"], dtype=np.float32).tobytes()
+
+
+def _decode_index(raw: bytes) -> dict[str, Any]:
+    header, _, body = bytes(raw).partition(b"\0")
+    keys = header.decode("utf-8").split("\n") if header else []
+    vectors = np.frombuffer(body, dtype=np.float32)
+    return {"keys": keys, "vectors": vectors.reshape(len(keys), -1) if keys else vectors}
+
+
+class LLMResponseCache:
+    """
+    Exact and, optionally, semantic cache of chat completion responses.
+
+    Args:
+        cache_dir: Directory for the persistent SQLite tier. If empty, responses are only cached in memory.
+        ttl: Number of seconds responses are reused.
+        max_size: Number of responses kept in the in-memory LRU tier.
+        embeddings: Embeddings used for the similarity lookup.
+        similarity_threshold: Minimum cosine similarity for a near-duplicate prompt to reuse a response. 0 disables the similarity lookup.
+        max_similar_prompts: Number of most recent prompts per model and settings the similarity lookup compares against.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | None,
+        ttl: float | None = 86400,
+        max_size: int = 1024,
+        embeddings: Embeddings | None = None,
+        similarity_threshold: float = 0.0,
+        max_similar_prompts: int = 512,
+    ):
+        path = os.path.join(cache_dir, "llm.sqlite") if cache_dir else None
+        self.responses: TieredCache = get_shared_cache(path, table="responses", max_size=max_size, ttl=ttl)
+        self.embeddings = embeddings if similarity_threshold > 0 else None
+        self.similarity_threshold = similarity_threshold
+        self.max_similar_prompts = max_similar_prompts
+        self.prompts: TieredCache | None = None
+        if self.embeddings is not None:
+            self.prompts = get_shared_cache(
+                path, table="prompts", max_size=64, encode=_encode_index, decode=_decode_index
+            )
+        # Prompts embedded for a lookup that missed, so storing their response doesn't embed them again
+        self._vectors = LRUCache(max_size=64)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def scope(llm_provider: str | None, model: str, **settings: Any) -> str:
+        """Key for everything besides the messages that determines a response."""
+        return hash_key(llm_provider, model, json.dumps(settings, sort_keys=True, default=str))
+
+    @staticmethod
+    def key(scope: str, messages: list[dict[str, str]]) -> str:
+        return hash_key(scope, normalize_messages(messages))
+
+    async def get(self, scope: str, messages: list[dict[str, str]]) -> str | None:
+        """Return the cached response for the messages, or None on a miss."""
+        response = await asyncio.to_thread(self.responses.get, self.key(scope, messages))
+        if response is not None or self.embeddings is None:
+            return response
+
+        index = await asyncio.to_thread(self.prompts.get, scope)
+        if not index or not index["keys"]:
+            return None
+        try:
+            vector = await self._embed(self.key(scope, messages), messages)
+        except Exception as e:
+            logger.warning(f"Could not embed prompt for the LLM response cache: {e}")
+            return None
+        vectors = index["vectors"]
+        similarities = vectors @ vector / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(vector) + 1e-10)
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+        logger.info(f"LLM response cache hit for a similar prompt (similarity {similarities[best]:.3f})")
+        return await asyncio.to_thread(self.responses.get, index["keys"][best])
+
+    async def set(self, scope: str, messages: list[dict[str, str]], response: str) -> None:
+        """Cache a response. Empty responses are never cached."""
+        if not response:
+            return
+        key = self.key(scope, messages)
+        await asyncio.to_thread(self.responses.set, key, response)
+        if self.embeddings is None:
+            return
+
+        try:
+            vector = await self._embed(key, messages)
+        except Exception as e:
+            logger.warning(f"Could not embed prompt for the LLM response cache: {e}")
+            return
+        await asyncio.to_thread(self._add_to_index, scope, key, vector)
+
+    def _add_to_index(self, scope: str, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            index = self.prompts.get(scope) or {"keys": [], "vectors": np.empty((0, len(vector)), dtype=np.float32)}
+            keys, vectors = list(index["keys"]), index["vectors"]
+            if key in keys:
+                return
+            if len(keys) and vectors.shape[1] != len(vector):
+                # The embedding model changed, the old vectors can't be compared against
+                keys, vectors = [], np.empty((0, len(vector)), dtype=np.float32)
+            keys.append(key)
+            vectors = np.vstack([vectors, vector[None, :]])
+            self.prompts.set(scope, {
+                "keys": keys[-self.max_similar_prompts:],
+                "vectors": vectors[-self.max_similar_prompts:],
+            })
+
+    async def _embed(self, key: str, messages: list[dict[str, str]]) -> np.ndarray:
+        vector = self._vectors.get(key)
+        if vector is None:
+            text = "\n".join(str(message.get("content", "")) for message in messages)
+            vector = np.asarray(await self.embeddings.aembed_query(text), dtype=np.float32)
+            self._vectors.set(key, vector)
+        return vector
+
+
+_llm_caches: dict[tuple, LLMResponseCache] = {}
+_llm_caches_lock = threading.Lock()
+
+
+def get_llm_cache(cfg) -> LLMResponseCache | None:
+    """
+    Get the process-wide LLM response cache for a config.
+
+    Args:
+        cfg (Config): The configuration object.
+
+    Returns:
+        LLMResponseCache | None: The cache, or None if LLM_CACHE is disabled.
+    """
+    if not getattr(cfg, "llm_cache", False):
+        return None
+
+    similarity_threshold = cfg.llm_cache_similarity or 0.0
+    key = (
+        cfg.cache_dir,
+        cfg.llm_cache_ttl,
+        similarity_threshold,
+        cfg.embedding_provider if similarity_threshold > 0 else None,
+        cfg.embedding_model if similarity_threshold > 0 else None,
+    )
+    with _llm_caches_lock:
+        cache = _llm_caches.get(key)
+        if cache is None:
+            embeddings = None
+            if similarity_threshold > 0:
+                from ..memory import Memory
+
+                embeddings = Memory(
+                    cfg.embedding_provider, cfg.embedding_model, **cfg.embedding_kwargs
+                ).get_embeddings()
+            cache = LLMResponseCache(
+                cfg.cache_dir,
+                ttl=cfg.llm_cache_ttl,
+                embeddings=embeddings,
+                similarity_threshold=similarity_threshold,
+            )
+            _llm_caches[key] = cache
+        return cache
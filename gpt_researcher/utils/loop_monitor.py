@@ -0,0 +1,122 @@
+"""
+Detection of event loop stalls.
+
+Anything synchronous that runs on the event loop (a blocking HTTP call, file I/O, a CPU-heavy
+parse) stalls every other coroutine of the process, e.g. every websocket session of the server.
+`LoopLagMonitor` measures how late a heartbeat coroutine wakes up, and a watchdog thread samples
+the loop thread's stack while the heartbeat is overdue, so each stall is reported together with
+the code that caused it.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """
+    Report event loop stalls longer than a threshold, with the stack of the blocking code.
+
+    Use as an async context manager, or call `start()` from a running loop and `await stop()`.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        interval: float | None = None,
+        on_stall: Callable[[Dict[str, Any]], None] | None = None,
+        max_stalls: int = 100,
+    ):
+        """
+        Args:
+            threshold: Lag in seconds from which a stall is reported.
+            interval: Seconds between heartbeats. Defaults to half the threshold.
+            on_stall: Called on the loop with every stall, in addition to logging it.
+            max_stalls: Number of most recent stalls kept in `stalls`.
+        """
+        self.threshold = threshold
+        self.interval = interval or threshold / 2
+        self.on_stall = on_stall
+        self.stalls = deque(maxlen=max_stalls)
+        self.max_lag = 0.0
+        self._lock = threading.Lock()
+        self._beat = 0.0
+        self._stack = None
+        self._loop_thread_id = None
+        self._task = None
+        self._watchdog = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopped.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await asyncio.to_thread(self._watchdog.join)
+
+    async def __aenter__(self) -> "LoopLagMonitor":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            with self._lock:
+                lag = now - self._beat - self.interval
+                self._beat = now
+                stack, self._stack = self._stack, None
+            self.max_lag = max(self.max_lag, lag)
+            if lag >= self.threshold:
+                self._report(lag, stack)
+
+    def _watch(self) -> None:
+        """Sample the loop thread's stack once per overdue heartbeat."""
+        sampled_beat = None
+        while not self._stopped.wait(self.interval / 2):
+            with self._lock:
+                beat = self._beat
+            if beat == sampled_beat or time.monotonic() - beat - self.interval < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            with self._lock:
+                if self._beat == beat:
+                    self._stack = stack
+            sampled_beat = beat
+
+    def _report(self, lag: float, stack: str | None) -> None:
+        stall = {"lag": lag, "stack": stack, "time": time.time()}
+        self.stalls.append(stall)
+        logger.warning(
+            f"Event loop was blocked for {lag * 1000:.0f}ms"
+            + (f", blocking code:\n{stack}" if stack else "")
+        )
+        if self.on_stall:
+            self.on_stall(stall)
@@ -0,0 +1,190 @@
+"""
+Coalescing, non-blocking output channel for websockets.
+
+`OutputChannel` wraps a websocket (or anything with an async `send_json`) and is used in its
+place. Sending only appends to a per-connection buffer, a background task writes the buffer to
+the socket, so the research coroutine never waits for a slow client:
+
+- Consecutive `report` chunks are merged into one frame, up to `max_chunk_chars` characters,
+  and the buffer is written at most every `flush_interval` seconds.
+- The buffer holds up to `max_pending` messages. When it is full, the oldest `logs` message is
+  dropped to make room. Report chunks and other messages are never dropped: when the buffer is
+  full of them, sending waits until the client has caught up, so the buffer stays bounded.
+- Frames are serialised with orjson when it is installed.
+- When writing to the socket fails (e.g. the client disconnected), the remaining messages are
+  discarded and the error is raised from the next `send_json`, `flush` or `close`, so the
+  research stops as it would writing to the socket directly.
+"""
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+DROPPABLE_TYPES = {"logs"}
+
+
+def dumps(data: Dict[str, Any]) -> str:
+    """Serialise a message to JSON, with orjson if it is available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class OutputChannel:
+    """
+    Per-connection output buffer in front of a websocket.
+
+    Args:
+        websocket: The websocket to write to. It is written with `send_text` when it has it,
+            and with `send_json` otherwise.
+        max_pending: Number of buffered messages before `logs` messages are dropped, or sending
+            waits for the client if there are none to drop.
+        flush_interval: Seconds messages are collected for before they are written.
+        max_chunk_chars: Maximum length of a merged report chunk.
+    """
+
+    def __init__(
+        self,
+        websocket: Any,
+        max_pending: int = 1000,
+        flush_interval: float = 0.05,
+        max_chunk_chars: int = 8192,
+    ):
+        self.websocket = websocket
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.max_chunk_chars = max_chunk_chars
+        self.dropped = 0
+        self.closed = False
+        self.error: Exception | None = None
+        self._error_raised = False
+        self._pending: deque[Dict[str, Any]] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._drained: asyncio.Event | None = None
+        self._space: asyncio.Event | None = None
+        self._sender: asyncio.Task | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything besides sending is answered by the wrapped websocket. It is looked up in
+        # __dict__, so a channel without one (e.g. while unpickling) doesn't recurse.
+        websocket = self.__dict__.get("websocket")
+        if websocket is None:
+            raise AttributeError(name)
+        return getattr(websocket, name)
+
+    async def send_json(self, data: Dict[str, Any]) -> None:
+        """Queue a message for the websocket. Only waits for the client when the buffer is full of messages that can't be dropped."""
+        self._raise_error()
+        if self.closed:
+            return
+        self._append(data)
+        self._ensure_sender()
+        self._drained.clear()
+        self._wakeup.set()
+        while len(self._pending) > self.max_pending and not self.closed:
+            self._space.clear()
+            await self._space.wait()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self.error is not None:
+            self._error_raised = True
+            raise self.error
+
+    def _append(self, data: Dict[str, Any]) -> None:
+        last = self._pending[-1] if self._pending else None
+        if (
+            last is not None
+            and _is_report_chunk(data)
+            and _is_report_chunk(last)
+            and len(last["output"]) + len(data["output"]) <= self.max_chunk_chars
+        ):
+            self._pending[-1] = {**last, "output": last["output"] + data["output"]}
+            return
+
+        if len(self._pending) >= self.max_pending:
+            for i, message in enumerate(self._pending):
+                if message.get("type") in DROPPABLE_TYPES:
+                    del self._pending[i]
+                    self._count_drop()
+                    break
+            else:
+                if data.get("type") in DROPPABLE_TYPES:
+                    self._count_drop()
+                    return
+        self._pending.append(data)
+
+    def _count_drop(self) -> None:
+        if not self.dropped:
+            logger.warning("Websocket client is falling behind, dropping log messages")
+        self.dropped += 1
+
+    def _ensure_sender(self) -> None:
+        if self._sender is None or self._sender.done():
+            self._wakeup = self._wakeup or asyncio.Event()
+            self._drained = self._drained or asyncio.Event()
+            self._space = self._space or asyncio.Event()
+            self._sender = asyncio.create_task(self._send_loop())
+
+    async def _send_loop(self) -> None:
+        while not self.closed or self._pending:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if self.flush_interval and not self.closed:
+                await asyncio.sleep(self.flush_interval)
+            while self._pending:
+                message = self._pending.popleft()
+                self._space.set()
+                try:
+                    if hasattr(self.websocket, "send_text"):
+                        await self.websocket.send_text(dumps(message))
+                    else:
+                        await self.websocket.send_json(message)
+                except Exception as e:
+                    logger.error(f"Error sending JSON through WebSocket: {e}")
+                    self.error = e
+                    self.closed = True
+                    self._pending.clear()
+                    self._drained.set()
+                    self._space.set()
+                    return
+            self._drained.set()
+            if self.closed:
+                return
+
+    async def flush(self) -> None:
+        """Wait until every queued message has been written. Raises the error writing failed with, if it did."""
+        if self._sender is not None and not self._sender.done():
+            await self._drained.wait()
+        self._raise_error()
+
+    async def close(self) -> None:
+        """
+        Write the remaining messages and stop the channel.
+
+        Raises the error writing failed with, unless it was already raised to a sender, so that
+        it doesn't replace the exception the research stopped with.
+        """
+        if self._sender is not None and not self._sender.done():
+            await self._drained.wait()
+        self.closed = True
+        if self._sender is not None:
+            self._wakeup.set()
+            await asyncio.gather(self._sender, return_exceptions=True)
+        if not self._error_raised:
+            self._raise_error()
+
+
+def _is_report_chunk(data: Dict[str, Any]) -> bool:
+    return data.get("type") == "report" and isinstance(data.get("output"), str) and set(data) <= {"type", "output"}
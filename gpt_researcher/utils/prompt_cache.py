@@ -0,0 +1,94 @@
+"""
+Provider-side prompt prefix caching.
+
+Providers cache the longest prompt prefix they have seen recently: OpenAI does so automatically,
+Anthropic for the prefixes ending at a `cache_control` breakpoint. Prompts written for caching
+put static instructions and stable context first and mark where each cacheable prefix ends with
+`CACHE_BREAKPOINT`. `apply_cache_breakpoints` turns the markers into the provider's format just
+before the call, and `prompt_cache_stats` keeps the cached-token counts reported back.
+"""
+import threading
+from typing import Any, Dict, List, Mapping
+
+# Marks the end of a cacheable prompt prefix
+CACHE_BREAKPOINT = "\n<!-- cache breakpoint -->\n"
+
+# Providers that take explicit breakpoints, and how many each request may have
+EXPLICIT_CACHE_PROVIDERS = {"anthropic": 4}
+
+
+def apply_cache_breakpoints(messages: List[Dict[str, Any]], llm_provider: str | None) -> List[Dict[str, Any]]:
+    """
+    Convert cache breakpoint markers in the messages to the provider's format.
+
+    For providers with explicit breakpoints, a message is split into text blocks at its markers
+    and every block that ends at a marker gets `cache_control`, earliest first up to the
+    provider's limit. For other providers the markers are removed, leaving the prefix in place
+    for automatic caching.
+    """
+    if not any(isinstance(m.get("content"), str) and CACHE_BREAKPOINT in m["content"] for m in messages):
+        return messages
+
+    budget = EXPLICIT_CACHE_PROVIDERS.get(llm_provider, 0)
+    converted = []
+    for message in messages:
+        content = message.get("content")
+        if not isinstance(content, str) or CACHE_BREAKPOINT not in content:
+            converted.append(message)
+            continue
+        parts = content.split(CACHE_BREAKPOINT)
+        if not budget:
+            converted.append({**message, "content": "\n".join(parts)})
+            continue
+        blocks = []
+        for i, part in enumerate(parts):
+            if not part:
+                continue
+            block = {"type": "text", "text": part}
+            if i < len(parts) - 1 and budget:
+                block["cache_control"] = {"type": "ephemeral"}
+                budget -= 1
+            blocks.append(block)
+        converted.append({**message, "content": blocks})
+    return converted
+
+
+class PromptCacheStats:
+    """Thread safe counters of prompt tokens served from provider caches, per provider and model."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def record(self, llm_provider: str | None, model: str | None, usage: Mapping[str, Any] | None) -> None:
+        """Record the usage metadata of a call, as reported by langchain."""
+        if not usage or usage.get("input_tokens") is None:
+            return
+        details = usage.get("input_token_details") or {}
+        key = f"{llm_provider}:{model}"
+        with self._lock:
+            stats = self._stats.setdefault(
+                key, {"calls": 0, "input_tokens": 0, "cache_read_tokens": 0, "cache_creation_tokens": 0}
+            )
+            stats["calls"] += 1
+            stats["input_tokens"] += usage["input_tokens"]
+            stats["cache_read_tokens"] += details.get("cache_read") or 0
+            stats["cache_creation_tokens"] += details.get("cache_creation") or 0
+
+    def get(self) -> Dict[str, Dict[str, Any]]:
+        """Get the counters of every provider and model, with the share of input tokens read from cache."""
+        with self._lock:
+            return {
+                key: {
+                    **stats,
+                    "hit_rate": stats["cache_read_tokens"] / stats["input_tokens"] if stats["input_tokens"] else 0.0,
+                }
+                for key, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+prompt_cache_stats = PromptCacheStats()
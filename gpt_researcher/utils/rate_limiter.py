@@ -0,0 +1,178 @@
+"""
+Process-wide rate limiting and backoff for LLM calls.
+
+Every (provider, model) pair gets one `RateLimiter`, shared by all researchers, deep research
+branches and multi-agent sections in the process with the same limits. Limits come from the config:
+
+- `LLM_MAX_REQUESTS_PER_MINUTE`: requests per minute per provider and model (default 0, unlimited).
+- `LLM_MAX_TOKENS_PER_MINUTE`: prompt and completion tokens per minute per provider and model (default 0, unlimited).
+- `LLM_MAX_RETRIES`: retries of a rate limited or transiently failing call (default 5).
+
+When a call is rate limited anyway, the whole (provider, model) pauses for the time the provider
+asked for in its Retry-After header, or a jittered exponential backoff without one.
+"""
+import asyncio
+import random
+import threading
+import time
+from typing import Any, NamedTuple
+
+# Status codes worth retrying: rate limited, server errors and overloaded (Anthropic's 529)
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class TokenBucket:
+    """A bucket that holds up to `capacity` units and refills at `capacity` units per minute."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.level = per_minute
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` units are available. Requests larger than the bucket wait for a full bucket."""
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.rate)
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter on requests and tokens per minute.
+
+    Args:
+        requests_per_minute: Maximum requests per minute. 0 disables the request limit.
+        tokens_per_minute: Maximum tokens per minute. 0 disables the token limit.
+    """
+
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self.paused_until = 0.0
+        # Buckets are shared by threads and event loops, so they are guarded by a thread lock
+        self._lock = threading.Lock()
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until a request of about `tokens` tokens fits in the limits, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self.paused_until - now
+                for bucket, amount in ((self.requests, 1), (self.tokens, tokens)):
+                    if bucket is not None:
+                        bucket.refill(now)
+                        wait = max(wait, bucket.wait_time(amount))
+                if wait <= 0:
+                    if self.requests is not None:
+                        self.requests.level -= 1
+                    if self.tokens is not None:
+                        self.tokens.level -= tokens
+                    return
+            await asyncio.sleep(wait)
+
+    def record(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once the actual usage of a request is known."""
+        if self.tokens is None:
+            return
+        with self._lock:
+            self.tokens.level -= actual_tokens - estimated_tokens
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request through this limiter for `seconds`."""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class RateLimits(NamedTuple):
+    """Rate limits and retries of LLM calls, see `get_rate_limits`."""
+
+    requests_per_minute: float = 0
+    tokens_per_minute: float = 0
+    max_retries: int = 5
+
+
+def get_rate_limits(cfg) -> RateLimits:
+    """
+    Get the LLM rate limits of a config.
+
+    Args:
+        cfg (Config): The configuration object.
+
+    Returns:
+        RateLimits: The configured limits, with the defaults for settings the config doesn't have.
+    """
+    defaults = RateLimits()
+    return RateLimits(
+        requests_per_minute=float(getattr(cfg, "llm_max_requests_per_minute", defaults.requests_per_minute) or 0),
+        tokens_per_minute=float(getattr(cfg, "llm_max_tokens_per_minute", defaults.tokens_per_minute) or 0),
+        max_retries=int(getattr(cfg, "llm_max_retries", defaults.max_retries) or 0),
+    )
+
+
+_limiters: dict[tuple, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(llm_provider: str | None, model: str | None, limits: RateLimits | None = None) -> RateLimiter:
+    """Get the process-wide rate limiter of a provider, model and limits, creating it on first use."""
+    limits = limits or RateLimits()
+    key = (llm_provider, model, limits.requests_per_minute, limits.tokens_per_minute)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(
+                requests_per_minute=limits.requests_per_minute,
+                tokens_per_minute=limits.tokens_per_minute,
+            )
+            _limiters[key] = limiter
+        return limiter
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an LLM call failed because of rate limiting, a transient server error or a lost connection."""
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES
+    name = type(error).__name__
+    # Connection errors (openai.APIConnectionError, httpx.ConnectError, resets) were retried by the SDKs' own retries
+    return (
+        "RateLimit" in name or "Timeout" in name or "Overloaded" in name or "Connect" in name
+        or isinstance(error, (TimeoutError, ConnectionError))
+    )
+
+
+def retry_delay(error: BaseException, attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """
+    Seconds to wait before retrying a failed call.
+
+    Honours the provider's Retry-After header, and otherwise uses a full-jitter exponential
+    backoff, so concurrent callers that failed together don't retry together.
+    """
+    retry_after = _retry_after(error)
+    if retry_after is not None:
+        return min(cap, retry_after) + random.uniform(0, base)
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def _status_code(error: BaseException) -> int | None:
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after(error: BaseException) -> float | None:
+    headers: Any = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        # Retry-After may also be an HTTP date, the exponential backoff is close enough
+        pass
+    return None
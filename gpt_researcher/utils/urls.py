@@ -0,0 +1,121 @@
+"""
+Canonical urls and an index of the pages already researched.
+
+Search results often reach the same article through different urls: tracking parameters,
+fragments, `http` and `https`, `www.` and mobile hosts, AMP variants and trailing slashes.
+`canonicalize_url` maps them to one canonical url, and `URLIndex` remembers the canonical urls
+(and optionally content fingerprints) seen during a research so every page is scraped, embedded
+and cited once.
+"""
+import re
+from typing import Dict, Iterable, List
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit
+
+from .cache import hash_key
+
+# Query parameters that identify the visitor or campaign rather than the page
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "gclsrc", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "ref_src", "ref_url", "cmpid", "ocid", "mkt_tok", "s_cid", "amp", "outputtype",
+}
+TRACKING_PREFIXES = ("utm_",)
+HOST_PREFIXES = ("www.", "m.", "amp.")
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+_AMP_CACHE_SUFFIX = ".cdn.ampproject.org"
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Get the canonical url of a page, for identifying pages rather than fetching them.
+
+    Uses `https`, lowercases the host and drops its default port and `www.`, `m.` and `amp.`
+    prefixes, unwraps AMP cache urls, drops AMP path suffixes, fragments, tracking query
+    parameters and trailing slashes, and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").rstrip(".")
+    path = parts.path
+
+    # https://example-com.cdn.ampproject.org/c/s/example.com/article
+    if host.endswith(_AMP_CACHE_SUFFIX) and path.startswith("/c/"):
+        segments = path[len("/c/"):].split("/", 2)
+        if segments[0] == "s":
+            segments = segments[1:]
+        host = segments[0].lower()
+        path = "/" + "/".join(segments[1:])
+
+    if parts.port and str(parts.port) != _DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{parts.port}"
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+
+    path = re.sub(r"/{2,}", "/", unquote(path))
+    path = re.sub(r"(/amp)+/?$", "", path)
+    path = re.sub(r"\.amp(\.html?)$", r"\1", path)
+    path = path.rstrip("/")
+
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ))
+    return f"https://{host}{path}" + (f"?{query}" if query else "")
+
+
+def content_fingerprint(content: str) -> str:
+    """Fingerprint of a page's text that ignores case and whitespace."""
+    return hash_key(" ".join(content.lower().split()))
+
+
+def unique_urls(urls: Iterable[str]) -> List[str]:
+    """The first url of every canonical url, in order."""
+    seen = set()
+    unique = []
+    for url in urls:
+        canonical = canonicalize_url(url)
+        if canonical not in seen:
+            seen.add(canonical)
+            unique.append(url)
+    return unique
+
+
+class URLIndex:
+    """
+    Index of the pages seen during a research, by canonical url and content fingerprint.
+
+    Args:
+        min_content_length: Pages with less text than this are never considered duplicates by
+            content, so short error and consent pages don't hide each other.
+    """
+
+    def __init__(self, min_content_length: int = 200):
+        self.min_content_length = min_content_length
+        self._urls: Dict[str, str] = {}
+        self._fingerprints: Dict[str, str] = {}
+
+    def __contains__(self, url: str) -> bool:
+        return canonicalize_url(url) in self._urls
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def add(self, url: str) -> bool:
+        """Record a url. Returns False if the same page was already recorded."""
+        canonical = canonicalize_url(url)
+        if canonical in self._urls:
+            return False
+        self._urls[canonical] = url
+        return True
+
+    def add_content(self, url: str, content: str | None) -> bool:
+        """
+        Record the content of a scraped page.
+
+        Returns:
+            bool: False if the same content was already recorded for a different page.
+        """
+        if not content or len(content) < self.min_content_length:
+            return True
+        canonical = canonicalize_url(url)
+        first = self._fingerprints.setdefault(content_fingerprint(content), canonical)
+        return first == canonical
@@ -1,15 +1,35 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
+_process_executors: dict[int, ProcessPoolExecutor] = {}
+_process_executors_lock = threading.Lock()
+
+
+def get_process_executor(max_workers: int) -> ProcessPoolExecutor:
+    """Return the process-wide process pool of the given size, creating it on first use."""
+    with _process_executors_lock:
+        executor = _process_executors.get(max_workers)
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            _process_executors[max_workers] = executor
+        return executor
+
 
 class WorkerPool:
-    def __init__(self, max_workers: int):
+    def __init__(self, max_workers: int, process_workers: int = 0):
         self.max_workers = max_workers
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.semaphore = asyncio.Semaphore(max_workers)
+        # CPU-bound work such as HTML parsing, shared between all pools of the process
+        self.process_executor = get_process_executor(process_workers) if process_workers > 0 else None
 
     @asynccontextmanager
     async def throttle(self):
         async with self.semaphore:
             yield
+
+    def shutdown(self) -> None:
+        """Stop the pool's threads once their current work is done. The shared process pool stays up."""
+        self.executor.shutdown(wait=False)
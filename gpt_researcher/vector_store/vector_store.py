@@ -1,6 +1,7 @@
 """
 Wrapper for langchain vector store
 """
+import asyncio
 from typing import List, Dict
 
 from langchain.docstore.document import Document
@@ -22,6 +23,15 @@ class VectorStoreWrapper:
         langchain_documents = self._create_langchain_documents(documents)
         splitted_documents = self._split_documents(langchain_documents)
         self.vector_store.add_documents(splitted_documents)
+
+    async def aload(self, documents):
+        """
+        Load the documents into vector_store without blocking the event loop.
+        Documents are split in a worker thread and added with the store's async API
+        """
+        langchain_documents = self._create_langchain_documents(documents)
+        splitted_documents = await asyncio.to_thread(self._split_documents, langchain_documents)
+        await self.vector_store.aadd_documents(splitted_documents)
     
     def _create_langchain_documents(self, data: List[Dict[str, str]]) -> List[Document]:
         """Convert GPT Researcher Document to Langchain Document"""
@@ -13,10 +13,12 @@ from . import ResearchAgent, ReviewerAgent, ReviserAgent
 class EditorAgent:
     """Agent responsible for editing and managing code."""
 
-    def __init__(self, websocket=None, stream_output=None, headers=None):
+    def __init__(self, websocket=None, stream_output=None, headers=None, runtime=None):
         self.websocket = websocket
         self.stream_output = stream_output
         self.headers = headers or {}
+        # The research runtime shared by every section's researchers
+        self.runtime = runtime
 
     async def plan_research(self, research_state: Dict[str, any]) -> Dict[str, any]:
         """
@@ -117,7 +119,7 @@ class EditorAgent:
     def _initialize_agents(self) -> Dict[str, any]:
         """Initialize the research, reviewer, and reviser skills."""
         return {
-            "research": ResearchAgent(self.websocket, self.stream_output, self.headers),
+            "research": ResearchAgent(self.websocket, self.stream_output, self.headers, runtime=self.runtime),
             "reviewer": ReviewerAgent(self.websocket, self.stream_output, self.headers),
             "reviser": ReviserAgent(self.websocket, self.stream_output, self.headers),
         }
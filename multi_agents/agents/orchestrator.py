@@ -2,6 +2,7 @@ import os
 import time
 import datetime
 from langgraph.graph import StateGraph, END
+from gpt_researcher import ResearchRuntime
 # from langgraph.checkpoint.memory import MemorySaver
 from .utils.views import print_agent_output
 from ..memory.research import ResearchState
@@ -25,6 +26,8 @@ class ChiefEditorAgent:
         self.stream_output = stream_output
         self.headers = headers or {}
         self.tone = tone
+        # Shared by every researcher of the run and closed when the run ends
+        self.runtime = ResearchRuntime()
         self.task_id = self._generate_task_id()
         self.output_dir = self._create_output_directory()
 
@@ -43,8 +46,8 @@ class ChiefEditorAgent:
     def _initialize_agents(self):
         return {
             "writer": WriterAgent(self.websocket, self.stream_output, self.headers),
-            "editor": EditorAgent(self.websocket, self.stream_output, self.headers),
-            "research": ResearchAgent(self.websocket, self.stream_output, self.tone, self.headers),
+            "editor": EditorAgent(self.websocket, self.stream_output, self.headers, runtime=self.runtime),
+            "research": ResearchAgent(self.websocket, self.stream_output, self.tone, self.headers, runtime=self.runtime),
             "publisher": PublisherAgent(self.output_dir, self.websocket, self.stream_output, self.headers),
             "human": HumanAgent(self.websocket, self.stream_output, self.headers)
         }
@@ -114,5 +117,8 @@ class ChiefEditorAgent:
             }
         }
 
-        result = await chain.ainvoke({"task": self.task}, config=config)
+        try:
+            result = await chain.ainvoke({"task": self.task}, config=config)
+        finally:
+            self.runtime.close()
         return result
@@ -4,17 +4,21 @@ from .utils.views import print_agent_output
 
 
 class ResearchAgent:
-    def __init__(self, websocket=None, stream_output=None, tone=None, headers=None):
+    def __init__(self, websocket=None, stream_output=None, tone=None, headers=None, runtime=None):
         self.websocket = websocket
         self.stream_output = stream_output
         self.headers = headers or {}
         self.tone = tone
+        # Shared by every researcher of this agent, created with the first one
+        self.runtime = runtime
 
     async def research(self, query: str, research_report: str = "research_report",
                        parent_query: str = "", verbose=True, source="web", tone=None, headers=None):
         # Initialize the researcher
         researcher = GPTResearcher(query=query, report_type=research_report, parent_query=parent_query,
-                                   verbose=verbose, report_source=source, tone=tone, websocket=self.websocket, headers=self.headers)
+                                   verbose=verbose, report_source=source, tone=tone, websocket=self.websocket, headers=self.headers,
+                                   runtime=self.runtime)
+        self.runtime = researcher.runtime
         # Conduct research on the given query
         await researcher.conduct_research()
         # Write the report
@@ -5,6 +5,7 @@ from loguru import logger
 
 from gpt_researcher.config.config import Config
 from gpt_researcher.utils.llm import create_chat_completion
+from gpt_researcher.utils.rate_limiter import get_rate_limits
 
 
 async def call_model(
@@ -23,6 +24,7 @@ async def call_model(
             temperature=0,
             llm_provider=cfg.smart_llm_provider,
             llm_kwargs=cfg.llm_kwargs,
+            rate_limits=get_rate_limits(cfg),
             # cost_callback=cost_callback,
         )
 
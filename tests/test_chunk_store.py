@@ -0,0 +1,98 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from gpt_researcher.context import chunk_store
+from gpt_researcher.context.chunk_store import ChunkStore
+from gpt_researcher.skills.context_manager import ContextManager
+
+VOCABULARY = ["solar", "wind", "coal", "battery"]
+
+
+class KeywordEmbeddings(Embeddings):
+    def __init__(self):
+        self.documents_embedded = 0
+
+    def _embed(self, text):
+        return [float(text.lower().count(word)) for word in VOCABULARY]
+
+    def embed_documents(self, texts):
+        self.documents_embedded += len(texts)
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+
+PAGES = [
+    {"url": "https://a.example", "title": "A", "raw_content": "solar solar panels and a battery"},
+    {"url": "https://b.example", "title": "B", "raw_content": "wind turbines and wind farms"},
+    {"url": "https://c.example", "title": "C", "raw_content": "coal power plants"},
+]
+
+
+@pytest.mark.asyncio
+async def test_pages_are_embedded_once():
+    embeddings = KeywordEmbeddings()
+    store = ChunkStore(embeddings)
+
+    await store.add_pages(PAGES)
+    await store.add_pages(PAGES[:2])
+
+    assert len(store) == 3
+    assert embeddings.documents_embedded == 3
+
+
+@pytest.mark.asyncio
+async def test_queries_are_scored_together():
+    store = ChunkStore(KeywordEmbeddings())
+    await store.add_pages(PAGES)
+
+    solar, wind = await store.similarity_search_many(["solar", "wind"], k=2, similarity_threshold=0.1)
+
+    assert [doc.metadata["source"] for doc, _ in solar] == ["https://a.example"]
+    assert [doc.metadata["source"] for doc, _ in wind] == ["https://b.example"]
+
+
+@pytest.mark.asyncio
+async def test_queries_can_be_restricted_to_their_sources():
+    store = ChunkStore(KeywordEmbeddings())
+    await store.add_pages(PAGES)
+
+    restricted, unrestricted = await store.similarity_search_many(
+        ["solar", "solar"], k=3, sources=[{"https://c.example"}, None]
+    )
+
+    assert {doc.metadata["source"] for doc, _ in restricted} == {"https://c.example"}
+    assert unrestricted[0][0].metadata["source"] == "https://a.example"
+
+
+@pytest.mark.asyncio
+async def test_pages_are_embedded_as_scraped_until_the_top_k_is_stable(monkeypatch):
+    async def no_cost(model, docs):
+        return 0.0
+
+    monkeypatch.setattr(chunk_store, "aestimate_embedding_cost", no_cost)
+    researcher = SimpleNamespace(
+        cfg=SimpleNamespace(chunk_store=True),
+        memory=SimpleNamespace(get_embeddings=KeywordEmbeddings),
+        verbose=False,
+        add_costs=lambda cost: None,
+    )
+    manager = ContextManager(researcher)
+    scraped = []
+
+    async def pages():
+        for i in range(10):
+            page = {"url": f"https://{i}.example", "title": str(i), "raw_content": f"wind page {i}"}
+            scraped.append(page)
+            yield page
+            await asyncio.sleep(0.01)
+
+    consumed = await manager.add_pages_as_scraped("wind", pages(), patience=2, k=1)
+
+    assert len(consumed) < 10
+    assert consumed == scraped
+    assert len(manager.chunk_store) == len(consumed)
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from gpt_researcher.context import chunk_store
+from gpt_researcher.context.selection import merge_chunks, mmr_select
+from gpt_researcher.prompts import PromptFamily
+from gpt_researcher.skills.context_manager import ContextManager
+
+VOCABULARY = ["solar", "wind", "price", "storage"]
+
+
+class KeywordEmbeddings(Embeddings):
+    def _embed(self, text):
+        return [float(text.lower().count(word)) for word in VOCABULARY]
+
+    def embed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+
+def document(content, source="https://example.com"):
+    return Document(page_content=content, metadata={"source": source, "title": ""})
+
+
+def test_chunks_found_by_several_queries_are_merged_once_by_rank():
+    shared, solar, wind = document("shared"), document("solar"), document("wind")
+
+    merged = merge_chunks([[shared, solar], [document("shared"), wind], []])
+
+    assert merged == [shared, solar, wind]
+
+
+def test_mmr_trades_relevance_for_diversity():
+    vectors = np.array([[1.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+    relevance = np.array([0.9, 0.85, 0.5])
+
+    assert mmr_select(relevance, vectors, 2, lambda_mult=1.0) == [0, 1]
+    assert mmr_select(relevance, vectors, 2, lambda_mult=0.5) == [0, 2]
+
+
+def manager_for(monkeypatch, **cfg):
+    async def no_cost(model, docs):
+        return 0.0
+
+    monkeypatch.setattr(chunk_store, "aestimate_embedding_cost", no_cost)
+    researcher = SimpleNamespace(
+        cfg=SimpleNamespace(chunk_store=True, **cfg),
+        memory=SimpleNamespace(get_embeddings=KeywordEmbeddings),
+        prompt_family=PromptFamily,
+        verbose=False,
+        add_costs=lambda cost: None,
+    )
+    return ContextManager(researcher)
+
+
+PAGES = [
+    {"url": "https://a.example", "title": "A", "raw_content": "solar price"},
+    {"url": "https://b.example", "title": "B", "raw_content": "solar price falls"},
+    {"url": "https://c.example", "title": "C", "raw_content": "wind storage price"},
+]
+
+
+@pytest.mark.asyncio
+async def test_context_holds_each_chunk_once(monkeypatch):
+    manager = manager_for(monkeypatch)
+    queries = ["solar price", "solar"]
+
+    results = await manager.get_similar_documents_by_queries(queries, [PAGES, PAGES])
+    context = await manager.merge_documents(queries, results)
+
+    assert sorted(record.source for record in context) == ["https://a.example", "https://b.example", "https://c.example"]
+    assert str(context).count("https://a.example") == 1
+
+
+@pytest.mark.asyncio
+async def test_chunk_budget_selects_diverse_chunks(monkeypatch):
+    manager = manager_for(monkeypatch, context_chunk_budget=2, context_mmr_lambda=0.3)
+    queries = ["solar price"]
+
+    results = await manager.get_similar_documents_by_queries(queries, [PAGES])
+    context = await manager.merge_documents(queries, results)
+
+    # The two solar chunks say the same thing, so the budget goes to one of them and the less relevant wind chunk
+    assert len(context) == 2
+    assert "https://c.example" in context.sources
@@ -0,0 +1,46 @@
+from gpt_researcher.context.packer import pack_context, split_context
+from gpt_researcher.utils import costs
+
+
+def block(source, content):
+    return f"Source: {source}\nTitle: {source}\nContent: {content}\n"
+
+
+SOLAR = "Solar panels convert sunlight into electricity and solar capacity doubled last year."
+WIND = "Offshore wind farms are growing quickly along the North Sea coast."
+COAL = "Coal plants are being retired across Europe as prices rise."
+
+# Two sub-queries' contexts, joined the way the research conductor joins them
+CONTEXT = " ".join([
+    "\n".join([block("https://a.example", SOLAR), block("https://b.example", WIND)]),
+    "\n".join([block("https://c.example", COAL), block("https://d.example", SOLAR + " ")]),
+])
+
+
+def test_context_is_split_into_source_blocks():
+    chunks = split_context("Context from local documents:\n\n" + CONTEXT)
+
+    assert [chunk["source"] for chunk in chunks] == [
+        None, "https://a.example", "https://b.example", "https://c.example", "https://d.example"
+    ]
+    assert chunks[2]["content"] == WIND
+
+
+def test_duplicates_are_dropped_and_chunks_ranked_by_relevance():
+    packed = pack_context(CONTEXT, "solar electricity", token_budget=10_000)
+
+    assert packed.startswith(block("https://a.example", SOLAR))
+    assert "https://d.example" not in packed
+    assert "https://b.example" in packed and "https://c.example" in packed
+
+
+def test_chunks_are_packed_into_the_token_budget(monkeypatch):
+    costs.get_token_counter.cache_clear()
+    monkeypatch.setattr(costs, "_get_model_encoding", lambda model: 1 / 0)
+    monkeypatch.setattr(costs, "_get_encoding", lambda name: 1 / 0)
+    budget = len(block("https://a.example", SOLAR)) // 4 + 1 + len(block("https://b.example", WIND)) // 4 + 1
+
+    packed = pack_context(CONTEXT, "solar wind", token_budget=budget, model="gpt-4o")
+    costs.get_token_counter.cache_clear()
+
+    assert {chunk["source"] for chunk in split_context(packed)} == {"https://a.example", "https://b.example"}
@@ -0,0 +1,46 @@
+import pytest
+
+from gpt_researcher.utils import costs
+
+
+def test_reported_usage_is_preferred_over_tokenising(monkeypatch):
+    def no_tokenizer(name):
+        raise AssertionError("tokenizer should not be used")
+
+    monkeypatch.setattr(costs, "_get_encoding", no_tokenizer)
+
+    cost = costs.estimate_llm_cost("prompt", "response", {"input_tokens": 1000, "output_tokens": 100})
+
+    assert cost == pytest.approx(1000 * costs.INPUT_COST_PER_TOKEN + 100 * costs.OUTPUT_COST_PER_TOKEN)
+
+
+class WordEncoding:
+    name = "words"
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, text, **kwargs):
+        self.encoded.append(text)
+        return text.split()
+
+
+def test_documents_are_only_tokenised_once(monkeypatch):
+    encoding = WordEncoding()
+    monkeypatch.setattr(costs, "_get_model_encoding", lambda model: encoding)
+    docs = [f"a rarely repeated document number {i}" for i in range(3)]
+
+    first = costs.estimate_embedding_cost("text-embedding-3-small", docs)
+    second = costs.estimate_embedding_cost("text-embedding-3-small", docs)
+
+    assert first == second == 18 * costs.EMBEDDING_COST
+    assert encoding.encoded == docs
+
+
+@pytest.mark.asyncio
+async def test_cost_without_usage_falls_back_to_the_tokenizer(monkeypatch):
+    monkeypatch.setattr(costs, "_get_encoding", lambda name: WordEncoding())
+
+    cost = await costs.aestimate_llm_cost("hello world", "hi", None)
+
+    assert cost == pytest.approx(2 * costs.INPUT_COST_PER_TOKEN + 1 * costs.OUTPUT_COST_PER_TOKEN)
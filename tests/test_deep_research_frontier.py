@@ -0,0 +1,84 @@
+import asyncio
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.skills.deep_research import DeepResearchSkill, ResearchFrontier
+
+
+class FakeDeepResearch(DeepResearchSkill):
+    """Deep research whose queries are planned and researched by fakes, recording the order of events"""
+
+    def __init__(self, plans, delays, concurrency=2, priority="depth"):
+        cfg = SimpleNamespace(deep_research_concurrency=concurrency, deep_research_priority=priority)
+        super().__init__(SimpleNamespace(cfg=cfg, websocket=None, tone=None, headers={}, visited_urls=set()))
+        self.plans = plans
+        self.delays = delays
+        self.events = []
+        self.running = 0
+        self.max_running = 0
+
+    async def generate_search_queries(self, query, num_queries=3):
+        goal = re.search(r"Previous research goal: (.*)", query)
+        plan = self.plans[goal.group(1).strip() if goal else query]
+        return [{"query": q, "researchGoal": q} for q in plan[:num_queries]]
+
+    async def research_query(self, serp_query):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.events.append(("start", serp_query["query"]))
+        await asyncio.sleep(self.delays.get(serp_query["query"], 0.01))
+        self.events.append(("end", serp_query["query"]))
+        self.running -= 1
+        return {
+            "learnings": [f"learned {serp_query['query']}"],
+            "visited_urls": [],
+            "followUpQuestions": [],
+            "researchGoal": serp_query["query"],
+            "citations": {},
+            "context": f"context {serp_query['query']}",
+            "sources": [],
+        }
+
+
+PLANS = {
+    "root": ["solar costs", "wind costs"],
+    "solar costs": ["solar panel prices", "solar installation prices"],
+    "wind costs": ["offshore wind prices", "onshore wind prices"],
+}
+
+
+@pytest.mark.asyncio
+async def test_follow_ups_start_without_waiting_for_slow_siblings():
+    skill = FakeDeepResearch(PLANS, {"wind costs": 0.2}, concurrency=2)
+
+    results = await skill.deep_research("root", breadth=2, depth=2)
+
+    events = skill.events
+    assert events.index(("start", "solar panel prices")) < events.index(("end", "wind costs"))
+    assert skill.max_running == 2
+    assert len(results["context"]) == 6
+    assert "learned onshore wind prices" in results["learnings"]
+
+
+@pytest.mark.asyncio
+async def test_near_identical_follow_up_queries_are_researched_once():
+    plans = {"root": ["solar costs", "costs solar", "wind costs"]}
+    skill = FakeDeepResearch(plans, {})
+
+    results = await skill.deep_research("root", breadth=3, depth=1)
+
+    assert [query for kind, query in skill.events if kind == "start"] == ["solar costs", "wind costs"]
+    assert len(results["context"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_budget_priority_finishes_branches_first():
+    frontier = ResearchFrontier(total_depth=2, priority="budget")
+    frontier.push({"kind": "research", "query": "wind costs", "depth": 2})
+    frontier.push({"kind": "research", "query": "solar panel prices", "depth": 1})
+
+    _, _, item = await frontier.queue.get()
+
+    assert item["query"] == "solar panel prices"
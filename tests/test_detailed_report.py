@@ -0,0 +1,129 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.report_type.detailed_report import detailed_report as detailed_report_module
+from backend.report_type.detailed_report.detailed_report import DetailedReport
+from gpt_researcher.actions import reconcile_sections
+from gpt_researcher.context import ResearchContext
+
+COSTS = "Utility scale solar now costs less than new gas plants in most markets according to recent auctions."
+
+SOLAR = f"""## Solar Power
+
+### Costs
+
+{COSTS}
+
+### Growth
+
+Installed capacity doubled in two years.
+"""
+
+STORAGE = f"""## Energy Storage
+
+### Costs
+
+Battery pack prices fell by ninety percent over the last decade as production scaled up.
+
+### Solar Costs
+
+{COSTS}
+"""
+
+
+def test_repeated_sections_are_dropped_and_repeated_headers_qualified():
+    solar, storage = reconcile_sections([SOLAR, STORAGE])
+
+    assert solar == SOLAR
+    assert "### Costs (Energy Storage)" in storage
+    assert "Battery pack prices" in storage
+    assert "### Solar Costs" not in storage and COSTS not in storage
+
+
+class SubtopicReports(DetailedReport):
+    """A detailed report whose subtopics are written by a fake, recording how many run at once"""
+
+    def __init__(self, concurrency):
+        self.gpt_researcher = SimpleNamespace(cfg=SimpleNamespace(subtopic_concurrency=concurrency))
+        self.websocket = None
+        self.running = 0
+        self.max_running = 0
+
+    async def _get_subtopic_report(self, subtopic, websocket=None):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        # Later subtopics finish first
+        await asyncio.sleep(0.05 / (subtopic["index"] + 1))
+        self.running -= 1
+        return {"topic": subtopic, "report": subtopic["report"]}
+
+
+@pytest.mark.asyncio
+async def test_subtopics_run_concurrently_and_keep_their_order():
+    detailed_report = SubtopicReports(concurrency=2)
+    subtopics = [{"index": i, "report": report} for i, report in enumerate([SOLAR, STORAGE, "## Wind\n"])]
+
+    subtopic_reports, body = await detailed_report._generate_subtopic_reports(subtopics)
+
+    assert detailed_report.max_running == 2
+    assert [result["topic"]["index"] for result in subtopic_reports] == [0, 1, 2]
+    assert body.index("## Solar Power") < body.index("## Energy Storage") < body.index("## Wind")
+    assert body.count(COSTS) == 1
+
+
+@pytest.mark.asyncio
+async def test_subtopics_run_one_after_another_by_default():
+    detailed_report = SubtopicReports(concurrency=1)
+    subtopics = [{"index": i, "report": report} for i, report in enumerate([SOLAR, STORAGE])]
+
+    await detailed_report._generate_subtopic_reports(subtopics)
+
+    assert detailed_report.max_running == 1
+
+
+class SubtopicResearcher:
+    """Researches a subtopic the way `GPTResearcher` treats `visited_urls`: cleared, then filled"""
+
+    def __init__(self, query, visited_urls, **kwargs):
+        self.query = query
+        self.visited_urls = visited_urls
+
+    async def conduct_research(self):
+        self.visited_urls.clear()
+        await asyncio.sleep(0.01)
+        self.visited_urls.add(f"https://example.com/{self.query}")
+
+    async def get_draft_section_titles(self, query):
+        return ""
+
+    async def get_similar_written_contents_by_draft_section_titles(self, *args):
+        return []
+
+    async def write_report(self, *args):
+        return f"## {self.query}\n"
+
+    def get_research_records(self):
+        return ResearchContext()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_subtopics_keep_each_others_visited_urls(monkeypatch):
+    monkeypatch.setattr(detailed_report_module, "GPTResearcher", SubtopicResearcher)
+    detailed_report = DetailedReport.__new__(DetailedReport)
+    detailed_report.__dict__.update(
+        gpt_researcher=SimpleNamespace(
+            cfg=SimpleNamespace(subtopic_concurrency=3), agent=None, role=None, runtime=None,
+            extract_headers=lambda report: [], extract_sections=lambda report: [],
+        ),
+        websocket=None, query="Energy", query_domains=[], report_source="web", headers={}, subtopics=[],
+        tone=None, complement_source_urls=False, source_urls=[], global_written_sections=[],
+        global_context=ResearchContext(), global_urls={"https://example.com/Energy"}, existing_headers=[],
+    )
+
+    await detailed_report._generate_subtopic_reports([{"task": task} for task in ["solar", "wind", "storage"]])
+
+    assert detailed_report.global_urls == {
+        f"https://example.com/{query}" for query in ["Energy", "solar", "wind", "storage"]
+    }
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from gpt_researcher.memory.batching import BatchedEmbeddings
+
+
+class RecordingEmbeddings(Embeddings):
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    def embed_query(self, text):
+        raise AssertionError("queries should be sent through embed_documents")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_one_request():
+    inner = RecordingEmbeddings()
+    embeddings = BatchedEmbeddings(inner, wait=0.01)
+
+    vectors = await asyncio.gather(*[embeddings.aembed_query(text) for text in ["a", "bb", "ccc"]])
+
+    assert vectors == [[1.0], [2.0], [3.0]]
+    assert inner.calls == [["a", "bb", "ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting_for_the_window():
+    inner = RecordingEmbeddings()
+    embeddings = BatchedEmbeddings(inner, wait=30, max_batch_size=2)
+
+    vectors = await asyncio.wait_for(
+        asyncio.gather(*[embeddings.aembed_query(text) for text in ["a", "bb"]]), timeout=1
+    )
+
+    assert vectors == [[1.0], [2.0]]
+    assert inner.calls == [["a", "bb"]]
+
+
+@pytest.mark.asyncio
+async def test_queries_beyond_a_full_batch_start_a_new_one():
+    inner = RecordingEmbeddings()
+    embeddings = BatchedEmbeddings(inner, wait=0.01, max_batch_size=2)
+
+    vectors = await asyncio.gather(*[embeddings.aembed_query(text) for text in ["a", "bb", "ccc"]])
+
+    assert vectors == [[1.0], [2.0], [3.0]]
+    assert inner.calls == [["a", "bb"], ["ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_threaded_queries_share_one_request():
+    inner = RecordingEmbeddings()
+    embeddings = BatchedEmbeddings(inner, wait=0.05)
+
+    vectors = await asyncio.gather(*[asyncio.to_thread(embeddings.embed_query, text) for text in ["a", "bb"]])
+
+    assert vectors == [[1.0], [2.0]]
+    assert inner.calls == [["a", "bb"]]
+
+
+def test_full_threaded_batch_is_sent_without_waiting_for_the_window():
+    inner = RecordingEmbeddings()
+    embeddings = BatchedEmbeddings(inner, wait=30, max_batch_size=1)
+
+    assert embeddings.embed_query("a") == [1.0]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_caller_does_not_fail_the_batch():
+    inner = RecordingEmbeddings()
+    embeddings = BatchedEmbeddings(inner, wait=0.01)
+    first = asyncio.create_task(embeddings.aembed_query("a"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(embeddings.aembed_query("bb"))
+    await asyncio.sleep(0)
+
+    first.cancel()
+
+    assert await second == [2.0]
+    assert inner.calls == [["a", "bb"]]
+    with pytest.raises(asyncio.CancelledError):
+        await first
@@ -0,0 +1,85 @@
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from gpt_researcher.memory.cache import CachedEmbeddings, get_embedding_cache
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self):
+        self.embedded = []
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text):
+        self.embedded.append(text)
+        return [float(len(text)), 0.0]
+
+
+def test_documents_are_embedded_once(tmp_path):
+    inner = CountingEmbeddings()
+    cache = get_embedding_cache(str(tmp_path / "first"))
+    embeddings = CachedEmbeddings(inner, cache, namespace="test:model")
+
+    first = embeddings.embed_documents(["alpha", "beta", "alpha"])
+    second = embeddings.embed_documents(["beta", "gamma"])
+
+    assert first == [[5.0, 1.0], [4.0, 1.0], [5.0, 1.0]]
+    assert second == [[4.0, 1.0], [5.0, 1.0]]
+    assert inner.embedded == ["alpha", "beta", "gamma"]
+
+
+def test_persistent_tier_survives_memory_eviction(tmp_path):
+    inner = CountingEmbeddings()
+    cache = get_embedding_cache(str(tmp_path / "second"), max_size=1)
+    embeddings = CachedEmbeddings(inner, cache, namespace="test:model")
+
+    embeddings.embed_documents(["alpha", "beta"])
+    cache.memory.clear()
+
+    assert embeddings.embed_documents(["alpha", "beta"]) == [[5.0, 1.0], [4.0, 1.0]]
+    assert inner.embedded == ["alpha", "beta"]
+
+
+@pytest.mark.asyncio
+async def test_queries_are_cached_separately_from_documents(tmp_path):
+    inner = CountingEmbeddings()
+    embeddings = CachedEmbeddings(inner, get_embedding_cache(str(tmp_path / "third")), namespace="test:model")
+
+    assert await embeddings.aembed_query("alpha") == [5.0, 0.0]
+    assert await embeddings.aembed_query("alpha") == [5.0, 0.0]
+    assert await embeddings.aembed_documents(["alpha"]) == [[5.0, 1.0]]
+    assert inner.embedded == ["alpha", "alpha"]
+
+
+def test_namespace_depends_on_the_embedding_kwargs():
+    from gpt_researcher.memory.embeddings import cache_namespace
+
+    assert cache_namespace("openai", "text-embedding-3-small", {}) == "openai:text-embedding-3-small"
+    assert cache_namespace("openai", "text-embedding-3-small", {"dimensions": 256}) != cache_namespace(
+        "openai", "text-embedding-3-small", {"dimensions": 512}
+    )
+
+
+def test_shared_caches_keep_their_own_settings(tmp_path):
+    from gpt_researcher.utils.cache import get_shared_cache
+
+    path = str(tmp_path / "shared.sqlite")
+    short = get_shared_cache(path, table="search", max_size=10, ttl=1)
+    long = get_shared_cache(path, table="search", max_size=10, ttl=3600)
+
+    assert short is not long
+    assert (short.ttl, long.ttl) == (1, 3600)
+    assert get_shared_cache(path, table="search", max_size=10, ttl=1) is short
+    short.set("key", "value")
+    assert long.get("key") == "value"
+
+
+@pytest.mark.parametrize("value", ["None", "none", ""])
+def test_cache_dir_can_be_disabled_from_the_environment(monkeypatch, value):
+    from gpt_researcher.config import Config
+
+    monkeypatch.setenv("CACHE_DIR", value)
+
+    assert Config().cache_dir is None
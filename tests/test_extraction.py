@@ -0,0 +1,71 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from gpt_researcher.scraper import extraction
+from gpt_researcher.scraper.extraction import ExtractionBatcher
+from gpt_researcher.utils.workers import get_process_executor
+
+PAGE = b"<html><head><title>Page %d</title></head><body><nav>menu</nav><p>body %d</p></body></html>"
+
+
+@pytest.mark.asyncio
+async def test_pages_are_extracted_in_batches(monkeypatch):
+    batches = []
+    extract_batch = extraction.extract_batch
+
+    def recording_extract_batch(pages):
+        batches.append(len(pages))
+        return extract_batch(pages)
+
+    monkeypatch.setattr(extraction, "extract_batch", recording_extract_batch)
+    batcher = ExtractionBatcher(ThreadPoolExecutor(2), max_batch_size=2, wait=0.01)
+
+    results = await asyncio.gather(*[
+        batcher.extract(PAGE % (i, i), "utf-8", f"https://example.com/{i}") for i in range(3)
+    ])
+
+    assert [title for _, _, title in results] == ["Page 0", "Page 1", "Page 2"]
+    assert results[0][0] == "Page 0\nbody 0"
+    assert batches == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_process_pool_extraction_isolates_failures():
+    batcher = ExtractionBatcher(get_process_executor(1))
+
+    good, bad = await asyncio.gather(
+        batcher.extract(PAGE % (1, 1), "utf-8", "https://example.com/1", {"parser": "html.parser", "clean": False}),
+        batcher.extract(b"<p>x</p>", "utf-8", "https://example.com/2", {"parser": "no-such-parser"}),
+        return_exceptions=True,
+    )
+
+    assert good == ("Page 1menubody 1", [], "Page 1")
+    assert isinstance(bad, Exception)
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_before_the_window_closes():
+    batcher = ExtractionBatcher(ThreadPoolExecutor(1), max_batch_size=2, wait=10)
+
+    results = await asyncio.wait_for(asyncio.gather(*[
+        batcher.extract(PAGE % (i, i), "utf-8", f"https://example.com/{i}") for i in range(2)
+    ]), timeout=1)
+
+    assert [title for _, _, title in results] == ["Page 0", "Page 1"]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_caller_does_not_fail_the_batch():
+    batcher = ExtractionBatcher(ThreadPoolExecutor(1), wait=0.01)
+    first = asyncio.create_task(batcher.extract(PAGE % (0, 0), "utf-8", "https://example.com/0"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(batcher.extract(PAGE % (1, 1), "utf-8", "https://example.com/1"))
+    await asyncio.sleep(0)
+
+    first.cancel()
+
+    assert (await second)[2] == "Page 1"
+    with pytest.raises(asyncio.CancelledError):
+        await first
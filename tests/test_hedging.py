@@ -0,0 +1,140 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.actions import query_processing
+from gpt_researcher.utils import hedging, llm
+from gpt_researcher.utils.hedging import LatencyTracker, hedged
+
+
+class Request:
+    def __init__(self, delay, result=None, error=None):
+        self.delay = delay
+        self.result = result
+        self.error = error
+        self.started = False
+        self.cancelled = False
+
+    async def __call__(self):
+        self.started = True
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return self.result
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    primary, secondary = Request(0.01, "primary"), Request(0.01, "secondary")
+
+    assert await hedged(primary, secondary, delay=0.2) == "primary"
+    assert not secondary.started
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled():
+    primary, secondary = Request(1, "primary"), Request(0.01, "secondary")
+
+    assert await hedged(primary, secondary, delay=0.05) == "secondary"
+    assert primary.cancelled
+
+
+@pytest.mark.asyncio
+async def test_failed_primary_cascades_immediately():
+    primary, secondary = Request(0, error=ValueError("invalid")), Request(0.01, "secondary")
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    assert await hedged(primary, secondary, delay=5) == "secondary"
+    assert loop.time() - start < 1
+
+
+@pytest.mark.asyncio
+async def test_error_is_raised_when_both_requests_fail():
+    primary, secondary = Request(0, error=ValueError("primary")), Request(0, error=ValueError("secondary"))
+
+    with pytest.raises(ValueError, match="secondary"):
+        await hedged(primary, secondary, delay=0.05)
+
+
+def test_hedge_delay_follows_the_latency_percentile():
+    tracker = LatencyTracker(min_samples=3)
+
+    assert tracker.percentile("model", 90, default=15) == 15
+    for seconds in [1, 2, 3, 4, 10]:
+        tracker.record("model", seconds)
+    assert 4 < tracker.percentile("model", 90, default=15) < 10
+
+
+def hedging_config():
+    return SimpleNamespace(
+        llm_kwargs={}, strategic_llm_model="strategic", strategic_llm_provider="openai", strategic_token_limit=4000,
+        smart_llm_model="smart", smart_llm_provider="openai", smart_token_limit=4000, temperature=0.4,
+        llm_hedge_percentile=90, llm_hedge_delay=5,
+    )
+
+
+@pytest.mark.asyncio
+async def test_unparsable_strategic_answer_is_retried_with_temperature_one(monkeypatch):
+    calls = []
+
+    async def create_chat_completion(model, temperature, **kwargs):
+        calls.append((model, temperature))
+        return "not a list" if len(calls) == 1 else '["solar", "wind"]'
+
+    monkeypatch.setattr(query_processing, "create_chat_completion", create_chat_completion)
+
+    sub_queries = await query_processing._generate_sub_queries_hedged("prompt", hedging_config())
+
+    assert sub_queries == ["solar", "wind"]
+    assert calls == [("strategic", 0.6), ("strategic", 1)]
+
+
+@pytest.mark.asyncio
+async def test_cached_strategic_answers_are_not_recorded_as_latency(monkeypatch):
+    tracker = LatencyTracker(min_samples=1)
+    monkeypatch.setattr(hedging, "latency_tracker", tracker)
+
+    async def create_chat_completion(cache_hit_callback=None, **kwargs):
+        if cache_hit_callback:
+            cache_hit_callback()
+        return '["solar", "wind"]'
+
+    monkeypatch.setattr(query_processing, "create_chat_completion", create_chat_completion)
+    await query_processing._generate_sub_queries_hedged("prompt", hedging_config())
+    assert tracker.percentile(("openai", "strategic"), 90, default=-1) == -1
+
+    async def provider_completion(cache_hit_callback=None, **kwargs):
+        return '["solar", "wind"]'
+
+    monkeypatch.setattr(query_processing, "create_chat_completion", provider_completion)
+    await query_processing._generate_sub_queries_hedged("prompt", hedging_config())
+    assert tracker.percentile(("openai", "strategic"), 90, default=-1) >= 0
+
+
+class SlowProvider:
+    async def get_chat_response_with_usage(self, messages, stream, websocket=None):
+        await asyncio.sleep(1)
+        return "late", None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_records_its_prompt_cost(monkeypatch):
+    monkeypatch.setattr(llm, "get_llm", lambda llm_provider, **kwargs: SlowProvider())
+    costs = []
+
+    async def fast():
+        return "fast"
+
+    async def slow():
+        return await llm.create_chat_completion(
+            [{"role": "user", "content": "a long prompt"}], model="gpt-4o", llm_provider="openai", cost_callback=costs.append
+        )
+
+    assert await hedged(slow, fast, delay=0.05) == "fast"
+    assert len(costs) == 1 and costs[0] > 0
@@ -0,0 +1,92 @@
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from gpt_researcher.utils import llm
+from gpt_researcher.utils.llm_cache import LLMResponseCache
+
+VOCABULARY = ["solar", "wind", "coal", "battery"]
+
+
+class KeywordEmbeddings(Embeddings):
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text):
+        return [float(text.lower().count(word)) for word in VOCABULARY]
+
+
+class CountingProvider:
+    calls = 0
+
+    async def get_chat_response_with_usage(self, messages, stream, websocket=None):
+        CountingProvider.calls += 1
+        return f"response {CountingProvider.calls}", None
+
+    async def _send_output(self, content, websocket=None):
+        await websocket.send_json({"type": "report", "output": content})
+
+
+class RecordingWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    CountingProvider.calls = 0
+    monkeypatch.setattr(llm, "get_llm", lambda llm_provider, **kwargs: CountingProvider())
+
+
+def messages(content):
+    return [{"role": "user", "content": content}]
+
+
+@pytest.mark.asyncio
+async def test_responses_are_cached_by_normalised_messages_and_settings(tmp_path, provider):
+    cache = LLMResponseCache(str(tmp_path))
+    hits = []
+
+    first = await llm.create_chat_completion(
+        messages("solar  power\n"), model="gpt-4o", llm_provider="openai", cache=cache, cache_hit_callback=lambda: hits.append(1)
+    )
+    second = await llm.create_chat_completion(
+        messages("solar power"), model="gpt-4o", llm_provider="openai", cache=cache, cache_hit_callback=lambda: hits.append(2)
+    )
+    other = await llm.create_chat_completion(
+        messages("solar power"), model="gpt-4o", llm_provider="openai", temperature=0.9, cache=cache
+    )
+
+    assert first == second == "response 1"
+    assert other == "response 2"
+    assert CountingProvider.calls == 2
+    assert hits == [2]
+
+
+@pytest.mark.asyncio
+async def test_cached_response_is_replayed_to_streaming_clients(tmp_path, provider):
+    cache = LLMResponseCache(str(tmp_path))
+    websocket = RecordingWebSocket()
+
+    await llm.create_chat_completion(messages("wind"), model="gpt-4o", llm_provider="openai", cache=cache)
+    response = await llm.create_chat_completion(
+        messages("wind"), model="gpt-4o", llm_provider="openai", stream=True, websocket=websocket, cache=cache
+    )
+
+    assert response == "response 1"
+    assert websocket.sent == [{"type": "report", "output": "response 1"}]
+    assert CountingProvider.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_similar_prompts_reuse_a_response(tmp_path):
+    cache = LLMResponseCache(str(tmp_path), embeddings=KeywordEmbeddings(), similarity_threshold=0.95)
+    scope = cache.scope("openai", "gpt-4o", temperature=0.4)
+
+    await cache.set(scope, messages("report on solar and battery storage"), "solar report")
+
+    assert await cache.get(scope, messages("write a report on solar and battery storage")) == "solar report"
+    assert await cache.get(scope, messages("report on wind")) is None
+    assert await cache.get(cache.scope("openai", "gpt-4o-mini", temperature=0.4), messages("solar and battery")) is None
@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+from gpt_researcher.llm_provider.generic import base
+from gpt_researcher.utils.llm import get_llm
+
+
+def test_providers_with_the_same_settings_are_reused():
+    first = get_llm("openai", model="gpt-4o-mini", temperature=0.4, api_key="test")
+    second = get_llm("openai", temperature=0.4, model="gpt-4o-mini", api_key="test")
+    other = get_llm("openai", model="gpt-4o-mini", temperature=0.9, api_key="test")
+
+    assert first is second
+    assert first is not other
+
+
+def test_event_loops_get_their_own_providers():
+    async def provider():
+        return get_llm("openai", model="gpt-4o-mini", api_key="test")
+
+    assert asyncio.run(provider()) is not asyncio.run(provider())
+
+
+@pytest.mark.asyncio
+async def test_providers_are_reused_within_an_event_loop():
+    assert get_llm("openai", model="gpt-4o-mini", api_key="test") is get_llm("openai", model="gpt-4o-mini", api_key="test")
+
+
+def test_packages_are_only_checked_once(monkeypatch):
+    checked = []
+    monkeypatch.setattr(base.importlib.util, "find_spec", lambda pkg: checked.append(pkg) or True)
+    base._check_pkg.cache_clear()
+
+    base._check_pkg("langchain_openai")
+    base._check_pkg("langchain_openai")
+
+    assert checked == ["langchain_openai"]
@@ -0,0 +1,49 @@
+import asyncio
+import time
+
+import pytest
+from langchain_core.embeddings import FakeEmbeddings
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from gpt_researcher.utils.loop_monitor import LoopLagMonitor
+from gpt_researcher.vector_store import VectorStoreWrapper
+
+
+def blocking_parse():
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_stalls_are_reported_with_the_blocking_code():
+    stalls = []
+    async with LoopLagMonitor(threshold=0.1, on_stall=stalls.append) as monitor:
+        await asyncio.sleep(0.1)
+        blocking_parse()
+        await asyncio.sleep(0.1)
+
+    assert len(stalls) == 1
+    assert stalls[0]["lag"] >= 0.2
+    assert "blocking_parse" in stalls[0]["stack"]
+    assert monitor.max_lag >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_non_blocking_work_is_not_reported():
+    stalls = []
+    async with LoopLagMonitor(threshold=0.1, on_stall=stalls.append):
+        await asyncio.to_thread(blocking_parse)
+
+    assert stalls == []
+
+
+@pytest.mark.asyncio
+async def test_documents_are_loaded_into_the_vector_store_asynchronously():
+    vector_store = VectorStoreWrapper(InMemoryVectorStore(FakeEmbeddings(size=8)))
+
+    await vector_store.aload([
+        {"raw_content": "Solar capacity doubled last year.", "url": "https://a.example"},
+        {"raw_content": "Offshore wind keeps growing.", "url": "https://b.example"},
+    ])
+
+    results = await vector_store.asimilarity_search("solar", k=2, filter=None)
+    assert {doc.metadata["source"] for doc in results} == {"https://a.example", "https://b.example"}
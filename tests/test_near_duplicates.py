@@ -0,0 +1,78 @@
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from gpt_researcher.context.chunk_store import ChunkStore
+from gpt_researcher.context.dedup import MinHasher, NearDuplicateFilter, NearDuplicateIndex
+
+ARTICLE = (
+    "Solar capacity in Europe doubled last year as falling panel prices and new subsidy schemes "
+    "drove record installations on rooftops and in utility scale parks across Spain Germany and Poland "
+    "while grid operators warned that storage and transmission investment must keep pace with the growth"
+)
+SYNDICATED = ARTICLE + " reporting by the newswire desk"
+UNRELATED = (
+    "Offshore wind auctions in the North Sea attracted fewer bids than expected because rising interest "
+    "rates and turbine costs squeezed developer margins prompting governments to revisit price caps"
+)
+
+
+def jaccard(first, second):
+    hasher = MinHasher()
+    a, b = hasher.shingles(first), hasher.shingles(second)
+    return len(a & b) / len(a | b)
+
+
+def test_signatures_estimate_jaccard_similarity():
+    hasher = MinHasher(num_perm=256)
+    estimate = (hasher.signature(ARTICLE) == hasher.signature(SYNDICATED)).mean()
+
+    assert estimate == pytest.approx(jaccard(ARTICLE, SYNDICATED), abs=0.1)
+    assert (hasher.signature(ARTICLE) == hasher.signature(UNRELATED)).mean() < 0.1
+    assert hasher.signature("") is None
+
+
+def test_index_drops_near_duplicates_above_the_threshold():
+    index = NearDuplicateIndex(threshold=0.8)
+
+    assert index.add("original", ARTICLE) is None
+    assert index.add("syndicated", SYNDICATED) == "original"
+    assert index.add("unrelated", UNRELATED) is None
+    assert index.add("empty", "") is None
+    assert len(index) == 2 and index.dropped == 1
+
+
+def test_filter_keeps_the_first_copy():
+    documents = [Document(page_content=text) for text in (ARTICLE, UNRELATED, SYNDICATED)]
+
+    assert NearDuplicateFilter(0.8).transform_documents(documents) == documents[:2]
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self):
+        self.documents_embedded = 0
+
+    def embed_documents(self, texts):
+        self.documents_embedded += len(texts)
+        return [[float("solar" in text.lower()), 1.0] for text in texts]
+
+    def embed_query(self, text):
+        return [1.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_chunks_are_not_embedded_but_stay_findable():
+    embeddings = CountingEmbeddings()
+    store = ChunkStore(embeddings, near_duplicate_threshold=0.8)
+
+    await store.add_pages([
+        {"url": "https://news.example/solar", "title": "Solar", "raw_content": ARTICLE},
+        {"url": "https://mirror.example/solar", "title": "Solar", "raw_content": SYNDICATED},
+        {"url": "https://news.example/wind", "title": "Wind", "raw_content": UNRELATED},
+    ])
+
+    assert embeddings.documents_embedded == 2
+    assert store.dropped_chunks == 1
+    # A query restricted to the mirror still finds the content it shares with the original
+    results = await store.similarity_search_many(["solar"], sources=[{"https://mirror.example/solar"}])
+    assert [doc.metadata["source"] for doc, _ in results[0]] == ["https://news.example/solar"]
@@ -0,0 +1,107 @@
+import asyncio
+import json
+
+import pytest
+
+from gpt_researcher.utils.output_channel import OutputChannel
+
+
+class SlowWebSocket:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.frames = []
+
+    async def send_text(self, text):
+        await asyncio.sleep(self.delay)
+        self.frames.append(json.loads(text))
+
+
+@pytest.mark.asyncio
+async def test_report_chunks_are_coalesced_into_one_frame():
+    websocket = SlowWebSocket()
+    channel = OutputChannel(websocket, flush_interval=0.01)
+
+    await channel.send_json({"type": "logs", "content": "writing", "output": "Writing report"})
+    for word in ["The ", "sun ", "is ", "bright.\n"]:
+        await channel.send_json({"type": "report", "output": word})
+    await channel.close()
+
+    assert websocket.frames == [
+        {"type": "logs", "content": "writing", "output": "Writing report"},
+        {"type": "report", "output": "The sun is bright.\n"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_slow_clients_do_not_block_and_only_lose_log_messages():
+    websocket = SlowWebSocket(delay=0.05)
+    channel = OutputChannel(websocket, max_pending=5, flush_interval=0)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for i in range(20):
+        await channel.send_json({"type": "logs", "content": "step", "output": f"log {i}"})
+        await channel.send_json({"type": "report", "output": f"{i} "})
+    assert loop.time() - start < 0.05
+
+    await channel.close()
+    report = "".join(frame["output"] for frame in websocket.frames if frame["type"] == "report")
+    assert report == "".join(f"{i} " for i in range(20))
+    assert channel.dropped > 0
+    assert len(websocket.frames) < 40
+
+
+@pytest.mark.asyncio
+async def test_attributes_are_forwarded_to_the_websocket():
+    websocket = SlowWebSocket()
+    websocket.log_file = "outputs/task.json"
+
+    assert OutputChannel(websocket).log_file == "outputs/task.json"
+
+
+@pytest.mark.asyncio
+async def test_buffer_of_undroppable_messages_is_bounded():
+    websocket = SlowWebSocket(delay=0.01)
+    channel = OutputChannel(websocket, max_pending=3, flush_interval=0)
+
+    for i in range(10):
+        await channel.send_json({"type": "path", "output": f"path {i}"})
+        assert len(channel._pending) <= 3
+
+    await channel.close()
+    assert [frame["output"] for frame in websocket.frames] == [f"path {i}" for i in range(10)]
+
+
+class DisconnectedWebSocket:
+    async def send_text(self, text):
+        raise ConnectionError("client disconnected")
+
+
+@pytest.mark.asyncio
+async def test_send_error_is_raised_to_the_research():
+    channel = OutputChannel(DisconnectedWebSocket(), flush_interval=0)
+
+    await channel.send_json({"type": "logs", "output": "starting"})
+    await asyncio.sleep(0)
+
+    with pytest.raises(ConnectionError):
+        await channel.send_json({"type": "report", "output": "The sun"})
+    # Already raised to the research, so closing doesn't replace the exception it stopped with
+    await channel.close()
+
+
+@pytest.mark.asyncio
+async def test_send_error_is_raised_on_close():
+    channel = OutputChannel(DisconnectedWebSocket(), flush_interval=0)
+
+    await channel.send_json({"type": "report", "output": "The end"})
+
+    with pytest.raises(ConnectionError):
+        await channel.close()
+
+
+def test_missing_websocket_raises_attribute_error():
+    channel = OutputChannel.__new__(OutputChannel)
+
+    with pytest.raises(AttributeError):
+        channel.log_file
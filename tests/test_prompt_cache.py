@@ -0,0 +1,103 @@
+import pytest
+
+from gpt_researcher.prompts import CacheFriendlyPromptFamily, PromptFamily, get_prompt_by_report_type
+from gpt_researcher.utils import llm
+from gpt_researcher.utils.enum import ReportSource, Tone
+from gpt_researcher.utils.prompt_cache import (
+    CACHE_BREAKPOINT,
+    PromptCacheStats,
+    apply_cache_breakpoints,
+    prompt_cache_stats,
+)
+
+
+def subtopic_prompt(subtopic, context, existing_headers):
+    generate = get_prompt_by_report_type("subtopic_report", CacheFriendlyPromptFamily)
+    return generate(subtopic, existing_headers, [], "Energy", context, tone=Tone.Objective)
+
+
+def test_subtopic_prompts_share_their_instructions_as_a_prefix():
+    first = subtopic_prompt("Solar", "Solar context", [])
+    second = subtopic_prompt("Wind", "Wind context", ["## Solar"])
+
+    instructions = first.split(CACHE_BREAKPOINT)[0]
+    assert second.startswith(instructions)
+    assert "Solar" not in instructions
+    assert first.count(CACHE_BREAKPOINT) == 2
+
+
+def test_report_prompt_puts_context_before_the_query():
+    prompt = CacheFriendlyPromptFamily.generate_report_prompt(
+        "What is the outlook for solar?", "Solar context", ReportSource.Web.value
+    )
+
+    static, context, dynamic = prompt.split(CACHE_BREAKPOINT)
+    assert "What is the outlook" not in static + context
+    assert "Solar context" in context
+    assert "What is the outlook" in dynamic
+    assert CACHE_BREAKPOINT not in PromptFamily.generate_report_prompt("q", "c", ReportSource.Web.value)
+
+
+def test_breakpoints_become_cache_control_blocks_for_anthropic():
+    messages = [
+        {"role": "system", "content": "You are a researcher."},
+        {"role": "user", "content": f"instructions{CACHE_BREAKPOINT}context{CACHE_BREAKPOINT}query"},
+    ]
+
+    converted = apply_cache_breakpoints(messages, "anthropic")
+
+    assert converted[0] == messages[0]
+    assert converted[1]["content"] == [
+        {"type": "text", "text": "instructions", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "context", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "query"},
+    ]
+
+
+def test_breakpoints_are_removed_for_other_providers():
+    messages = [{"role": "user", "content": f"instructions{CACHE_BREAKPOINT}query"}]
+
+    assert apply_cache_breakpoints(messages, "openai") == [{"role": "user", "content": "instructions\nquery"}]
+
+
+def test_cached_tokens_are_counted_per_model():
+    stats = PromptCacheStats()
+    stats.record("openai", "gpt-4o", {"input_tokens": 1000, "output_tokens": 10, "input_token_details": {"cache_read": 750}})
+    stats.record("openai", "gpt-4o", {"input_tokens": 1000, "output_tokens": 10})
+    stats.record("openai", "gpt-4o", None)
+
+    assert stats.get()["openai:gpt-4o"] == {
+        "calls": 2,
+        "input_tokens": 2000,
+        "cache_read_tokens": 750,
+        "cache_creation_tokens": 0,
+        "hit_rate": 0.375,
+    }
+
+
+class FakeProvider:
+    def __init__(self):
+        self.messages = None
+
+    async def get_chat_response_with_usage(self, messages, stream, websocket=None):
+        self.messages = messages
+        usage = {"input_tokens": 400, "output_tokens": 5, "total_tokens": 405,
+                 "input_token_details": {"cache_read": 300, "cache_creation": 0}}
+        return "report", usage
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_sends_breakpoints_and_records_cache_hits(monkeypatch):
+    provider = FakeProvider()
+    monkeypatch.setattr(llm, "get_llm", lambda llm_provider, **kwargs: provider)
+    prompt_cache_stats.reset()
+
+    await llm.create_chat_completion(
+        messages=[{"role": "user", "content": f"instructions{CACHE_BREAKPOINT}query"}],
+        model="claude-test",
+        llm_provider="anthropic",
+    )
+
+    assert provider.messages[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert prompt_cache_stats.get()["anthropic:claude-test"]["cache_read_tokens"] == 300
+    prompt_cache_stats.reset()
@@ -0,0 +1,146 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.utils import llm, rate_limiter
+from gpt_researcher.utils.rate_limiter import RateLimiter, is_retryable, retry_delay
+
+
+class RateLimitError(Exception):
+    def __init__(self, retry_after=None):
+        super().__init__("rate limited")
+        self.status_code = 429
+        self.response = SimpleNamespace(headers={"retry-after": retry_after} if retry_after else {})
+
+
+class FlakyProvider:
+    def __init__(self, failures, error):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    async def get_chat_response_with_usage(self, messages, stream, websocket=None):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return "done", None
+
+
+@pytest.mark.asyncio
+async def test_requests_per_minute_are_enforced():
+    limiter = RateLimiter(requests_per_minute=600)
+    limiter.requests.level = 1
+
+    start = time.monotonic()
+    await asyncio.gather(*[limiter.acquire() for _ in range(3)])
+
+    # One request was available, the other two refill at 10 per second
+    assert 0.15 < time.monotonic() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_tokens_per_minute_are_corrected_with_the_actual_usage():
+    limiter = RateLimiter(tokens_per_minute=6000)
+
+    await limiter.acquire(1000)
+    limiter.record(estimated_tokens=1000, actual_tokens=5900)
+
+    assert limiter.tokens.level == pytest.approx(100, abs=1)
+
+
+def test_retry_after_is_honoured():
+    assert 2 <= retry_delay(RateLimitError(retry_after="2"), attempt=0) <= 3
+    assert 0 <= retry_delay(RateLimitError(), attempt=3) <= 8
+    assert is_retryable(RateLimitError())
+    assert not is_retryable(ValueError("bad request"))
+
+
+def test_connection_errors_are_retried():
+    class APIConnectionError(Exception):
+        pass
+
+    class ConnectError(Exception):
+        pass
+
+    assert is_retryable(APIConnectionError("Connection error."))
+    assert is_retryable(ConnectError("[Errno -2] Name or service not known"))
+    assert is_retryable(ConnectionResetError())
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_calls_are_retried(monkeypatch):
+    provider = FlakyProvider(failures=2, error=RateLimitError())
+    monkeypatch.setattr(llm, "get_llm", lambda llm_provider, **kwargs: provider)
+    monkeypatch.setattr(llm, "retry_delay", lambda error, attempt: 0.01)
+    monkeypatch.setattr(rate_limiter, "_limiters", {})
+
+    response = await llm.create_chat_completion([{"role": "user", "content": "hi"}], model="gpt-4o", llm_provider="openai")
+
+    assert response == "done"
+    assert provider.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_other_errors_are_not_retried(monkeypatch):
+    provider = FlakyProvider(failures=1, error=ValueError("bad request"))
+    monkeypatch.setattr(llm, "get_llm", lambda llm_provider, **kwargs: provider)
+
+    with pytest.raises(ValueError):
+        await llm.create_chat_completion([{"role": "user", "content": "hi"}], model="gpt-4o", llm_provider="openai")
+    assert provider.calls == 1
+
+
+class PartlyStreamedProvider(FlakyProvider):
+    async def get_chat_response_with_usage(self, messages, stream, websocket=None):
+        await websocket.send_json({"type": "report", "output": "The first paragraph\n"})
+        return await super().get_chat_response_with_usage(messages, stream, websocket)
+
+    async def _send_output(self, content, websocket=None):
+        await websocket.send_json({"type": "report", "output": content})
+
+
+class RecordingWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+
+@pytest.mark.asyncio
+async def test_streamed_calls_are_not_retried_once_output_was_sent(monkeypatch):
+    provider = PartlyStreamedProvider(failures=1, error=RateLimitError())
+    monkeypatch.setattr(llm, "get_llm", lambda llm_provider, **kwargs: provider)
+    websocket = RecordingWebSocket()
+
+    with pytest.raises(RateLimitError):
+        await llm.create_chat_completion(
+            [{"role": "user", "content": "hi"}], model="gpt-4o", llm_provider="openai", stream=True, websocket=websocket
+        )
+    assert provider.calls == 1
+    assert len(websocket.sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_limits_come_from_the_config_and_client_retries_are_off(monkeypatch):
+    provider = FlakyProvider(failures=5, error=RateLimitError())
+    client_kwargs = {}
+
+    def get_llm(llm_provider, **kwargs):
+        client_kwargs.update(kwargs)
+        return provider
+
+    monkeypatch.setattr(llm, "get_llm", get_llm)
+    monkeypatch.setattr(llm, "retry_delay", lambda error, attempt: 0.01)
+    cfg = SimpleNamespace(llm_max_requests_per_minute=600, llm_max_tokens_per_minute=0, llm_max_retries=1)
+    limits = rate_limiter.get_rate_limits(cfg)
+
+    with pytest.raises(RateLimitError):
+        await llm.create_chat_completion(
+            [{"role": "user", "content": "hi"}], model="gpt-4o", llm_provider="openai", rate_limits=limits
+        )
+    assert provider.calls == 2
+    assert client_kwargs["max_retries"] == 0
+    assert rate_limiter.get_rate_limiter("openai", "gpt-4o", limits).requests.capacity == 600
@@ -0,0 +1,121 @@
+from langchain_core.documents import Document
+
+from gpt_researcher import GPTResearcher
+from gpt_researcher.context import ChunkRecord, ResearchContext
+from gpt_researcher.context.packer import pack_context
+from gpt_researcher.prompts import Granite3PromptFamily, PromptFamily
+
+
+def record(content, source="https://example.com/a", **kwargs):
+    return ChunkRecord(content, source=source, title="A", **kwargs)
+
+
+def test_chunks_are_kept_once_and_shared():
+    solar = record("Solar capacity doubled.", chunk_id=0)
+    first = ResearchContext([solar, record("Wind stalled.", chunk_id=1)])
+    second = ResearchContext([record("Solar capacity doubled.", chunk_id=0)])
+
+    assert second.extend(first) == 1
+    assert len(second) == 2
+    assert first.records[0] is solar
+    # Chunks are identified by source and content
+    assert not first.add(record("Wind stalled.", chunk_id=1))
+    assert first.add(record("Wind stalled.", source="https://example.com/b"))
+
+
+def test_contexts_of_different_researchers_merge_by_content():
+    # Every researcher's chunk store numbers its chunks from 0
+    main = ResearchContext([record("Solar capacity doubled.", source="https://a.example", chunk_id=0)])
+    subtopic = ResearchContext([
+        record("Wind auctions stalled.", source="https://b.example", chunk_id=0),
+        record("Solar capacity doubled.", source="https://a.example", chunk_id=3),
+    ])
+
+    assert main.extend(subtopic) == 1
+    assert main.sources == ["https://a.example", "https://b.example"]
+
+
+def test_records_come_from_documents():
+    document = Document(
+        page_content="Solar capacity doubled.",
+        metadata={"source": "https://example.com/a", "title": "A", "chunk_id": 3, "start_index": 120},
+    )
+
+    chunk = ChunkRecord.from_document(document, score=0.8)
+
+    assert (chunk.source, chunk.chunk_id, chunk.start, chunk.score) == ("https://example.com/a", 3, 120, 0.8)
+
+
+def test_context_renders_with_the_prompt_family():
+    context = ResearchContext([record("Solar capacity doubled."), "Notes from a vector store"])
+
+    assert str(context) == (
+        PromptFamily.pretty_print_docs([Document(page_content="Solar capacity doubled.", metadata={"source": "https://example.com/a", "title": "A"})])
+        + "\nNotes from a vector store"
+    )
+
+
+def test_local_and_web_chunks_are_joined_by_the_prompt_family():
+    local = record("Internal memo.", source="./my-docs/memo.pdf", origin="local")
+    context = ResearchContext([local, record("Solar capacity doubled.")])
+
+    rendered = context.render(PromptFamily)
+
+    assert rendered.startswith("Context from local documents: Source: ./my-docs/memo.pdf")
+    assert "Context from web sources: Source: https://example.com/a" in rendered
+
+
+def test_strings_are_kept_whole():
+    context = ResearchContext.of("Source: https://example.com/a\nTitle: A\nContent: Solar capacity doubled.\n")
+
+    assert len(context) == 1
+    assert ResearchContext.of(context) is context
+    assert len(ResearchContext.of(["first", "second", "first"])) == 2
+
+
+def test_structured_context_is_packed_without_parsing():
+    context = ResearchContext([
+        record("Solar capacity doubled last year."),
+        record("Solar capacity doubled last year.", source="https://example.com/mirror"),
+        record("Wind auctions stalled."),
+    ])
+
+    packed = pack_context(context, "solar capacity", token_budget=1000)
+
+    assert packed.count("Solar capacity doubled") == 1
+    assert "Wind auctions stalled." in packed
+
+
+def test_packed_hybrid_context_keeps_local_documents_apart():
+    context = ResearchContext([
+        record("Internal memo on solar capacity.", source="./my-docs/memo.pdf", origin="local"),
+        record("Solar capacity doubled."),
+    ])
+
+    packed = pack_context(context, "solar capacity", token_budget=1000, prompt_family=PromptFamily)
+
+    assert packed.startswith("Context from local documents: Source: ./my-docs/memo.pdf")
+    assert "Context from web sources: Source: https://example.com/a" in packed
+
+
+def test_packed_chunks_are_rendered_with_the_prompt_family():
+    context = ResearchContext([
+        record("Internal memo on solar capacity.", source="./my-docs/memo.pdf", origin="local"),
+        record("Solar capacity doubled."),
+    ])
+
+    packed = pack_context(context, "solar capacity", token_budget=1000, prompt_family=Granite3PromptFamily)
+
+    assert packed == context.render(Granite3PromptFamily)
+    assert packed.startswith("<|start_of_role|>documents<|end_of_role|>\nDocument ./my-docs/memo.pdf")
+    assert "Document https://example.com/a\nTitle: A\nSolar capacity doubled." in packed
+    assert "Source:" not in packed
+
+
+def test_researcher_returns_the_rendered_context_and_its_records(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    researcher = GPTResearcher(query="Energy transition")
+    researcher.context = ResearchContext([record("Solar capacity doubled.")])
+
+    assert researcher.get_research_context() == str(researcher.context)
+    assert [chunk.content for chunk in researcher.get_research_records()] == ["Solar capacity doubled."]
@@ -0,0 +1,105 @@
+import pytest
+
+from gpt_researcher import GPTResearcher, ResearchRuntime
+
+
+@pytest.fixture(autouse=True)
+def openai_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+
+
+def test_spawned_researchers_share_the_runtime():
+    parent = GPTResearcher(query="Energy transition")
+    child = GPTResearcher(query="Solar power", report_type="subtopic_report", runtime=parent.runtime)
+
+    assert child.memory is parent.memory
+    assert child.scraper_manager.worker_pool is parent.scraper_manager.worker_pool
+    assert child.retrievers is parent.retrievers
+    # Each researcher gets its own copy of the configuration
+    assert child.cfg is not parent.cfg
+    assert child.cfg.smart_llm_model == parent.cfg.smart_llm_model
+
+
+def test_researchers_without_a_runtime_get_their_own():
+    first = GPTResearcher(query="Energy transition")
+    second = GPTResearcher(query="Energy transition")
+
+    assert first.runtime is not second.runtime
+    assert first.scraper_manager.worker_pool is not second.scraper_manager.worker_pool
+
+
+def test_retrievers_are_resolved_per_headers():
+    runtime = ResearchRuntime()
+
+    assert runtime.get_retrievers({}) is runtime.get_retrievers({})
+    assert runtime.get_retrievers({"retrievers": "duckduckgo"}) is not runtime.get_retrievers({})
+
+
+def test_closing_the_runtime_shuts_down_the_worker_pool():
+    runtime = ResearchRuntime()
+    executor = runtime.worker_pool.executor
+
+    runtime.close()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+@pytest.mark.asyncio
+async def test_researcher_closes_only_the_runtime_it_created():
+    async with GPTResearcher(query="Energy transition") as parent:
+        executor = parent.scraper_manager.worker_pool.executor
+        async with GPTResearcher(query="Solar power", runtime=parent.runtime) as child:
+            pass
+        # The child left the parent's pool running
+        executor.submit(print).result()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+    # A closed runtime starts a new pool if it scrapes again
+    assert parent.scraper_manager.worker_pool.executor is not executor
+
+
+@pytest.mark.asyncio
+async def test_pages_scraped_by_another_researcher_are_reused(monkeypatch):
+    from gpt_researcher.skills import browser
+
+    fetched = []
+
+    async def scrape_urls(urls, cfg, worker_pool):
+        fetched.extend(urls)
+        return [{"url": url, "raw_content": f"Solar panels at {url}. " * 20, "image_urls": []} for url in urls], []
+
+    monkeypatch.setattr(browser, "scrape_urls", scrape_urls)
+    parent = GPTResearcher(query="Energy transition", verbose=False)
+    child = GPTResearcher(query="Solar power", runtime=parent.runtime, verbose=False)
+
+    await parent.scraper_manager.browse_urls(["https://example.com/a"])
+    pages = await child.scraper_manager.browse_urls(["https://www.example.com/a/", "https://example.com/b"])
+
+    # The child gets both pages, but only fetches the one the parent didn't
+    assert [page["url"] for page in pages] == ["https://example.com/a", "https://example.com/b"]
+    assert fetched == ["https://example.com/a", "https://example.com/b"]
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_pages_are_only_dropped_within_a_research(monkeypatch):
+    from gpt_researcher.skills import browser
+
+    article = " ".join(f"Solar report paragraph {i} on capacity and prices." for i in range(30))
+
+    async def scrape_urls(urls, cfg, worker_pool):
+        return [{"url": url, "raw_content": article + url, "image_urls": []} for url in urls], []
+
+    monkeypatch.setattr(browser, "scrape_urls", scrape_urls)
+    parent = GPTResearcher(query="Energy transition", verbose=False)
+    child = GPTResearcher(query="Solar power", runtime=parent.runtime, verbose=False)
+    for researcher in (parent, child):
+        researcher.cfg.near_duplicate_threshold = 0.8
+        researcher.scraper_manager.reset()
+
+    parent_pages = await parent.scraper_manager.browse_urls(["https://example.com/a", "https://mirror.example.org/a"])
+    child_pages = await child.scraper_manager.browse_urls(["https://mirror.example.org/a"])
+
+    assert [page["url"] for page in parent_pages] == ["https://example.com/a"]
+    assert [page["url"] for page in child_pages] == ["https://mirror.example.org/a"]
@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+import pytest
+
+from gpt_researcher.actions.retriever import search_all
+
+
+class SlowRetriever:
+    delay = 0.2
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    async def asearch(self, max_results=5):
+        await asyncio.sleep(self.delay)
+        return [{"href": f"https://example.com/{self.__class__.__name__}/{i}"} for i in range(max_results)]
+
+
+class OtherSlowRetriever(SlowRetriever):
+    pass
+
+
+class SharedResultRetriever:
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    def search(self, max_results=5):
+        return [{"href": "https://example.com/SlowRetriever/0"}, {"href": "https://example.com/shared"}]
+
+
+class HangingRetriever(SlowRetriever):
+    delay = 10
+
+
+class FailingRetriever(SlowRetriever):
+    async def asearch(self, max_results=5):
+        raise RuntimeError("quota exceeded")
+
+
+@pytest.mark.asyncio
+async def test_retrievers_search_concurrently():
+    start = time.monotonic()
+    results = await search_all([SlowRetriever, OtherSlowRetriever], "solar", max_results=2)
+
+    assert time.monotonic() - start < 0.35
+    assert len(results) == 4
+
+
+@pytest.mark.asyncio
+async def test_results_are_merged_in_order_without_duplicates():
+    results = await search_all([SlowRetriever, SharedResultRetriever], "solar", max_results=2)
+
+    assert [r["href"] for r in results] == [
+        "https://example.com/SlowRetriever/0",
+        "https://example.com/SlowRetriever/1",
+        "https://example.com/shared",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failing_and_slow_retrievers_are_skipped():
+    results = await search_all(
+        [HangingRetriever, FailingRetriever, SlowRetriever], "solar", timeout=0.5, max_results=1
+    )
+
+    assert [r["href"] for r in results] == ["https://example.com/SlowRetriever/0"]
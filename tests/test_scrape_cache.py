@@ -0,0 +1,63 @@
+import pytest
+
+from gpt_researcher.scraper import Scraper
+from gpt_researcher.scraper.cache import ScrapeCache, normalize_url
+from gpt_researcher.utils.workers import WorkerPool
+
+PAGE = b"<html><head><title>Cached</title></head><body><p>" + b"cached content " * 20 + b"</p></body></html>"
+
+
+class FakeScraper:
+    requests = []
+    parsed = 0
+
+    def __init__(self, link, session=None):
+        self.link = link
+
+    def fetch(self, headers=None):
+        FakeScraper.requests.append(headers)
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return 304, {}, b"", None
+        return 200, {"ETag": '"v1"'}, PAGE, "utf-8"
+
+    def parse(self, content, encoding):
+        FakeScraper.parsed += 1
+        return content.decode(encoding), [], "Cached"
+
+
+def make_scraper(cache):
+    scraper = Scraper(["https://example.com/page"], "test", "bs", WorkerPool(2), cache=cache)
+    scraper.get_scraper = lambda link: FakeScraper
+    return scraper
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://Example.com:443/a?b=2&a=1#top") == "https://example.com/a?a=1&b=2"
+    assert normalize_url("http://example.com") == "http://example.com/"
+
+
+@pytest.mark.asyncio
+async def test_fresh_pages_skip_the_network(tmp_path):
+    FakeScraper.requests, FakeScraper.parsed = [], 0
+    cache = ScrapeCache(str(tmp_path / "fresh"), ttl=3600)
+
+    first = await make_scraper(cache).run()
+    second = await make_scraper(cache).run()
+
+    assert first == second
+    assert second[0]["title"] == "Cached"
+    assert FakeScraper.requests == [None]
+    assert FakeScraper.parsed == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_pages_are_revalidated(tmp_path):
+    FakeScraper.requests, FakeScraper.parsed = [], 0
+    cache = ScrapeCache(str(tmp_path / "stale"), ttl=-1)
+
+    first = await make_scraper(cache).run()
+    second = await make_scraper(cache).run()
+
+    assert first == second
+    assert FakeScraper.requests == [None, {"If-None-Match": '"v1"'}]
+    assert FakeScraper.parsed == 1
@@ -0,0 +1,68 @@
+from gpt_researcher.actions.retriever import get_search_cache, with_search_cache
+
+
+class CountingRetriever:
+    searches = 0
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+        self.query_domains = query_domains
+
+    def search(self, max_results=7):
+        CountingRetriever.searches += 1
+        if self.query == "nothing":
+            return []
+        return [{"href": f"https://example.com/{i}", "body": self.query} for i in range(max_results)]
+
+
+def test_searches_are_cached_by_normalised_query(tmp_path):
+    CountingRetriever.searches = 0
+    retriever = with_search_cache(CountingRetriever, get_search_cache(str(tmp_path)))
+
+    first = retriever("Solar  Power", query_domains=["b.com", "a.com"]).search()
+    second = retriever(" solar power ", query_domains=["a.com", "b.com"]).search()
+
+    assert retriever.__name__ == "CountingRetriever"
+    assert first == second
+    assert len(first) == 7
+    assert CountingRetriever.searches == 1
+
+
+def test_cache_key_includes_domains_and_max_results(tmp_path):
+    CountingRetriever.searches = 0
+    retriever = with_search_cache(CountingRetriever, get_search_cache(str(tmp_path)))
+
+    retriever("wind").search(max_results=3)
+    retriever("wind").search(max_results=5)
+    retriever("wind", query_domains=["a.com"]).search(max_results=3)
+    retriever("wind").search(3)
+
+    assert CountingRetriever.searches == 3
+
+
+def test_empty_results_are_not_cached(tmp_path):
+    CountingRetriever.searches = 0
+    retriever = with_search_cache(CountingRetriever, get_search_cache(str(tmp_path)))
+
+    retriever("nothing").search()
+    retriever("nothing").search()
+
+    assert CountingRetriever.searches == 2
+
+
+class TopicRetriever(CountingRetriever):
+    def __init__(self, query, query_domains=None, topic="general"):
+        super().__init__(query, query_domains)
+        self.topic = topic
+        self.client = object()
+
+
+def test_cache_key_includes_the_retriever_configuration(tmp_path):
+    CountingRetriever.searches = 0
+    retriever = with_search_cache(TopicRetriever, get_search_cache(str(tmp_path)))
+
+    retriever("wind").search()
+    retriever("wind", topic="news").search()
+    retriever("wind", topic="news").search()
+
+    assert CountingRetriever.searches == 2
@@ -0,0 +1,76 @@
+import pytest
+
+from gpt_researcher.actions import add_references
+from gpt_researcher.actions.retriever import search_all
+from gpt_researcher.utils.urls import URLIndex, canonicalize_url
+
+ARTICLE = "https://example.com/news/solar-record"
+
+
+@pytest.mark.parametrize("url", [
+    "http://example.com/news/solar-record",
+    "https://www.example.com/news/solar-record/",
+    "https://EXAMPLE.com:443/news/solar-record#comments",
+    "https://example.com/news/solar-record?utm_source=twitter&utm_medium=social&fbclid=abc",
+    "https://m.example.com/news/solar-record",
+    "https://amp.example.com/news/solar-record",
+    "https://example.com/news/solar-record/amp/",
+    "https://example.com/news/solar-record?amp=1",
+    "https://example-com.cdn.ampproject.org/c/s/example.com/news/solar-record",
+])
+def test_spellings_of_a_page_share_its_canonical_url(url):
+    assert canonicalize_url(url) == ARTICLE
+
+
+def test_meaningful_differences_are_kept():
+    assert canonicalize_url("https://example.com/search?q=solar&page=2") == "https://example.com/search?page=2&q=solar"
+    assert canonicalize_url("https://example.com/search?q=solar") != canonicalize_url("https://example.com/search?q=wind")
+    assert canonicalize_url("https://example.com:8080/a") == "https://example.com:8080/a"
+    assert canonicalize_url("https://blog.example.com/a") != canonicalize_url("https://example.com/a")
+
+
+def test_index_records_pages_and_their_content():
+    index = URLIndex(min_content_length=10)
+    content = "Solar capacity doubled last year across Europe."
+
+    assert index.add("https://www.example.com/a/")
+    assert not index.add("http://example.com/a?utm_source=feed")
+    assert "https://example.com/a" in index
+
+    assert index.add_content("https://example.com/a", content)
+    assert index.add_content("https://www.example.com/a/", content)
+    assert not index.add_content("https://mirror.example.org/copy", "  SOLAR capacity doubled\nlast year across Europe. ")
+    # Short pages (e.g. consent walls) are never duplicates of each other
+    assert index.add_content("https://example.org/x", "Denied") and index.add_content("https://example.org/y", "Denied")
+
+
+def test_references_list_each_page_once():
+    report = add_references("Report", ["https://example.com/a", "https://www.example.com/a/", "https://example.com/b"])
+
+    assert report.count("example.com/a") == 2  # the link text and target of a single reference
+    assert "https://example.com/b" in report
+
+
+class Retriever:
+    results = []
+
+    def __init__(self, query, query_domains=None):
+        pass
+
+    def search(self, max_results=5):
+        return self.results
+
+
+class News(Retriever):
+    results = [{"href": "https://example.com/a?utm_source=news", "body": "a"}]
+
+
+class Web(Retriever):
+    results = [{"href": "https://www.example.com/a", "body": "a"}, {"href": "https://example.com/b", "body": "b"}]
+
+
+@pytest.mark.asyncio
+async def test_search_results_are_merged_by_canonical_url():
+    results = await search_all([News, Web], "solar")
+
+    assert [result["href"] for result in results] == ["https://example.com/a?utm_source=news", "https://example.com/b"]